@@ -0,0 +1,110 @@
+"""Benchmarks affix splitting on pathological long chunks.
+
+Each input is a single chunk without white spaces made of many affixes,
+such as nested brackets, runs of punctuation, base64 blobs or ASCII art.
+The tokenizer splitting affixes in place with the affix matchers is
+compared with the tokenizer searching copies of the remaining substring
+with the prefix and suffix regexes, whose time grows quadratically with
+the chunk length.
+
+Usage:
+    python benchmarks/bench_affixes.py --sizes 1000,10000,100000
+"""
+
+import argparse
+import base64
+import random
+import time
+
+from syfertext.punctuations import prefix_re
+from syfertext.punctuations import suffix_re
+from syfertext.tokenizer import Tokenizer
+from syfertext.vocab import Vocab
+
+
+def make_inputs(size: int, seed: int = 0) -> dict:
+    """Creates the adversarial chunks of about `size` characters."""
+
+    rng = random.Random(seed)
+
+    half = size // 2
+
+    blob = base64.b64encode(bytes(rng.getrandbits(8) for _ in range(size * 3 // 4))).decode()
+
+    return {
+        "nested brackets": "(" * half + "a" + ")" * half,
+        "quotes": "'" * half + "x" + "'" * half,
+        "punctuation run": "!?" * half,
+        "ellipsis run": "." * size,
+        "ascii art": "=-" * half,
+        "base64 blob": blob[:size],
+    }
+
+
+def timeit(func, *args, repeat: int = 3) -> float:
+    """Returns the best wall time of `repeat` calls to `func(*args)`."""
+
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="chunk sizes in characters")
+    parser.add_argument(
+        "--legacy-max-size",
+        type=int,
+        default=10000,
+        help="the regex tokenizer is skipped for larger chunks",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # The vectors are never loaded by the tokenizer, so no language
+    # model needs to be installed. The cache is disabled so that every
+    # call splits the chunk again.
+    vocab = Vocab("en_core_web_lg")
+
+    tokenizer = Tokenizer(vocab, cache_size=0)
+    legacy_tokenizer = Tokenizer(
+        vocab, prefix_search=prefix_re.search, suffix_search=suffix_re.search, cache_size=0
+    )
+
+    print(f"{'input':<16} {'size':>8} {'tokens':>8} {'regex':>10} {'matchers':>10} {'us/char':>8}")
+
+    for size in (int(size) for size in args.sizes.split(",")):
+
+        for name, chunk in make_inputs(size).items():
+
+            doc = tokenizer(chunk)
+
+            if size <= args.legacy_max_size:
+
+                legacy_doc = legacy_tokenizer(chunk)
+
+                assert [meta.orth for meta in doc.container] == [
+                    meta.orth for meta in legacy_doc.container
+                ]
+
+                legacy = f"{timeit(legacy_tokenizer, chunk, repeat=args.repeat):.4f}"
+
+            else:
+                legacy = "skipped"
+
+            new = timeit(tokenizer, chunk, repeat=args.repeat)
+
+            print(
+                f"{name:<16} {len(chunk):>8} {len(doc.container):>8} {legacy:>10} "
+                f"{new:>10.4f} {new / len(chunk) * 1e6:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
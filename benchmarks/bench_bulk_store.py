@@ -0,0 +1,92 @@
+"""Benchmarks the bulk methods `add_many()` and `lookup_many()` of the
+string stores against calling `add()` and `__getitem__()` in a loop.
+
+Two workloads are used:
+
+    - load: adding every string of a vocabulary once, as when a model
+      is loaded.
+    - stream: adding a stream of tokens drawn from that vocabulary with
+      a Zipf distribution, as when a corpus is tokenized, then looking
+      up the strings of their keys.
+
+Usage:
+    python benchmarks/bench_bulk_store.py --vocab-size 1000000 --size 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from syfertext.string_store import CompactStringStore
+from syfertext.string_store import StringStore
+
+from bench_string_store import make_words
+
+
+def timeit(func, *args) -> tuple:
+    """Returns the result and the wall time of a call to `func(*args)`."""
+
+    start = time.perf_counter()
+    result = func(*args)
+
+    return result, time.perf_counter() - start
+
+
+def add_loop(store, strings: list) -> list:
+    return [store.add(string) for string in strings]
+
+
+def lookup_loop(store, keys: list) -> list:
+    return [store[key] for key in keys]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--vocab-size", type=int, default=1000000, help="number of distinct strings"
+    )
+    parser.add_argument("--size", type=int, default=10000000, help="number of tokens in the stream")
+    args = parser.parse_args()
+
+    vocabulary = make_words(args.vocab_size)
+
+    rng = np.random.RandomState(0)
+    stream = [vocabulary[i] for i in (rng.zipf(1.2, args.size) - 1) % len(vocabulary)]
+
+    print(f"vocabulary: {len(vocabulary)} strings, stream: {len(stream)} tokens")
+    print(f"{'store':<20} {'workload':<14} {'loop s':>8} {'bulk s':>8} {'speedup':>8}")
+
+    for store_class in [StringStore, CompactStringStore]:
+
+        name = store_class.__name__
+
+        # Load the vocabulary
+        _, loop = timeit(add_loop, store_class(), vocabulary)
+        _, bulk = timeit(store_class().add_many, vocabulary)
+
+        print(f"{name:<20} {'load':<14} {loop:>8.2f} {bulk:>8.2f} {loop / bulk:>7.1f}x")
+
+        # Add the stream, starting from an empty store
+        loop_store = store_class()
+        bulk_store = store_class()
+
+        loop_keys, loop = timeit(add_loop, loop_store, stream)
+        bulk_keys, bulk = timeit(bulk_store.add_many, stream)
+
+        assert bulk_keys.tolist() == loop_keys
+
+        print(f"{name:<20} {'stream add':<14} {loop:>8.2f} {bulk:>8.2f} {loop / bulk:>7.1f}x")
+
+        # Look up the strings of the stream
+        _, loop = timeit(lookup_loop, loop_store, loop_keys)
+        _, bulk = timeit(bulk_store.lookup_many, bulk_keys)
+
+        print(f"{name:<20} {'stream lookup':<14} {loop:>8.2f} {bulk:>8.2f} {loop / bulk:>7.1f}x")
+
+        del loop_store, bulk_store, loop_keys, bulk_keys
+
+
+if __name__ == "__main__":
+    main()
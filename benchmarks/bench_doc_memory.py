@@ -0,0 +1,69 @@
+"""Benchmarks the memory used per token by the container of a Doc.
+
+The columnar `TokenContainer` is compared with the list of `TokenMeta`
+objects that Doc objects used to hold.
+
+Usage:
+    python benchmarks/bench_doc_memory.py --size 1000000
+"""
+
+import argparse
+import tracemalloc
+
+from syfertext.tokenizer import Tokenizer
+from syfertext.tokenizer import TokenMeta
+from syfertext.vocab import Vocab
+
+from bench_segmentation import make_text
+
+
+def allocated(func, *args) -> int:
+    """Returns the number of bytes still allocated by `func(*args)` when it
+    returns, i.e., the size of the objects it creates and returns.
+    """
+
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    result = func(*args)
+    after = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    del result
+
+    return after - before
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=1000000, help="text size in characters")
+    args = parser.parse_args()
+
+    text = make_text(args.size)
+
+    # The vectors are never loaded by the tokenizer, so no language
+    # model needs to be installed
+    tokenizer = Tokenizer(Vocab("en_core_web_lg"))
+
+    # Tokenize once so that the strings are already in the store
+    doc = tokenizer(text)
+    n_tokens = len(doc)
+
+    columnar = allocated(tokenizer, text)
+
+    orths = doc.container.orths.tolist()
+    spaces = doc.container.spaces.tolist()
+
+    legacy = allocated(
+        lambda: [TokenMeta(hash_key=orth, space_after=space) for orth, space in zip(orths, spaces)]
+    )
+
+    print(f"tokens: {n_tokens}")
+    print(f"list of TokenMeta objects: {legacy / n_tokens:7.1f} bytes per token")
+    print(f"TokenContainer:            {columnar / n_tokens:7.1f} bytes per token")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmarks `Doc.get_token_vectors()` and `Doc.get_vector()`, which gather
+the vectors of all the tokens at once with `Vectors.get_batch()`, against
+looking up the vector of each token as was done before.
+
+The Doc is made of the tokens of a synthetic corpus (10000 tokens by
+default). The fake `syfertext_bench` model package in `benchmarks/fake_model`
+is used.
+
+Usage:
+    python benchmarks/bench_doc_vectors.py --tokens 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Make the fake language model package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_model"))
+
+import torch
+
+from syfertext.tokenizer import Tokenizer
+from syfertext.vocab import Vocab
+
+from corpus import make_corpus
+
+MODEL_NAME = "bench"
+
+
+def loop_token_vectors(doc) -> torch.Tensor:
+    """Stacks the vectors of the tokens of `doc` looked up one by one."""
+
+    return torch.stack([token.vector for token in doc], dim=0)
+
+
+def loop_vector(doc) -> torch.Tensor:
+    """Averages the vectors of the tokens of `doc` looked up one by one."""
+
+    vectors = [token.vector for token in doc if token.has_vector]
+
+    if not vectors:
+        return doc.vocab.vectors.default_vector
+
+    return sum(vectors) / len(vectors)
+
+
+def best_time(func, repeat: int) -> float:
+    """Returns the best time of `repeat` calls of `func` in seconds."""
+
+    seconds = float("inf")
+
+    for _ in range(repeat):
+
+        start = time.perf_counter()
+        func()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    return seconds
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tokens", type=int, default=10000, help="minimum number of tokens")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs of each function")
+    args = parser.parse_args()
+
+    vocab = Vocab(MODEL_NAME)
+
+    # Load the vectors before any measure is made
+    vocab.vectors.has_vector("the")
+
+    tokenizer = Tokenizer(vocab)
+
+    # Grow the corpus until the Doc is long enough
+    size = 4 * args.tokens
+    doc = tokenizer(make_corpus(size))
+
+    while len(doc) < args.tokens:
+        size *= 2
+        doc = tokenizer(make_corpus(size))
+
+    # Both ways give the same vectors, up to the rounding errors of the
+    # sums, which are smaller in the batch version
+    assert torch.equal(doc.get_token_vectors(), loop_token_vectors(doc))
+    assert torch.allclose(doc.get_vector(), loop_vector(doc), atol=1e-4)
+
+    print(f"Doc of {len(doc)} tokens")
+
+    for name, loop, batch in [
+        ("get_token_vectors", loop_token_vectors, doc.get_token_vectors),
+        ("get_vector", loop_vector, doc.get_vector),
+    ]:
+
+        loop_time = best_time(lambda: loop(doc), args.repeat)
+        batch_time = best_time(batch, args.repeat)
+
+        print(
+            f"{name:<18} per-token loop {loop_time * 1e3:>8.1f} ms"
+            f"   batch {batch_time * 1e3:>8.1f} ms   speedup {loop_time / batch_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
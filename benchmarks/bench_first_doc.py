@@ -0,0 +1,87 @@
+"""Benchmarks the latency of the first Doc whose token vectors are read after
+a restart, when the vectors are loaded lazily by that Doc, against loading
+them in a background thread with `Vectors.load_async()` as soon as the
+vocabulary is created, as `syfertext.load(..., background=True)` does.
+
+Each way is measured in a fresh process. Between the creation of the
+vocabulary and the first Doc, the process idles for `--idle` seconds, like
+a server that starts before its first request arrives. The load metrics
+of the vectors, see `Vectors.load_metrics()`, are reported too. The fake
+`syfertext_bench` model package in `benchmarks/fake_model` is used.
+
+Usage:
+    python benchmarks/bench_first_doc.py --rows 200000 --idle 1.0
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+FAKE_MODEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_model")
+
+# Make the fake language model package importable
+sys.path.insert(0, FAKE_MODEL)
+
+from syfertext.tokenizer import Tokenizer
+from syfertext.vocab import Vocab
+
+MODEL_NAME = "bench"
+
+TEXT = "The quick brown fox jumps over the lazy dog."
+
+
+def first_doc(background: bool, idle: float) -> tuple:
+    """Creates a vocabulary, idles for `idle` seconds and reads the token
+    vectors of a first Doc.
+
+    Returns:
+        The time taken by the first Doc in seconds and the load metrics.
+    """
+
+    vocab = Vocab(MODEL_NAME)
+    tokenizer = Tokenizer(vocab)
+
+    if background:
+        vocab.vectors.load_async()
+
+    time.sleep(idle)
+
+    start = time.perf_counter()
+
+    tokenizer(TEXT).get_token_vectors()
+
+    elapsed = time.perf_counter() - start
+
+    return elapsed, vocab.vectors.load_metrics()
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=200000, help="number of filler vectors")
+    parser.add_argument("--idle", type=float, default=1.0, help="seconds before the first Doc")
+    args = parser.parse_args()
+
+    # Read by the fake model in the child processes
+    os.environ["SYFERTEXT_BENCH_ROWS"] = str(args.rows)
+
+    context = multiprocessing.get_context("spawn")
+
+    print(f"{args.rows} filler vectors, first Doc {args.idle:.1f} s after the vocabulary")
+    print(f"{'loading':<12} {'first Doc ms':>13} {'load s':>8} {'waited s':>9}")
+
+    for name, background in [("lazy", False), ("background", True)]:
+
+        with context.Pool(1, initializer=sys.path.insert, initargs=(0, FAKE_MODEL)) as pool:
+            elapsed, metrics = pool.apply(first_doc, (background, args.idle))
+
+        print(
+            f"{name:<12} {elapsed * 1e3:>13.1f} {metrics['load_seconds']:>8.2f}"
+            f" {metrics['wait_seconds']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
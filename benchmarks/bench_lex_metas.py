@@ -0,0 +1,82 @@
+"""Benchmarks `Vocab.create_lex_metas()`, which computes the lexical
+attributes of many new strings at once, against calling
+`Vocab.get_lex_meta()` for each of them.
+
+The strings are random words whose lengths follow those of English words,
+so none of them is in the lex store yet. The fake `syfertext_bench` model
+package in `benchmarks/fake_model` is used.
+
+Usage:
+    python benchmarks/bench_lex_metas.py --size 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Make the fake language model package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_model"))
+
+from syfertext.vocab import Vocab
+
+from bench_string_store import make_words
+
+MODEL_NAME = "bench"
+
+ATTRIBUTES = ["orth", "flags", "lower", "shape", "prefix", "suffix", "length", "lang", "id"]
+
+
+def new_vocab() -> Vocab:
+    """Returns a new Vocab object whose vectors are loaded."""
+
+    vocab = Vocab(MODEL_NAME)
+
+    # Load the vectors before any measure is made
+    vocab.vectors.has_vector("the")
+
+    return vocab
+
+
+def attributes(lex_meta) -> tuple:
+    """Returns the attributes of a LexemeMeta object."""
+
+    return tuple(getattr(lex_meta, name) for name in ATTRIBUTES)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=100000, help="number of new strings")
+    args = parser.parse_args()
+
+    words = make_words(args.size)
+
+    loop_vocab = new_vocab()
+    bulk_vocab = new_vocab()
+
+    start = time.perf_counter()
+
+    loop_lex_metas = [
+        loop_vocab.get_lex_meta(orth) for orth in loop_vocab.store.add_many(words).tolist()
+    ]
+
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    bulk_lex_metas = bulk_vocab.create_lex_metas(words)
+
+    bulk = time.perf_counter() - start
+
+    # Both ways give the same attributes
+    assert list(map(attributes, bulk_lex_metas)) == list(map(attributes, loop_lex_metas))
+
+    print(f"{len(words)} new strings")
+    print(f"{'get_lex_meta loop':<20} {loop:>8.2f} s {len(words) / loop:>12.0f} strings/s")
+    print(f"{'create_lex_metas':<20} {bulk:>8.2f} s {len(words) / bulk:>12.0f} strings/s")
+    print(f"speedup {loop / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmarks `Vectors.most_similar()` with a `VectorIndex` against the exact
+search, which compares each query to all the rows of the table.
+
+The vectors of the fake `syfertext_bench` model are random and uniform, so
+every row is about as similar to a query as any other and no index could
+find the nearest ones quickly. They are replaced by vectors drawn around
+random centers, like the clusters of words of real vectors, or by the
+vectors of a real model given with `--model`. The queries are rows of the
+table with some noise added.
+
+For the exact search and for each `n_probe`, the following are reported:
+
+    - the mean time of a query, searched one at a time,
+    - the recall@k: the share of the `k` exact nearest rows that are found.
+
+Usage:
+    python benchmarks/bench_most_similar.py --rows 200000 --n-probe 1 4 16 64
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Make the fake language model package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_model"))
+
+import numpy as np
+
+from syfertext.vector_index import VectorIndex
+from syfertext.vectors import Vectors
+
+
+def clustered_vectors(n_rows: int, dim: int, n_clusters: int, rng) -> np.ndarray:
+    """Returns `n_rows` float32 vectors drawn around `n_clusters` random centers."""
+
+    centers = rng.randn(n_clusters, dim).astype(np.float32)
+    clusters = rng.randint(n_clusters, size=n_rows)
+
+    return centers[clusters] + rng.randn(n_rows, dim).astype(np.float32)
+
+
+def search_time(vectors: Vectors, queries: np.ndarray, k: int, **kwargs) -> tuple:
+    """Searches the queries one at a time.
+
+    Returns:
+        The rows found, of shape (n_queries, k), and the mean time of a query
+        in seconds.
+    """
+
+    rows = []
+
+    start = time.perf_counter()
+
+    for query in queries:
+        rows.append(vectors.most_similar(query, k=k, **kwargs)[1][0])
+
+    return np.stack(rows), (time.perf_counter() - start) / len(queries)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--model", default="bench", help="name of the language model")
+    parser.add_argument("--rows", type=int, default=200000, help="number of clustered vectors")
+    parser.add_argument("--queries", type=int, default=200, help="number of queries")
+    parser.add_argument("-k", type=int, default=10, help="number of rows found per query")
+    parser.add_argument("--n-lists", type=int, help="number of lists of the index")
+    parser.add_argument(
+        "--n-probe", type=int, nargs="+", default=[1, 4, 16, 64], help="numbers of lists searched"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+
+    vectors = Vectors(args.model)
+    vectors.has_vector("the")
+
+    if args.model == "bench":
+
+        # Keep at least the rows the keys of the model are mapped to
+        n_rows = max(args.rows, len(vectors.data))
+
+        vectors.data = clustered_vectors(n_rows, vectors.data.shape[1], n_rows // 100, rng)
+
+    n_rows, dim = vectors.data.shape
+
+    queries = vectors.vectors_at(rng.randint(n_rows, size=args.queries)).numpy()
+    queries += 0.5 * queries.std() * rng.randn(*queries.shape).astype(np.float32)
+
+    start = time.perf_counter()
+    index = VectorIndex.build(vectors, n_lists=args.n_lists)
+    build_time = time.perf_counter() - start
+
+    # Search the index memory-mapped back from disk, as it would be used
+    with tempfile.TemporaryDirectory() as path:
+
+        index.to_disk(path)
+        index = VectorIndex.from_disk(path)
+
+        print(f"{n_rows} vectors of dimension {dim}, {args.queries} queries, k = {args.k}")
+        print(f"index of {index.n_lists} lists built in {build_time:.1f} s")
+        print(f"{'search':<14} {'ms/query':>9} {'speedup':>8} {'recall':>7}")
+
+        exact, exact_time = search_time(vectors, queries, args.k)
+
+        print(f"{'exact':<14} {exact_time * 1e3:>9.2f} {1:>8.1f} {1:>7.3f}")
+
+        for n_probe in args.n_probe:
+
+            found, found_time = search_time(vectors, queries, args.k, index=index, n_probe=n_probe)
+
+            recall = np.mean([len(np.intersect1d(a, b)) / args.k for a, b in zip(exact, found)])
+
+            print(
+                f"{f'n_probe {n_probe}':<14} {found_time * 1e3:>9.2f}"
+                f" {exact_time / found_time:>8.1f} {recall:>7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmarks the whitespace segmentation step of `Tokenizer.__call__`.
+
+The regex-driven segmentation is compared with the per-character loop it
+replaced, and the throughput of the full tokenizer is reported.
+
+Usage:
+    python benchmarks/bench_segmentation.py --size 1000000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from syfertext.string_store import StringStore
+from syfertext.tokenizer import Tokenizer
+from syfertext.vocab import Vocab
+
+
+WORDS = ["the", "it's", "U.S.", "(e.g.", "apple-pie", "hello,", "world!", "42", "don't", "..."]
+SPACES = [" "] * 20 + ["  ", "\n", "\t", " \n "]
+
+
+def make_text(size: int, seed: int = 0) -> str:
+    """Creates a deterministic text of about `size` characters."""
+
+    rng = random.Random(seed)
+
+    pieces = []
+    length = 0
+
+    while length < size:
+        piece = rng.choice(WORDS) + rng.choice(SPACES)
+        pieces.append(piece)
+        length += len(piece)
+
+    return "".join(pieces)
+
+
+def legacy_segment(text: str, store: StringStore) -> list:
+    """The per-character segmentation loop previously used by `Tokenizer.__call__`,
+    including the lookup of every segment in the string store that it used to do.
+    Returns the list of `(substring, is_space, space_after)` tuples it creates.
+    """
+
+    segments = []
+    text_size = len(text)
+    pos = 0
+    is_space = text[0].isspace()
+
+    for i, char in enumerate(text):
+
+        is_current_space = char.isspace()
+
+        if is_current_space != is_space:
+            store[str(text[pos:i])]
+            segments.append((text[pos:i], is_space, is_current_space))
+            pos = i + 1 if is_current_space else i
+
+            if pos < text_size:
+                is_space = text[pos].isspace()
+
+        if i == text_size - 1 and pos <= i:
+            store[str(text[pos:])]
+            segments.append((text[pos:], is_space, is_current_space))
+
+    return segments
+
+
+def regex_segment(text: str, store: StringStore) -> list:
+    """The regex-driven segmentation now used by `Tokenizer.__call__`, which
+    only looks up white space tokens in the string store.
+    Returns the same list as `legacy_segment()`.
+    """
+
+    segments = []
+    text_size = len(text)
+    pos = 0
+
+    for match in re.finditer(r"\S+", text):
+
+        start, end = match.span()
+
+        if start > pos:
+            store[text[pos:start]]
+            segments.append((text[pos:start], True, False))
+
+        space_after = end < text_size
+        segments.append((match.group(), False, space_after))
+        pos = end + 1 if space_after else end
+
+    if pos < text_size:
+        store[text[pos:]]
+        segments.append((text[pos:], True, True))
+
+    return segments
+
+
+def timeit(func, *args, repeat: int = 3) -> float:
+    """Returns the best wall time of `repeat` calls to `func(*args)`."""
+
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=1000000, help="text size in characters")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = make_text(args.size)
+
+    store = StringStore()
+
+    assert legacy_segment(text, store) == regex_segment(text, store)
+
+    legacy = timeit(legacy_segment, text, store, repeat=args.repeat)
+    regex = timeit(regex_segment, text, store, repeat=args.repeat)
+
+    print(f"text size: {len(text)} characters")
+    print(f"per-character loop:   {legacy:.3f} s")
+    print(f"regex segmentation:   {regex:.3f} s  ({legacy / regex:.1f}x faster)")
+
+    # The vectors are never loaded by the tokenizer, so no language
+    # model needs to be installed
+    tokenizer = Tokenizer(Vocab("en_core_web_lg"))
+
+    full = timeit(tokenizer, text, repeat=args.repeat)
+
+    print(f"Tokenizer.__call__:   {full:.3f} s  ({len(text) / full / 1e6:.2f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Benchmarks the memory used by `StringStore` and `CompactStringStore`
+holding a vocabulary the size of that of the `en_core_web_lg` model, the
+time they take to add and look up strings, and the time they take to be
+loaded from disk.
+
+The vocabulary is made of random words whose lengths follow those of
+English words.
+
+Usage:
+    python benchmarks/bench_string_store.py --size 1000000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from syfertext.string_store import CompactStringStore
+from syfertext.string_store import StringStore
+from syfertext.utils import hash_string
+
+
+LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'-."
+
+# The relative frequency of word lengths from 1 to 15
+LENGTHS = [2, 6, 9, 10, 11, 11, 10, 9, 8, 7, 5, 4, 3, 2, 1]
+
+
+def make_words(size: int, seed: int = 0) -> list:
+    """Creates a deterministic list of `size` distinct words."""
+
+    rng = random.Random(seed)
+
+    words = set()
+
+    while len(words) < size:
+
+        length = rng.choices(range(1, len(LENGTHS) + 1), weights=LENGTHS)[0]
+        words.add("".join(rng.choice(LETTERS) for _ in range(length)))
+
+    return sorted(words)
+
+
+def build(store_class, words: list) -> object:
+    """Returns a new store of class `store_class` holding `words`. The
+    strings are copied as they are when they come from a tokenized text.
+    """
+
+    store = store_class()
+
+    for word in words:
+        store.add(word.encode().decode())
+
+    return store
+
+
+def allocated(func, *args) -> int:
+    """Returns the number of bytes still allocated by `func(*args)` when it
+    returns, i.e., the size of the objects it creates and returns.
+    """
+
+    tracemalloc.start()
+
+    result = func(*args)
+    size = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    del result
+
+    return size
+
+
+def timeit(func, *args) -> float:
+    """Returns the wall time of a call to `func(*args)`."""
+
+    start = time.perf_counter()
+    func(*args)
+
+    return time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=1000000, help="number of strings")
+    args = parser.parse_args()
+
+    words = make_words(args.size)
+    keys = [hash_string(word) for word in words]
+
+    print(f"strings: {len(words)}, UTF-8 size: {sum(len(word.encode()) for word in words)} bytes")
+    print(
+        f"{'store':<20} {'MB':>8} {'bytes/str':>10} {'add s':>8} {'str->key s':>11} {'key->str s':>11}"
+    )
+
+    results = {}
+
+    for store_class in [StringStore, CompactStringStore]:
+
+        size = allocated(build, store_class, words)
+
+        seconds = timeit(build, store_class, words)
+
+        store = build(store_class, words)
+
+        lookup = timeit(lambda: [store[word] for word in words])
+        reverse = timeit(lambda: [store[key] for key in keys])
+
+        results[store_class.__name__] = size
+
+        print(
+            f"{store_class.__name__:<20} {size / 1e6:>8.1f} {size / len(words):>10.1f} "
+            f"{seconds:>8.2f} {lookup:>11.2f} {reverse:>11.2f}"
+        )
+
+        del store
+
+    ratio = results["StringStore"] / results["CompactStringStore"]
+
+    print(f"CompactStringStore uses {ratio:.1f}x less memory")
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        path = os.path.join(directory, "strings")
+
+        build(CompactStringStore, words).to_disk(path)
+
+        print(f"file size: {os.path.getsize(path) / 1e6:.1f} MB")
+
+        loaders = {
+            "StringStore.from_disk": lambda: StringStore.from_disk(path),
+            "CompactStringStore.from_disk(mmap=False)": lambda: CompactStringStore.from_disk(
+                path, mmap=False
+            ),
+            "CompactStringStore.from_disk(mmap=True)": lambda: CompactStringStore.from_disk(
+                path, mmap=True
+            ),
+        }
+
+        for name, loader in loaders.items():
+            print(f"{name:<42} {timeit(loader):>8.4f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Runs the benchmark suite on reproducible synthetic corpora and writes
+the results as JSON.
+
+The following steps are benchmarked on each corpus size:
+
+    - tokenizer: `Tokenizer.__call__` on the whole corpus.
+    - lex_meta: `Vocab._create_lex_meta` on every distinct token string.
+    - doc_iteration: iterating over the tokens of the Doc of the corpus.
+    - token_vectors: iterating over the tokens of the Doc of the corpus and
+      getting `has_vector` and `vector` of each token.
+
+For each step, the throughput, the peak RSS of the process and the memory
+allocated (traced by `tracemalloc`) are reported. Every step runs in a
+fresh process so that peak RSS values are not mixed up between steps.
+
+The fake `syfertext_bench` model package in `benchmarks/fake_model` is
+used, so no language model needs to be installed.
+
+Usage:
+    python benchmarks/bench_suite.py --sizes 1KB,1MB,100MB --output results.json
+    python benchmarks/bench_suite.py --sizes 1KB,1MB --compare results.json
+"""
+
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+
+# Make the fake language model package importable, also in child processes
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_model"))
+
+import numpy as np
+
+from syfertext.tokenizer import Tokenizer
+from syfertext.vocab import Vocab
+
+from corpus import SIZES
+from corpus import make_corpus
+
+
+MODEL_NAME = "bench"
+
+STEPS = ["tokenizer", "lex_meta", "doc_iteration", "token_vectors"]
+
+
+def peak_rss_mb() -> float:
+    """Returns the peak resident set size of the process in MB."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # `ru_maxrss` is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / 1e6
+
+    return peak / 1e3
+
+
+def setup_step(step: str, text: str) -> tuple:
+    """Prepares a step and returns the function to benchmark and the
+    number of items it processes.
+
+    Args:
+        step (str): The name of the step.
+        text (str): The corpus.
+
+    Returns:
+        A `(func, n_items)` tuple. `func` takes no argument.
+    """
+
+    vocab = Vocab(MODEL_NAME)
+
+    # Load the vectors before any measure is made
+    vocab.vectors.has_vector("the")
+
+    tokenizer = Tokenizer(vocab)
+
+    if step == "tokenizer":
+        return (lambda: tokenizer(text)), len(tokenizer(text))
+
+    doc = tokenizer(text)
+
+    if step == "lex_meta":
+
+        strings = list({vocab.store[orth] for orth in doc.container.orths.tolist()})
+
+        def create_lex_metas():
+
+            # Start from an empty lexeme table every time
+            vocab.lex_store.clear()
+
+            for string in strings:
+                vocab._create_lex_meta(string)
+
+        return create_lex_metas, len(strings)
+
+    if step == "doc_iteration":
+
+        def iterate():
+            for token in doc:
+                pass
+
+        return iterate, len(doc)
+
+    if step == "token_vectors":
+
+        def get_vectors():
+            for token in doc:
+                token.has_vector
+                token.vector
+
+        return get_vectors, len(doc)
+
+    raise ValueError(f"Unknown step {step}")
+
+
+def run_step(step: str, size: int, seed: int, repeat: int, trace: bool) -> dict:
+    """Benchmarks one step on the corpus of `size` characters. It is run
+    in a child process.
+
+    Returns:
+        The dictionary of results.
+    """
+
+    text = make_corpus(size, seed)
+
+    func, n_items = setup_step(step, text)
+
+    setup_rss = peak_rss_mb()
+
+    # Time the step
+    seconds = float("inf")
+
+    for _ in range(repeat):
+
+        start = time.perf_counter()
+        func()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    rss = peak_rss_mb()
+
+    # Measure the allocations in a separate run since tracing slows it down
+    traced_peak = None
+
+    if trace:
+
+        tracemalloc.start()
+        func()
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "step": step,
+        "chars": size,
+        "items": n_items,
+        "seconds": seconds,
+        "items_per_sec": n_items / seconds if seconds else None,
+        "setup_peak_rss_mb": setup_rss,
+        "peak_rss_mb": rss,
+        "traced_peak_bytes": traced_peak,
+    }
+
+
+def compare(results: list, path: str) -> None:
+    """Prints the throughput of `results` relative to the results saved in `path`."""
+
+    with open(path) as f:
+        baseline = json.load(f)["results"]
+
+    baseline = {(result["step"], result["size"]): result for result in baseline}
+
+    print(f"\ncompared with {path}:")
+
+    for result in results:
+
+        old = baseline.get((result["step"], result["size"]))
+
+        if old is None:
+            continue
+
+        speedup = result["items_per_sec"] / old["items_per_sec"]
+        rss = result["peak_rss_mb"] - old["peak_rss_mb"]
+
+        print(f"{result['step']:<14} {result['size']:>6} {speedup:>6.2f}x  {rss:>+9.1f} MB RSS")
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--sizes", default="1KB,1MB,100MB", help="corpus sizes, among " + ",".join(SIZES)
+    )
+    parser.add_argument("--steps", default=",".join(STEPS), help="steps to benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--trace-max-size",
+        type=int,
+        default=SIZES["1MB"],
+        help="allocations are not traced for larger corpora since tracing is slow",
+    )
+    parser.add_argument("--output", help="path of the JSON file to write the results to")
+    parser.add_argument("--compare", help="path of a JSON file of previous results")
+    args = parser.parse_args()
+
+    results = []
+
+    print(
+        f"{'step':<14} {'size':>6} {'items':>10} {'seconds':>9} {'items/s':>11} "
+        f"{'RSS MB':>8} {'traced MB':>10}"
+    )
+
+    for label in args.sizes.split(","):
+
+        size = SIZES[label]
+
+        for step in args.steps.split(","):
+
+            # Run every step in a fresh process to isolate its peak RSS
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+
+                result = executor.submit(
+                    run_step, step, size, args.seed, args.repeat, size <= args.trace_max_size
+                ).result()
+
+            result["size"] = label
+            results.append(result)
+
+            traced = result["traced_peak_bytes"]
+            traced = "-" if traced is None else f"{traced / 1e6:.2f}"
+
+            print(
+                f"{step:<14} {label:>6} {result['items']:>10} {result['seconds']:>9.4f} "
+                f"{result['items_per_sec']:>11.0f} {result['peak_rss_mb']:>8.1f} {traced:>10}"
+            )
+
+    if args.output:
+
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": results,
+        }
+
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Reports the size and the accuracy of the vectors of a language model
+saved with reduced precision by `Vectors.to_disk()`, against float32.
+
+For each dtype, the following are reported:
+
+    - the size of `vectors.npy` (and `scales.npy` for int8),
+    - the cosine similarity between each float32 vector and its reduced
+      precision version, averaged over the rows, and its minimum,
+    - the largest error on the cosine similarity of random pairs of rows,
+    - the time `Vectors.vectors_at()` takes to gather random rows.
+
+The fake `syfertext_bench` model package in `benchmarks/fake_model` is used
+by default. Its vectors are random, so the results on a real model, given
+with `--model`, are more meaningful.
+
+Usage:
+    python benchmarks/bench_vector_precision.py --model bench --pairs 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Make the fake language model package importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_model"))
+
+import numpy as np
+import torch
+
+from syfertext.vectors import SCALES_FILE
+from syfertext.vectors import VECTORS_FILE
+from syfertext.vectors import VECTOR_DTYPES
+from syfertext.vectors import Vectors
+
+
+def normalize(vectors: torch.Tensor) -> torch.Tensor:
+    """Returns the vectors divided by their L2 norms. Zero vectors stay zeros."""
+
+    norms = vectors.norm(dim=1, keepdim=True)
+
+    return vectors / torch.where(norms > 0, norms, torch.ones_like(norms))
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--model", default="bench", help="name of the language model")
+    parser.add_argument("--pairs", type=int, default=100000, help="number of random pairs")
+    parser.add_argument("--gather", type=int, default=10000, help="number of rows to gather")
+    args = parser.parse_args()
+
+    vectors = Vectors(args.model)
+    vectors.has_vector("the")
+
+    n_rows = len(vectors.data)
+
+    rng = np.random.RandomState(0)
+
+    pairs = rng.randint(n_rows, size=(2, args.pairs))
+    gather = rng.randint(n_rows, size=args.gather)
+
+    print(f"{n_rows} vectors of dimension {vectors.data.shape[1]}")
+    print(
+        f"{'dtype':<8} {'MiB':>8} {'ratio':>6} {'mean cos':>10} {'min cos':>10}"
+        f" {'pair error':>11} {'gather ms':>10}"
+    )
+
+    reference = None
+
+    with tempfile.TemporaryDirectory() as root:
+
+        for dtype in VECTOR_DTYPES:
+
+            path = os.path.join(root, dtype)
+            vectors.to_disk(path, dtype=dtype)
+
+            size = sum(
+                os.path.getsize(os.path.join(path, name))
+                for name in [VECTORS_FILE, SCALES_FILE]
+                if os.path.exists(os.path.join(path, name))
+            )
+
+            reduced = Vectors(args.model).from_disk(path, mmap=False)
+
+            table = normalize(reduced.vectors_at(np.arange(n_rows)))
+
+            if reference is None:
+                reference, reference_size = table, size
+
+            # The cosine similarity of each row with its float32 version
+            cosines = (table * reference).sum(dim=1)
+
+            # The error on the cosine similarity of pairs of rows
+            pair_cosines = (table[pairs[0]] * table[pairs[1]]).sum(dim=1)
+            reference_cosines = (reference[pairs[0]] * reference[pairs[1]]).sum(dim=1)
+            pair_error = (pair_cosines - reference_cosines).abs().max().item()
+
+            start = time.perf_counter()
+            reduced.vectors_at(gather)
+            gather_time = time.perf_counter() - start
+
+            print(
+                f"{dtype:<8} {size / 2 ** 20:>8.1f} {reference_size / size:>6.2f}"
+                f" {cosines.mean().item():>10.6f} {cosines.min().item():>10.6f}"
+                f" {pair_error:>11.2e} {gather_time * 1e3:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmarks loading the word vectors with the `vectors` and `key2row`
+loaders of a language model, which read the whole table in memory, against
+memory-mapping a table converted with `Vectors.to_disk()`.
+
+Each way is measured in fresh processes: the time until the first vector is
+returned, and the growth of the resident memory of each process. Several
+processes are run at the same time to show that memory-mapped vectors are
+shared through the page cache. The fake `syfertext_bench` model package in
+`benchmarks/fake_model` is used.
+
+Usage:
+    python benchmarks/bench_vectors_load.py --rows 200000 --processes 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+FAKE_MODEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_model")
+
+# Make the fake language model package importable
+sys.path.insert(0, FAKE_MODEL)
+
+from syfertext.vectors import Vectors
+
+MODEL_NAME = "bench"
+
+
+def rss() -> int:
+    """Returns the resident memory of the current process in bytes."""
+
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+
+    return 0
+
+
+def first_lookup(vectors_path: str) -> tuple:
+    """Loads the vectors of the fake model in a new Vectors object and looks
+    up one vector. The vectors are memory-mapped from `vectors_path` unless
+    it is empty.
+
+    Returns:
+        The time taken in seconds and the growth of the resident memory in bytes.
+    """
+
+    os.environ["SYFERTEXT_BENCH_VECTORS"] = vectors_path
+
+    vectors = Vectors(MODEL_NAME)
+
+    before = rss()
+    start = time.perf_counter()
+
+    vectors["the"]
+
+    elapsed = time.perf_counter() - start
+
+    return elapsed, rss() - before
+
+
+def measure(vectors_path: str, processes: int) -> tuple:
+    """Runs `first_lookup()` in `processes` new processes at the same time.
+
+    Returns:
+        The mean time and the mean memory growth of a process.
+    """
+
+    context = multiprocessing.get_context("spawn")
+
+    with context.Pool(processes, initializer=sys.path.insert, initargs=(0, FAKE_MODEL)) as pool:
+        results = pool.map(first_lookup, [vectors_path] * processes)
+
+    times, memories = zip(*results)
+
+    return sum(times) / processes, sum(memories) / processes
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=200000, help="number of filler vectors")
+    parser.add_argument("--processes", type=int, default=4, help="number of processes")
+    args = parser.parse_args()
+
+    # Read by the fake model, here and in the child processes
+    os.environ["SYFERTEXT_BENCH_ROWS"] = str(args.rows)
+
+    with tempfile.TemporaryDirectory() as path:
+
+        start = time.perf_counter()
+        Vectors(MODEL_NAME).to_disk(path)
+        convert = time.perf_counter() - start
+
+        size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+        print(f"{args.rows} filler vectors, {size / 2 ** 20:.0f} MiB on disk")
+        print(f"converted in {convert:.2f} s")
+        print(f"{args.processes} processes, mean of a process until the first vector is returned:")
+
+        for name, vectors_path in [("loaders", ""), ("memory-mapped", path)]:
+
+            elapsed, memory = measure(vectors_path, args.processes)
+
+            print(f"{name:<15} {elapsed:>8.3f} s {memory / 2 ** 20:>10.1f} MiB resident")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Deterministic synthetic English-like corpora for the benchmarks.
+
+The text is made of sentences of common words mixed with the cases that
+make tokenization expensive: URLs, emails, contractions, tokenizer
+exceptions and clusters of punctuation.
+"""
+
+import random
+
+
+WORDS = (
+    "the of and to in is that it was for on are as with his they at be this have from "
+    "or one had by word but not what all were we when your can said there use an each "
+    "which she do how their if will up other about out many then them these so some her "
+    "would make like him into time has look two more write go see number no way could "
+    "people my than first water been call who oil its now find long down day did get "
+    "come made may part apple banana language privacy secure network model vector "
+    "encrypted federated learning quick brown fox jumps over lazy dog"
+).split()
+
+CONTRACTIONS = [
+    "don't",
+    "it's",
+    "I'm",
+    "we'll",
+    "can't",
+    "won't",
+    "they're",
+    "you've",
+    "she'd",
+    "isn't",
+    "Don't",
+    "It's",
+]
+
+EXCEPTIONS = [
+    "e.g.",
+    "i.e.",
+    "U.S.",
+    "Dr.",
+    "Mr.",
+    "a.m.",
+    "p.m.",
+    "etc.",
+    "vs.",
+    ":)",
+    "o.O",
+    "<3",
+]
+
+PUNCTUATION_CLUSTERS = ["...", "!?", "?!", "--", "!!!", "?!?", "..", "—", ";", ":"]
+
+OPENERS = ['"', "(", "[", "'", "(("]
+CLOSERS = ['"', ")", "]", "'", "))"]
+
+TLDS = ["com", "org", "net", "io", "co.uk"]
+
+SIZES = {"1KB": 1000, "1MB": 1000000, "100MB": 100000000}
+
+
+def _url(rng: random.Random) -> str:
+
+    scheme = rng.choice(["http://", "https://", "www."])
+    host = rng.choice(WORDS) + str(rng.randrange(100))
+
+    return f"{scheme}{host}.{rng.choice(TLDS)}/{rng.choice(WORDS)}?id={rng.randrange(10000)}"
+
+
+def _email(rng: random.Random) -> str:
+
+    return f"{rng.choice(WORDS)}.{rng.choice(WORDS)}{rng.randrange(100)}@{rng.choice(WORDS)}.{rng.choice(TLDS)}"
+
+
+def _word(rng: random.Random) -> str:
+
+    kind = rng.random()
+
+    if kind < 0.80:
+        word = rng.choice(WORDS)
+
+    elif kind < 0.88:
+        word = rng.choice(CONTRACTIONS)
+
+    elif kind < 0.93:
+        word = rng.choice(EXCEPTIONS)
+
+    elif kind < 0.95:
+        word = _url(rng)
+
+    elif kind < 0.97:
+        word = _email(rng)
+
+    else:
+        word = str(rng.randrange(100000))
+
+    # Attach punctuation to some words
+    kind = rng.random()
+
+    if kind < 0.05:
+        word = rng.choice(OPENERS) + word
+
+    elif kind < 0.10:
+        word = word + rng.choice(CLOSERS)
+
+    elif kind < 0.15:
+        word = word + rng.choice(PUNCTUATION_CLUSTERS)
+
+    elif kind < 0.18:
+        word = word + ","
+
+    return word
+
+
+def _sentence(rng: random.Random) -> str:
+
+    words = [_word(rng) for _ in range(rng.randrange(4, 25))]
+    words[0] = words[0][:1].upper() + words[0][1:]
+
+    return " ".join(words) + rng.choice([".", ".", ".", "?", "!", "..."])
+
+
+def make_corpus(size: int, seed: int = 0) -> str:
+    """Creates a deterministic English-like text of exactly `size` characters.
+
+    Args:
+        size (int): The number of characters of the text.
+        seed (int): The seed of the random generator. The same size and seed
+            always give the same text.
+
+    Returns:
+        The text.
+    """
+
+    rng = random.Random(seed)
+
+    pieces = []
+    length = 0
+
+    while length < size:
+
+        piece = _sentence(rng)
+
+        # Separate sentences with single spaces, double spaces or paragraph breaks
+        piece += rng.choice([" ", " ", " ", "  ", "\n", "\n\n"])
+
+        pieces.append(piece)
+        length += len(piece)
+
+    return "".join(pieces)[:size]
@@ -0,0 +1,67 @@
+"""A fake language model package used by the benchmarks, so that they run
+offline without downloading the `en_core_web_lg` model.
+
+It exposes the same `LOADERS` dictionary as the real model packages. The
+vectors are random but deterministic. Besides the words of the benchmark
+corpora, the table holds `SYFERTEXT_BENCH_ROWS` filler words (20000 by
+default) so that the size of the table can be made closer to that of a
+real model.
+
+If `SYFERTEXT_BENCH_VECTORS` is set to the directory of vectors converted
+with `python -m syfertext.vectors bench <directory>`, the vectors are
+memory-mapped from that directory instead.
+"""
+
+import os
+
+import numpy as np
+
+from syfertext.utils import hash_string
+
+from corpus import CONTRACTIONS
+from corpus import EXCEPTIONS
+from corpus import WORDS
+
+
+# The dimension of the vectors, as in the real model
+DIM = 300
+
+# The number of filler words added to the table
+N_FILLERS = int(os.environ.get("SYFERTEXT_BENCH_ROWS", 20000))
+
+
+def _strings() -> list:
+    """Returns the strings that have a vector."""
+
+    strings = WORDS + [word.capitalize() for word in WORDS] + CONTRACTIONS + EXCEPTIONS
+
+    # Also add the pieces contractions are split into by the tokenizer
+    strings += ["do", "n't", "'s", "'m", "'ll", "ca", "wo", "'re", "'ve", "'d", "is"]
+
+    strings += [f"filler{i}" for i in range(N_FILLERS)]
+
+    # Remove duplicates while keeping the order
+    return list(dict.fromkeys(strings))
+
+
+def _load_vectors() -> tuple:
+    """Returns the array of vectors and the default vector."""
+
+    rng = np.random.RandomState(0)
+
+    data = rng.rand(len(_strings()), DIM).astype(np.float32)
+    default_vector = np.zeros(DIM, dtype=np.float32)
+
+    return data, default_vector
+
+
+def _load_key2row() -> dict:
+    """Returns the mapping between the hashes of the strings and their rows."""
+
+    return {hash_string(string): row for row, string in enumerate(_strings())}
+
+
+LOADERS = {"vectors": _load_vectors, "key2row": _load_key2row}
+
+if os.environ.get("SYFERTEXT_BENCH_VECTORS"):
+    LOADERS["vectors_path"] = lambda: os.environ["SYFERTEXT_BENCH_VECTORS"]
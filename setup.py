@@ -20,7 +20,13 @@ setup(
     packages=find_packages(),
     long_description=read("README.md"),
     long_description_content_type="text/markdown",
-    install_requires=["tqdm==4.36.1", "mmh3==2.5.1", "syft==0.2.8", "requests==2.22.0",],
+    install_requires=[
+        "tqdm==4.36.1",
+        "mmh3==2.5.1",
+        "syft==0.2.8",
+        "requests==2.22.0",
+        "numpy>=1.18.1",
+    ],
     extras_require={
         "test": [
             "black>=19.10b0",
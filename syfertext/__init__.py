@@ -14,7 +14,12 @@ hook = syft.TorchHook(torch)
 
 
 def load(
-    model_name, owner: BaseWorker, id: int = None, tags: Set[str] = None, description: str = None
+    model_name,
+    owner: BaseWorker,
+    id: int = None,
+    tags: Set[str] = None,
+    description: str = None,
+    background: bool = False,
 ):
     """Loads the specified language model `model_name` and returns a Language object.
 
@@ -24,7 +29,9 @@ def load(
         id (int): The Identifier of the Language object in the worker's object registery.
         tags (set): A set of str that help search for the Language object across workers.
         description (str): A str that describes the Language object.
-
+        background (bool): If True, the word vectors start loading in a background
+            thread, instead of when they are first needed. See `Language.warmup()`
+            to wait for them.
 
     Returns:
         a an object of the Language class, representing the requested language model.
@@ -33,6 +40,9 @@ def load(
     # Instantiate a Language object
     nlp = Language(model_name, id=id, owner=owner, tags=tags, description=description)
 
+    if background:
+        nlp.vocab.vectors.load_async()
+
     return nlp
 
 
@@ -0,0 +1,746 @@
+try:
+    # Python >= 3.11
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+import re
+
+from typing import Dict
+from typing import Set
+from typing import List
+from typing import Tuple
+from typing import Optional
+from typing import Union
+from typing import Match
+from typing import Pattern
+
+
+# The key marking, in a trie node, that a literal affix ends at this node.
+# Its value is the position of the affix in the list of rules.
+_END = None
+
+# The characters with a special meaning in regular expressions. Inline flags
+# such as (?x), which make other characters special, start with one of them.
+_SPECIAL_CHARS = set(".^$*+?{}[]()|\\")
+
+# Character ranges larger than this are not expanded into sets of characters
+_MAX_RANGE = 10000
+
+# Position assertions that only look at the end of the string
+_AT_END = {sre_parse.AT_END, sre_parse.AT_END_LINE, sre_parse.AT_END_STRING}
+
+# Position assertions that look at the character before the current position
+_AT_BOUNDARY = {
+    sre_parse.AT_BOUNDARY,
+    sre_parse.AT_NON_BOUNDARY,
+    sre_parse.AT_LOC_BOUNDARY,
+    sre_parse.AT_LOC_NON_BOUNDARY,
+    sre_parse.AT_UNI_BOUNDARY,
+    sre_parse.AT_UNI_NON_BOUNDARY,
+}
+
+
+class AffixMatch:
+    """A lightweight substitute for `re.Match` returned when a literal
+    affix matches. Only the methods used by the `Tokenizer` are provided.
+    """
+
+    __slots__ = ("_start", "_end")
+
+    def __init__(self, start: int, end: int):
+
+        self._start = start
+        self._end = end
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+    def span(self) -> Tuple[int, int]:
+        return self._start, self._end
+
+
+def parse_literal(entry: str) -> Optional[str]:
+    """Returns the string matched by the regular expression `entry` if it
+    only matches a fixed string (e.g. r"\\?" or "US"), otherwise None.
+
+    The regex parser is not used: `entry` is a literal if each of its
+    characters is either a backslash-escaped punctuation character or not a
+    special character of regular expressions.
+
+    Args:
+        entry (str): A regular expression.
+
+    Returns:
+        (str or None): The matched literal string, if any.
+    """
+
+    chars = []
+
+    i = 0
+
+    while i < len(entry):
+
+        char = entry[i]
+
+        if char == "\\":
+
+            # Escaped letters, digits and underscores are classes, backreferences
+            # or special characters such as \n
+            if i + 1 == len(entry) or entry[i + 1].isalnum() or entry[i + 1] == "_":
+                return None
+
+            char = entry[i + 1]
+            i += 2
+
+        elif char in _SPECIAL_CHARS:
+            return None
+
+        else:
+            i += 1
+
+        chars.append(char)
+
+    return "".join(chars)
+
+
+def _pattern_flags(parsed: "sre_parse.SubPattern") -> int:
+    """Returns the flags of a parsed regex. They are held by the `state`
+    attribute of the parsed regex from Python 3.8 on, and by its `pattern`
+    attribute before.
+    """
+
+    return (getattr(parsed, "state", None) or parsed.pattern).flags
+
+
+def _lookbehind_width(parsed: "sre_parse.SubPattern") -> Optional[int]:
+    """Returns an upper bound of the number of characters before the start
+    of a match that a parsed regex can read, e.g. with lookbehind assertions.
+
+    Args:
+        parsed (SubPattern): The parsed regex.
+
+    Returns:
+        (int or None): The upper bound, or None if it could not be determined.
+    """
+
+    width = 0
+
+    for op, av in parsed:
+
+        if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+
+            direction, subpattern = av
+
+            if direction < 0:
+                width += subpattern.getwidth()[1]
+
+            sub_width = _lookbehind_width(subpattern)
+
+        elif op == sre_parse.SUBPATTERN:
+            sub_width = _lookbehind_width(av[-1])
+
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            sub_width = _lookbehind_width(av[2])
+
+        elif op == sre_parse.BRANCH:
+            sub_widths = [_lookbehind_width(branch) for branch in av[1]]
+            sub_width = None if None in sub_widths else max(sub_widths)
+
+        elif op in (sre_parse.LITERAL, sre_parse.NOT_LITERAL, sre_parse.IN, sre_parse.ANY):
+            sub_width = 0
+
+        elif op == sre_parse.AT and av in _AT_END:
+            sub_width = 0
+
+        elif op == sre_parse.AT and av in _AT_BOUNDARY:
+            sub_width = 1
+
+        else:
+            # Other constructs, such as `^`, are rare in affix rules, play it safe
+            sub_width = None
+
+        if sub_width is None:
+            return None
+
+        width += sub_width
+
+    return width
+
+
+def _char_set(av: List) -> Optional[Set[str]]:
+    """Returns the set of characters matched by a parsed character class.
+
+    Args:
+        av (list): The items of the parsed character class.
+
+    Returns:
+        (set or None): The set of characters, or None if it could not be determined.
+    """
+
+    chars = set()
+
+    for item_op, item_av in av:
+
+        if item_op == sre_parse.LITERAL:
+            chars.add(chr(item_av))
+
+        elif item_op == sre_parse.RANGE and item_av[1] - item_av[0] < _MAX_RANGE:
+            chars.update(chr(code) for code in range(item_av[0], item_av[1] + 1))
+
+        else:
+            return None
+
+    return chars
+
+
+def _edge_chars(parsed: "sre_parse.SubPattern", last: bool) -> Optional[Set[str]]:
+    """Returns the set of characters that a match of a parsed regex can
+    start with (or end with if `last` is True).
+
+    Args:
+        parsed (SubPattern): The parsed regex.
+        last (bool): Whether to look at the last character instead of the
+            first one.
+
+    Returns:
+        (set or None): The set of characters, or None if it could not be determined.
+    """
+
+    if len(parsed) == 0:
+        return None
+
+    op, av = parsed[-1] if last else parsed[0]
+
+    if op == sre_parse.LITERAL:
+        return {chr(av)}
+
+    if op == sre_parse.IN:
+        return _char_set(av)
+
+    # The repeated pattern should occur at least once
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+        return _edge_chars(av[2], last)
+
+    # Groups that do not change the flags
+    if op == sre_parse.SUBPATTERN and not av[1] and not av[2]:
+        return _edge_chars(av[-1], last)
+
+    if op == sre_parse.BRANCH:
+
+        chars = set()
+
+        for branch in av[1]:
+
+            branch_chars = _edge_chars(branch, last)
+
+            if branch_chars is None:
+                return None
+
+            chars.update(branch_chars)
+
+        return chars
+
+    return None
+
+
+def _all_chars(parsed: "sre_parse.SubPattern") -> Optional[Set[str]]:
+    """Returns the set of characters that a match of a parsed regex can
+    contain. Characters only read by assertions are left out.
+
+    Args:
+        parsed (SubPattern): The parsed regex.
+
+    Returns:
+        (set or None): The set of characters, or None if it could not be determined.
+    """
+
+    chars = set()
+
+    for op, av in parsed:
+
+        if op == sre_parse.LITERAL:
+            sub_chars = {chr(av)}
+
+        elif op == sre_parse.IN:
+            sub_chars = _char_set(av)
+
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            sub_chars = _all_chars(av[2])
+
+        elif op == sre_parse.SUBPATTERN and not av[1] and not av[2]:
+            sub_chars = _all_chars(av[-1])
+
+        elif op == sre_parse.BRANCH:
+
+            sub_chars = set()
+
+            for branch in av[1]:
+
+                branch_chars = _all_chars(branch)
+
+                if branch_chars is None:
+                    return None
+
+                sub_chars.update(branch_chars)
+
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT, sre_parse.AT):
+            sub_chars = set()
+
+        else:
+            return None
+
+        if sub_chars is None:
+            return None
+
+        chars.update(sub_chars)
+
+    return chars
+
+
+class _PatternInfo:
+    """What is known about the matches of an affix rule that is a pattern.
+    Every attribute is None when it could not be determined.
+
+    Attributes:
+        first_chars (set): The characters a match can start with.
+        last_chars (set): The characters a match can end with.
+        chars (set): The characters a match can contain.
+        width (int): The maximum length of a match.
+        lookbehind (int): The maximum number of characters before the start
+            of a match that the pattern reads.
+    """
+
+    def __init__(self, entry: str):
+        """Initializes the _PatternInfo object.
+
+        Args:
+            entry (str): The regular expression of the rule.
+        """
+
+        parsed = sre_parse.parse(entry)
+
+        max_width = parsed.getwidth()[1]
+
+        self.width = max_width if max_width < sre_parse.MAXREPEAT else None
+        self.lookbehind = _lookbehind_width(parsed)
+
+        # Inline flags such as (?i) change what characters match
+        if _pattern_flags(parsed) & ~sre_parse.SRE_FLAG_UNICODE:
+            self.first_chars = self.last_chars = self.chars = None
+
+        else:
+            self.first_chars = _edge_chars(parsed, last=False)
+            self.last_chars = _edge_chars(parsed, last=True)
+            self.chars = _all_chars(parsed)
+
+
+def _split_entries(entries: Tuple) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+    """Splits affix rules into literal strings and regular expressions,
+    keeping track of the position of each rule.
+
+    Args:
+        entries (tuple): The affix rules.
+
+    Returns:
+        (tuple): The list of `(position, literal)` and the list of
+            `(position, pattern)` pairs.
+    """
+
+    literals = []
+    patterns = []
+
+    for index, entry in enumerate(piece for piece in entries if piece.strip()):
+
+        literal = parse_literal(entry)
+
+        if literal:
+            literals.append((index, literal))
+        else:
+            patterns.append((index, entry))
+
+    return literals, patterns
+
+
+def _build_trie(literals: List[Tuple[int, str]], reverse: bool = False) -> Dict:
+    """Builds a character trie of literal affixes.
+
+    Args:
+        literals (list): The `(position, literal)` pairs to insert.
+        reverse (bool): If True, literals are inserted from their
+            last character to their first one.
+
+    Returns:
+        (dict): The root node of the trie. Each node maps a character to
+            a child node, and `_END` to the smallest position of the
+            literals ending at this node.
+    """
+
+    root = dict()
+
+    for index, literal in literals:
+
+        node = root
+
+        for char in reversed(literal) if reverse else literal:
+            node = node.setdefault(char, dict())
+
+        # Keep the first rule if a literal is repeated
+        node.setdefault(_END, index)
+
+    return root
+
+
+def _search_from(
+    regex: Pattern, string: str, pos: int, endpos: int, start: int, lookbehind: Optional[int]
+) -> Optional[Union[Match, AffixMatch]]:
+    """Searches `regex` in `string[pos:endpos]` for a match starting at
+    `start` or later. Positions are given and returned relative to `string`.
+
+    The search runs on `string` directly when the regex cannot read
+    characters before `pos`. Otherwise, the searched part is copied.
+
+    Args:
+        regex (Pattern): The compiled regex.
+        string (str): The string to search.
+        pos (int): The start of the searched part of `string`.
+        endpos (int): The end of the searched part of `string`.
+        start (int): The position where the search starts.
+        lookbehind (int or None): The maximum number of characters before
+            the start of a match that the regex reads, if known.
+
+    Returns:
+        (re.Match or AffixMatch or None): The match, if any.
+    """
+
+    if pos == 0 or (lookbehind is not None and start - lookbehind >= pos):
+        return regex.search(string, start, endpos)
+
+    match = regex.search(string[pos:endpos], start - pos)
+
+    if match is None:
+        return None
+
+    return AffixMatch(pos + match.start(), pos + match.end())
+
+
+class PrefixMatcher:
+    """Matches prefixes like the regex built by `utils.compile_prefix_regex()`,
+    i.e., the first rule in order that matches at the start of the string wins.
+
+    Literal rules are matched by walking a character trie. The rules that
+    are genuine patterns are only tried when the first character of the
+    string can start one of them.
+
+    Example:
+        >>> matcher = PrefixMatcher(TOKENIZER_PREFIXES)
+        >>> tokenizer = Tokenizer(vocab, prefix_search=matcher.search)
+    """
+
+    def __init__(self, entries: Tuple):
+        """Initializes the PrefixMatcher object.
+
+        Args:
+            entries (tuple): The prefix rules, e.g. syfertext.punctuation.TOKENIZER_PREFIXES.
+        """
+
+        if "(" in entries:
+            # Handle deprecated data
+            entries = [re.escape(piece) for piece in entries if piece.strip()]
+
+        literals, patterns = _split_entries(entries)
+
+        self.trie = _build_trie(literals)
+
+        # The pattern rules compiled individually, in order
+        self.patterns = [(index, re.compile(pattern)) for index, pattern in patterns]
+
+        # All pattern rules compiled together. This is None when all rules are literal
+        self.pattern_re = (
+            re.compile("|".join(f"(?:{pattern})" for _, pattern in patterns)) if patterns else None
+        )
+
+        infos = [_PatternInfo(pattern) for _, pattern in patterns]
+
+        # The characters a pattern match can start with. This is None
+        # when it could not be determined for some pattern.
+        self.first_chars = set()
+
+        for info in infos:
+
+            if info.first_chars is None:
+                self.first_chars = None
+                break
+
+            self.first_chars.update(info.first_chars)
+
+        # The maximum number of characters before the start of a match
+        # that the patterns read
+        lookbehinds = [info.lookbehind for info in infos]
+        self.lookbehind = None if None in lookbehinds else max(lookbehinds, default=0)
+
+    def search(
+        self, string: str, pos: int = 0, endpos: Optional[int] = None
+    ) -> Optional[Union[Match, AffixMatch]]:
+        """Finds the prefix of `string`.
+
+        Unlike the methods of `re.Pattern`, the part of `string` outside
+        of `pos:endpos` is never looked at, so the result is always
+        that of `search(string[pos:endpos])` with positions relative
+        to `string`.
+
+        Args:
+            string (str): The string to search.
+            pos (int): The position where the searched part of `string` starts.
+            endpos (int): The position where the searched part of `string` ends.
+                Defaults to the length of `string`.
+
+        Returns:
+            (re.Match or AffixMatch or None): The match of the prefix, or None if
+                no prefix rule matches.
+        """
+
+        if endpos is None or endpos > len(string):
+            endpos = len(string)
+
+        # Most strings do not start with punctuation
+        if pos < endpos and self.first_chars is not None and string[pos] not in self.trie:
+            if string[pos] not in self.first_chars:
+                return None
+
+        # Find the literal rule with the smallest position that matches
+        node = self.trie
+        literal_index = None
+        literal_end = pos
+
+        for end in range(pos, endpos):
+
+            node = node.get(string[end])
+
+            if node is None:
+                break
+
+            index = node.get(_END)
+
+            if index is not None and (literal_index is None or index < literal_index):
+                literal_index = index
+                literal_end = end + 1
+
+        # Skip the patterns if none of them can match
+        if self.pattern_re is None or (
+            pos < endpos and self.first_chars is not None and string[pos] not in self.first_chars
+        ):
+            match = None
+        else:
+            match = self._match(self.pattern_re, string, pos, endpos)
+
+        if literal_index is None:
+            return match
+
+        if match is None:
+            return AffixMatch(pos, literal_end)
+
+        # Both a literal and a pattern rule match. The pattern wins
+        # only if it comes first in the list of rules.
+        for index, pattern in self.patterns:
+
+            if index > literal_index:
+                break
+
+            match = self._match(pattern, string, pos, endpos)
+
+            if match is not None:
+                return match
+
+        return AffixMatch(pos, literal_end)
+
+    def _match(
+        self, regex: Pattern, string: str, pos: int, endpos: int
+    ) -> Optional[Union[Match, AffixMatch]]:
+        """Matches `regex` at the start of `string[pos:endpos]`.
+
+        Args:
+            regex (Pattern): The compiled regex.
+            string (str): The string to search.
+            pos (int): The start of the searched part of `string`.
+            endpos (int): The end of the searched part of `string`.
+
+        Returns:
+            (re.Match or AffixMatch or None): The match, if any.
+        """
+
+        if pos == 0 or self.lookbehind == 0:
+            return regex.match(string, pos, endpos)
+
+        match = regex.match(string[pos:endpos])
+
+        if match is None:
+            return None
+
+        return AffixMatch(pos + match.start(), pos + match.end())
+
+
+class SuffixMatcher:
+    """Matches suffixes like the regex built by `utils.compile_suffix_regex()`,
+    i.e., the longest suffix matched by any rule wins.
+
+    Literal rules are matched by walking a reversed character trie from the
+    end of the string. Patterns with a bounded width are searched in a
+    window at the end of the string instead of the whole string. Other
+    patterns are only searched when the last character of the string can
+    end one of them, and when possible in the run of characters at the
+    end of the string that they can match.
+
+    Note:
+        Unlike `$` in a regex, the end of the string is never matched
+        before a trailing newline. The Tokenizer only searches strings
+        without white spaces.
+
+    Example:
+        >>> matcher = SuffixMatcher(TOKENIZER_SUFFIXES)
+        >>> tokenizer = Tokenizer(vocab, suffix_search=matcher.search)
+    """
+
+    def __init__(self, entries: Tuple):
+        """Initializes the SuffixMatcher object.
+
+        Args:
+            entries (tuple): The suffix rules, e.g. syfertext.punctuation.TOKENIZER_SUFFIXES.
+        """
+
+        literals, patterns = _split_entries(entries)
+
+        self.trie = _build_trie(literals, reverse=True)
+
+        bounded = []
+
+        # The `(info, regex)` pairs of the patterns with an unbounded width
+        self.unbounded = []
+
+        # The maximum length of a match of the bounded patterns
+        self.width = 0
+
+        # The maximum number of characters before the start of a match
+        # that the bounded patterns read
+        self.lookbehind = 0
+
+        # The characters a match of any rule can end with. This is None
+        # when it could not be determined for some pattern.
+        self.last_chars = set(self.trie)
+
+        for _, pattern in patterns:
+
+            info = _PatternInfo(pattern)
+
+            if info.last_chars is None:
+                self.last_chars = None
+            elif self.last_chars is not None:
+                self.last_chars.update(info.last_chars)
+
+            if info.width is None:
+                self.unbounded.append((info, re.compile(f"(?:{pattern})$")))
+                continue
+
+            bounded.append(pattern)
+
+            self.width = max(self.width, info.width)
+
+            if self.lookbehind is not None and info.lookbehind is not None:
+                self.lookbehind = max(self.lookbehind, info.lookbehind)
+            else:
+                self.lookbehind = None
+
+        # The bounded patterns compiled together. This is None if there are none
+        self.bounded_re = (
+            re.compile("|".join(f"(?:{pattern})$" for pattern in bounded)) if bounded else None
+        )
+
+    def search(
+        self, string: str, pos: int = 0, endpos: Optional[int] = None
+    ) -> Optional[Union[Match, AffixMatch]]:
+        """Finds the suffix of `string`.
+
+        Unlike the methods of `re.Pattern`, the part of `string` outside
+        of `pos:endpos` is never looked at, so the result is always
+        that of `search(string[pos:endpos])` with positions relative
+        to `string`.
+
+        Args:
+            string (str): The string to search.
+            pos (int): The position where the searched part of `string` starts.
+            endpos (int): The position where the searched part of `string` ends.
+                Defaults to the length of `string`.
+
+        Returns:
+            (re.Match or AffixMatch or None): The match of the suffix, or None if
+                no suffix rule matches.
+        """
+
+        if endpos is None or endpos > len(string):
+            endpos = len(string)
+
+        # Most strings do not end with punctuation
+        if (
+            pos < endpos
+            and self.last_chars is not None
+            and string[endpos - 1] not in self.last_chars
+        ):
+            return None
+
+        # Find the longest literal rule that matches
+        node = self.trie
+        literal_start = None
+
+        for start in range(endpos - 1, pos - 1, -1):
+
+            node = node.get(string[start])
+
+            if node is None:
+                break
+
+            if _END in node:
+                literal_start = start
+
+        # Find the longest pattern match. No match of a bounded pattern
+        # can start before the window.
+        if self.bounded_re is not None:
+            start = max(pos, endpos - self.width)
+            match = _search_from(self.bounded_re, string, pos, endpos, start, self.lookbehind)
+        else:
+            match = None
+
+        for info, pattern in self.unbounded:
+
+            if info.last_chars is not None and (
+                pos == endpos or string[endpos - 1] not in info.last_chars
+            ):
+                continue
+
+            # A match can only start in the run of characters at the end
+            # of the string that the pattern can match
+            start = endpos
+
+            if info.chars is None:
+                start = pos
+            else:
+                while start > pos and string[start - 1] in info.chars:
+                    start -= 1
+
+            unbounded_match = _search_from(pattern, string, pos, endpos, start, info.lookbehind)
+
+            if unbounded_match is not None and (
+                match is None or unbounded_match.start() < match.start()
+            ):
+                match = unbounded_match
+
+        if literal_start is None:
+            return match
+
+        # Keep the longest of both matches
+        if match is not None and match.start() <= literal_start:
+            return match
+
+        return AffixMatch(literal_start, endpos)
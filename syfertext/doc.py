@@ -1,6 +1,7 @@
 from .token import Token
 import syft
 import torch
+import numpy as np
 
 hook = syft.TorchHook(torch)
 
@@ -14,6 +15,7 @@ from typing import Set
 from typing import Union
 from typing import Generator
 from .underscore import Underscore
+from .token_container import TokenContainer
 from .span import Span
 from .pointers.span_pointer import SpanPointer
 from .utils import normalize_slice
@@ -28,12 +30,22 @@ class Doc(AbstractObject):
         tags: List[str] = None,
         description: str = None,
         client_id: str = None,
+        text: str = None,
     ):
 
         super(Doc, self).__init__(id=id, owner=owner, tags=tags, description=description)
 
         self.vocab = vocab
 
+        # In bounded mode, the vocabulary keeps the strings of the tokens of
+        # this Doc as long as it is alive
+        vocab.track_doc(self)
+
+        # The text the tokens of this Doc were found in, if known. It is set
+        # by the Tokenizer, so that the text of tokens and spans can be
+        # sliced from it using the positions of the tokens.
+        self._text = text
+
         # we assign the client_id in the __call__ method of the SubPipeline
         # This is used to keep track of the worker where the pointer
         # of this doc resides. However if it is passed explicitly
@@ -41,15 +53,24 @@ class Doc(AbstractObject):
         if client_id is not None:
             self.client_id = client_id
 
-        # This list is populated in the __call__ method of the Tokenizer object.
-        # Its members are objects of the TokenMeta class defined in the tokenizer.py
-        # file
-        self.container = list()
+        # This container is populated in the __call__ method of the Tokenizer object.
+        # It behaves like a list of objects of the TokenMeta class defined in the
+        # tokenizer.py file, but stores the tokens in columns to save memory.
+        self.container = TokenContainer()
+
+        # The Underscore object (inspired by spaCy) holding the custom
+        # attributes set using the `self.set_attribute` method. It is
+        # only created when it is first accessed.
+        self._underscore = None
+
+    @property
+    def _(self) -> Underscore:
+        """The Underscore object holding the custom attributes of the document."""
+
+        if self._underscore is None:
+            self._underscore = Underscore()
 
-        # Initialize the Underscore object (inspired by spaCy)
-        # This object will hold all the custom attributes set
-        # using the `self.set_attribute` method
-        self._ = Underscore()
+        return self._underscore
 
     def set_attribute(self, name: str, value: object):
         """Creates a custom attribute with the name `name` and
@@ -78,7 +99,7 @@ class Doc(AbstractObject):
         """
 
         # `True` if `self._` has attribute `name`, `False` otherwise
-        attr_exists = hasattr(self._, name)
+        attr_exists = self._underscore is not None and hasattr(self._underscore, name)
 
         return attr_exists
 
@@ -104,7 +125,11 @@ class Doc(AbstractObject):
             value (obj): value of the custom attribute with name `name`.
         """
 
-        return getattr(self._, name)
+        # Avoid creating an Underscore object if the document has none
+        if self._underscore is None:
+            raise AttributeError(f"Document does not have the attribute {name}")
+
+        return getattr(self._underscore, name)
 
     def __getitem__(self, key: Union[int, slice]) -> Union[Token, Span, int]:
         """Returns a Token object at position `key` or Span object using slice.
@@ -169,7 +194,41 @@ class Doc(AbstractObject):
     @property
     def text(self):
         """Returns the text present in the doc with whitespaces"""
-        return "".join(token.text_with_ws for token in self)
+
+        if self._text is None:
+            return "".join(token.text_with_ws for token in self)
+
+        return self._slice_text(0, len(self), with_ws=True)
+
+    def _slice_text(self, start: int, end: int, with_ws: bool) -> str:
+        """Returns the part of the text of the Doc covered by the tokens
+        at positions `start` to `end` (excluded). The Doc should hold the
+        text it was created from.
+
+        Args:
+            start (int): The position of the first token.
+            end (int): The position following the last token.
+            with_ws (bool): Whether to include the white space following
+                the last token, if any.
+
+        Returns:
+            str: The text covered by the tokens.
+        """
+
+        if start >= end:
+            return ""
+
+        container = self.container
+
+        last = end - 1
+
+        # The position following the last character of the last token
+        text_end = int(container.idxs[last]) + len(self.vocab.store[int(container.orths[last])])
+
+        if with_ws and container.spaces[last]:
+            text_end += 1
+
+        return self._text[int(container.idxs[start]) : text_end]
 
     @property
     def vector(self):
@@ -229,29 +288,18 @@ class Doc(AbstractObject):
             doc_vector: Document vector ignoring excluded tokens.
         """
 
-        # Get the valid tokens which are to be included
-        valid_tokens = self._get_valid_tokens(excluded_tokens)
-
-        vectors = None
-
-        # Count the tokens that have vectors
-        vector_count = 0
-
-        for token in valid_tokens:
-
-            if token.has_vector:
-                # Increment the vector counter
-                vector_count += 1
+        vectors = self.vocab.vectors
 
-                # Accumulate token's vector by summing them
-                vectors = token.vector if vectors is None else vectors + token.vector
+        # Get the vector rows of the valid tokens which have a vector
+        rows = self.vocab.get_vector_rows(self._get_valid_orths(excluded_tokens))
+        rows = rows[rows >= 0]
 
         # If no tokens with vectors were found, just get the default vector(zeros)
-        if vector_count == 0:
-            doc_vector = self.vocab.vectors.default_vector
+        if len(rows) == 0:
+            doc_vector = vectors.vector_at(None)
         else:
             # The Doc vector, which is the average of all vectors
-            doc_vector = vectors / vector_count
+            doc_vector = vectors.vectors_at(rows).sum(dim=0) / len(rows)
         return doc_vector
 
     def get_token_vectors(self, excluded_tokens: Dict[str, Set[object]] = None) -> torch.tensor:
@@ -268,18 +316,11 @@ class Doc(AbstractObject):
                 containing all the vectors.
         """
 
-        # Get the valid tokens which are to be included
-        valid_tokens = self._get_valid_tokens(excluded_tokens)
-
-        # The list for holding all token vectors.
-        token_vectors = []
-
-        for token in valid_tokens:
-            # Get the vector of the token
-            token_vectors.append(token.vector)
+        # Get the vector rows of the valid tokens which are to be included
+        rows = self.vocab.get_vector_rows(self._get_valid_orths(excluded_tokens))
 
-        # Convert to list of tensors to torch tensor.
-        token_vectors = torch.stack(tensors=token_vectors, dim=0)
+        # Gather all the token vectors at once
+        token_vectors = self.vocab.vectors.vectors_at(rows)
 
         return token_vectors
 
@@ -397,6 +438,25 @@ class Doc(AbstractObject):
             for token in self:
                 yield token
 
+    def _get_valid_orths(self, excluded_tokens: Dict[str, Set[object]] = None) -> np.ndarray:
+        """Returns the orths of the tokens which are not excluded, see `_get_valid_tokens()`.
+
+        Args:
+            excluded_tokens (Dict): A dictionary used to ignore tokens of the document based on values
+                of their attributes.
+
+        Returns:
+            The uint64 array of the orths of the valid tokens, in the order of the tokens.
+        """
+
+        # Tokens are only created if some of them have to be excluded
+        if not excluded_tokens:
+            return self.container.orths
+
+        valid_tokens = self._get_valid_tokens(excluded_tokens)
+
+        return np.fromiter((token.orth for token in valid_tokens), dtype=np.uint64)
+
     @staticmethod
     def create_pointer(
         doc,
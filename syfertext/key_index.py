@@ -0,0 +1,120 @@
+import numpy as np
+
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+
+class KeyIndex:
+    """Maps the hashes of words to the rows of their vectors, like the
+    `key2row` dict of a language model, using two NumPy arrays: the keys
+    sorted in increasing order and the rows of the keys. A key is found by
+    binary search with `np.searchsorted`.
+
+    This uses 16 bytes per key instead of about 100 bytes for a dict entry
+    with its int objects, and the arrays can be memory-mapped from the files
+    saved by `Vectors.to_disk()` without being read or converted. The index
+    behaves like a read-only dict: it supports `len()`, iteration over the
+    keys, `in`, `get()` and indexing.
+    """
+
+    def __init__(self, keys: np.ndarray, rows: np.ndarray):
+        """Initializes the KeyIndex object.
+
+        Args:
+            keys (np.ndarray): The uint64 array of the keys, sorted in
+                increasing order, without duplicates.
+            rows (np.ndarray): The int64 array of the rows of the keys.
+        """
+
+        assert len(keys) == len(rows), "Arguments `keys` and `rows` should have the same length"
+
+        # Search memory-mapped arrays as plain arrays, which is faster
+        self.keys = np.asarray(keys, dtype=np.uint64).view(np.ndarray)
+        self.rows = np.asarray(rows, dtype=np.int64).view(np.ndarray)
+
+    @classmethod
+    def from_dict(cls, key2row: Dict[int, int]) -> "KeyIndex":
+        """Creates the index of a dict mapping keys to rows.
+
+        Args:
+            key2row (dict): The dict mapping the keys to their rows.
+
+        Returns:
+            The KeyIndex object.
+        """
+
+        keys = np.fromiter(key2row.keys(), dtype=np.uint64, count=len(key2row))
+        rows = np.fromiter(key2row.values(), dtype=np.int64, count=len(key2row))
+
+        order = np.argsort(keys)
+
+        return cls(keys[order], rows[order])
+
+    def find(self, key: int) -> int:
+        """Returns the row of `key`, or -1 if it is not in the index."""
+
+        keys = self.keys
+
+        index = int(keys.searchsorted(np.uint64(key)))
+
+        if index < len(keys) and keys[index] == key:
+            return int(self.rows[index])
+
+        return -1
+
+    def find_many(self, keys: np.ndarray) -> np.ndarray:
+        """Returns the rows of several keys at once.
+
+        Args:
+            keys (np.ndarray): The uint64 array of the keys.
+
+        Returns:
+            The int64 array of rows, with -1 for the keys that are not in the index.
+        """
+
+        keys = np.asarray(keys, dtype=np.uint64)
+
+        if len(self.keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+
+        # The position of each key in the sorted keys, or of the first greater
+        # key. Keys greater than all the others are compared to the last one.
+        indices = np.minimum(self.keys.searchsorted(keys), len(self.keys) - 1)
+
+        return np.where(self.keys[indices] == keys, self.rows[indices], -1)
+
+    def get(self, key: int, default: Optional[int] = None) -> Optional[int]:
+        """Returns the row of `key`, or `default` if it is not in the index."""
+
+        row = self.find(key)
+
+        return default if row < 0 else row
+
+    def __getitem__(self, key: int) -> int:
+
+        row = self.find(key)
+
+        if row < 0:
+            raise KeyError(key)
+
+        return row
+
+    def __contains__(self, key: int) -> bool:
+
+        return self.find(key) >= 0
+
+    def __len__(self) -> int:
+
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over the keys in increasing order."""
+
+        return iter(self.keys.tolist())
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the arrays."""
+
+        return self.keys.nbytes + self.rows.nbytes
@@ -1,9 +1,11 @@
 from .tokenizer import Tokenizer
 from .vocab import Vocab
+from .string_store import CompactStringStore
 from .doc import Doc
 from .pointers.doc_pointer import DocPointer
 from .pipeline import SubPipeline
 from .attrs import Attributes
+from . import parallel
 
 from syft.generic.abstract.object import AbstractObject
 from syft.workers.base import BaseWorker
@@ -11,7 +13,12 @@ from syft.generic.string import String
 from syft.generic.pointers.string_pointer import StringPointer
 from syft.generic.pointers.object_pointer import ObjectPointer
 
-from typing import List, Union, Tuple
+import itertools
+import collections
+import multiprocessing
+from array import array
+
+from typing import List, Union, Tuple, Iterable, Generator
 
 
 class BaseDefaults(object):
@@ -88,6 +95,31 @@ class Language(AbstractObject):
 
         super(Language, self).__init__(id=id, owner=owner, tags=tags, description=description)
 
+    def warmup(self, timeout: float = None) -> bool:
+        """Loads the word vectors, and the lexeme table if the language model
+        ships one, so that the first texts processed do not wait for them.
+        If the vectors are already being loaded in the background, e.g. by
+        `syfertext.load(..., background=True)`, this waits for them instead.
+
+        Args:
+            timeout (float): The number of seconds to wait at most for the
+                vectors. If it expires, they keep loading in the background.
+                If None, waits until they are loaded.
+
+        Returns:
+            True if the vectors are loaded, False if the timeout expired.
+        """
+
+        self.vocab.vectors.load_async()
+
+        if not self.vocab.vectors.wait(timeout):
+            return False
+
+        # The lexeme table is memory-mapped, so this is quick
+        self.vocab.lex_table
+
+        return True
+
     @property
     def pipe_names(self) -> List[str]:
         """Returns a list of component names in the pipeline in order of execution.
@@ -382,6 +414,25 @@ class Language(AbstractObject):
 
         """
 
+        # Get the subpipeline that operates on the worker where `input` is located
+        subpipeline = self._get_subpipeline(template_index=template_index, input=input)
+
+        # Run it and return the Doc or DocPointer object
+        return self._apply_subpipeline(subpipeline=subpipeline, input=input)
+
+    def _get_location_id(
+        self, input: Union[str, String, StringPointer, Doc, DocPointer]
+    ) -> Union[str, int]:
+        """Returns the ID of the worker where `input` is located.
+
+        Args:
+            input (str, String, StringPointer, Doc, DocPointer): The text to be
+                tokenized or the Doc to be processed, or a pointer to either.
+
+        Returns:
+            (str or int): The ID of the worker.
+        """
+
         # Get the location ID of the worker where the text to be tokenized,
         # or the Doc to be processed is located
         if isinstance(input, ObjectPointer):
@@ -389,6 +440,27 @@ class Language(AbstractObject):
         else:
             location_id = self.owner.id
 
+        return location_id
+
+    def _get_subpipeline(
+        self, template_index: int, input: Union[str, String, StringPointer, Doc, DocPointer]
+    ) -> Union[SubPipeline, ObjectPointer]:
+        """Returns the subpipeline (or the pointer to it) built from the template at
+        position `template_index` that operates on the worker where `input` is
+        located. It is created and sent to that worker if it does not exist yet.
+
+        Args:
+            template_index (int): The index of the subpipeline template in
+                `self.subpipelines_templates`
+            input (str, String, StringPointer, Doc, DocPointer): The input on which
+                the subpipeline will operate.
+
+        Returns:
+            (SubPipeline or SubPipelinePointer): The subpipeline object or a pointer to it.
+        """
+
+        location_id = self._get_location_id(input)
+
         # Create a new SubPipeline object if one doesn't already exist on the
         # worker where the input is located
         if location_id not in self.pipeline[template_index]:
@@ -417,10 +489,30 @@ class Language(AbstractObject):
                     location_id
                 ].send(input.location)
 
+        return self.pipeline[template_index][location_id]
+
+    def _apply_subpipeline(
+        self,
+        subpipeline: Union[SubPipeline, ObjectPointer],
+        input: Union[str, String, StringPointer, Doc, DocPointer],
+    ) -> Union[Doc, DocPointer]:
+        """Runs `subpipeline` on `input`.
+
+        Args:
+            subpipeline (SubPipeline or SubPipelinePointer): The subpipeline to run. It should
+                be located on the same worker as `input`.
+            input (str, String, StringPointer, Doc, DocPointer): The input on which
+                the subpipeline operates.
+
+        Returns:
+            (Doc or DocPointer): The new or updated Doc object or
+               a pointer to a Doc object.
+        """
+
         # Apply the subpipeline and get the doc or the Doc id.
         # If a Doc ID is obtained, this signifies the ID of the
         # Doc object on the remote worker.
-        doc_or_id = self.pipeline[template_index][location_id](input)
+        doc_or_id = subpipeline(input)
 
         # If the doc is of type (str or int), this means that a
         # DocPointer should be created
@@ -459,3 +551,213 @@ class Language(AbstractObject):
 
         # return the Doc object
         return doc
+
+    def pipe(
+        self,
+        texts: Iterable[Union[str, String, StringPointer]],
+        batch_size: int = 1000,
+        n_process: int = 1,
+    ) -> Generator[Union[Doc, DocPointer], None, None]:
+        """Processes a stream of texts by batches and yields the resulting Doc
+        objects (or DocPointer objects) in the same order as the texts.
+
+        `texts` is consumed lazily, so it can be a generator reading a very large
+        file: no more than `batch_size` texts and their Docs are held at a time.
+        The subpipeline that operates on each worker is looked up once per
+        batch instead of once per text.
+
+        If `n_process` is greater than 1, batches are tokenized in parallel by
+        a pool of `n_process` processes, and the rest of the pipeline runs in
+        the current process. This is only possible for local texts.
+
+        Args:
+            texts (iterable of str, String or StringPointer): The texts to be
+                tokenized and processed by the pipeline components.
+            batch_size (int): The number of texts processed together.
+            n_process (int): The number of processes used for tokenization.
+
+        Yields:
+            (Doc or DocPointer): The Doc object or a pointer to a Doc object
+                of each text.
+        """
+
+        assert (
+            isinstance(batch_size, int) and batch_size >= 1
+        ), "Argument `batch_size` should be a positive `int`."
+
+        assert (
+            isinstance(n_process, int) and n_process >= 1
+        ), "Argument `n_process` should be a positive `int`."
+
+        if n_process > 1:
+            yield from self._multiprocessing_pipe(texts, batch_size, n_process)
+            return
+
+        texts = iter(texts)
+
+        while True:
+
+            # Get the next batch of texts
+            batch = list(itertools.islice(texts, batch_size))
+
+            if not batch:
+                break
+
+            yield from self._process_batch(batch)
+
+    def _process_batch(
+        self, batch: List[Union[str, String, StringPointer]]
+    ) -> List[Union[Doc, DocPointer]]:
+        """Runs all subpipelines on a batch of texts.
+
+        Each subpipeline is applied to the whole batch before moving
+        to the next one.
+
+        Args:
+            batch (list of str, String or StringPointer): The texts to process.
+
+        Returns:
+            (list of Doc or DocPointer): The Docs (or pointers to them) in
+                the same order as the texts.
+        """
+
+        docs = list(batch)
+
+        for template_index in range(len(self.pipeline)):
+
+            # The subpipelines used for this batch indexed by location ID
+            subpipelines = dict()
+
+            for i, input in enumerate(docs):
+
+                location_id = self._get_location_id(input)
+
+                if location_id not in subpipelines:
+                    subpipelines[location_id] = self._get_subpipeline(
+                        template_index=template_index, input=input
+                    )
+
+                docs[i] = self._apply_subpipeline(
+                    subpipeline=subpipelines[location_id], input=input
+                )
+
+        return docs
+
+    def _multiprocessing_pipe(
+        self, texts: Iterable[Union[str, String]], batch_size: int, n_process: int
+    ) -> Generator[Doc, None, None]:
+        """Tokenizes batches of texts in a pool of worker processes and runs
+        the rest of the pipeline on the resulting Docs in this process.
+
+        Args:
+            texts (iterable of str or String): The local texts to process.
+            batch_size (int): The number of texts sent to a worker process at once.
+            n_process (int): The number of worker processes.
+
+        Yields:
+            (Doc): The Doc object of each text, in the same order as the texts.
+        """
+
+        # The tokenizer to replicate in the worker processes
+        config = parallel.get_tokenizer_config(self.factories["tokenizer"])
+
+        # Worker processes map the same string store file, if any, so that
+        # they share its memory
+        store_path = getattr(self.vocab.store, "path", None)
+
+        # A bounded vocabulary might evict strings shipped by the workers,
+        # so they should ship the strings of every batch
+        reship = self.vocab.max_strings is not None
+
+        # Worker processes use the same kind of string store as this process
+        compact_store = isinstance(self.vocab.store, CompactStringStore)
+
+        texts = iter(texts)
+
+        # Batches that were submitted to the pool but not yet merged, in
+        # input order. Their number is bounded so that `texts` is not
+        # consumed faster than Docs are yielded.
+        pending = collections.deque()
+
+        with multiprocessing.Pool(
+            processes=n_process,
+            initializer=parallel.init_worker,
+            initargs=(
+                self.vocab.model_name,
+                config,
+                store_path,
+                reship,
+                self.vocab.max_strings,
+                compact_store,
+            ),
+        ) as pool:
+
+            while True:
+
+                batch = list(itertools.islice(texts, batch_size))
+
+                if batch:
+
+                    assert not any(
+                        isinstance(text, ObjectPointer) for text in batch
+                    ), "Only local texts can be processed when `n_process` is greater than 1."
+
+                    batch = [str(text) for text in batch]
+
+                    pending.append((batch, pool.apply_async(parallel.tokenize_batch, (batch,))))
+
+                    # Keep every process busy before waiting for a result
+                    if len(pending) < 2 * n_process:
+                        continue
+
+                if not pending:
+                    break
+
+                batch, result = pending.popleft()
+
+                payloads, new_strings = result.get()
+
+                yield from self._merge_payloads(batch, payloads, new_strings)
+
+    def _merge_payloads(
+        self, texts: List[str], payloads: List[Tuple[array, bytes, array]], new_strings: List[str]
+    ) -> List[Doc]:
+        """Creates the Docs of a batch tokenized by a worker process and runs
+        the rest of the pipeline on them.
+
+        Args:
+            texts (list of str): The texts of the batch.
+            payloads (list of tuple): The `(orths, spaces, idxs)` payloads of the Docs.
+            new_strings (list of str): The strings used by the payloads that
+                might not be in the vocabulary's store yet.
+
+        Returns:
+            (list of Doc): The processed Docs in the same order as the payloads.
+        """
+
+        self.vocab.store.add_many(new_strings)
+
+        # The local subpipeline holding the tokenizer
+        subpipeline = self._get_subpipeline(template_index=0, input="")
+
+        docs = []
+
+        for text, payload in zip(texts, payloads):
+
+            doc = parallel.doc_from_payload(self.vocab, payload, text)
+
+            # Run the pipes following the tokenizer
+            docs.append(subpipeline.resume(doc=doc, start=1))
+
+        # Run the rest of the subpipelines
+        for template_index in range(1, len(self.pipeline)):
+
+            subpipeline = self._get_subpipeline(template_index=template_index, input=docs[0])
+
+            for i, doc in enumerate(docs):
+                docs[i] = self._apply_subpipeline(subpipeline=subpipeline, input=doc)
+
+        # In bounded mode, strings that are not used anymore might be evicted
+        self.vocab.evict_strings()
+
+        return docs
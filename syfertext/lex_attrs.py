@@ -24,41 +24,9 @@ _tlds = set(
 )
 
 
-def is_punct(text):
-    for char in text:
-        if not unicodedata.category(char).startswith("P"):
-            return False
-    return True
-
-
-def is_ascii(text):
-    for char in text:
-        if ord(char) >= 128:
-            return False
-    return True
-
-
-def like_num(text):
-    if text.startswith(("+", "-", "±", "~")):
-        text = text[1:]
-    # can be overwritten by lang with list of number words
-    text = text.replace(",", "").replace(".", "")
-    if text.isdigit():
-        return True
-    if text.count("/") == 1:
-        num, denom = text.split("/")
-        if num.isdigit() and denom.isdigit():
-            return True
-    return False
-
-
-def is_bracket(text):
-    brackets = ("(", ")", "[", "]", "{", "}", "<", ">")
-    return text in brackets
-
-
-def is_quote(text):
-    quotes = (
+_brackets = frozenset(["(", ")", "[", "]", "{", "}", "<", ">"])
+_quotes = frozenset(
+    [
         '"',
         "'",
         "`",
@@ -78,12 +46,10 @@ def is_quote(text):
         "❯",
         "''",
         "``",
-    )
-    return text in quotes
-
-
-def is_left_punct(text):
-    left_punct = (
+    ]
+)
+_left_punct = frozenset(
+    [
         "(",
         "[",
         "{",
@@ -100,13 +66,53 @@ def is_left_punct(text):
         "‹",
         "❮",
         "``",
-    )
-    return text in left_punct
+    ]
+)
+_right_punct = frozenset([")", "]", "}", ">", '"', "'", "»", "’", "”", "›", "❯", "''"])
+
+
+def is_punct(text):
+    for char in text:
+        if not unicodedata.category(char).startswith("P"):
+            return False
+    return True
+
+
+def is_ascii(text):
+    for char in text:
+        if ord(char) >= 128:
+            return False
+    return True
+
+
+def like_num(text):
+    if text.startswith(("+", "-", "±", "~")):
+        text = text[1:]
+    # can be overwritten by lang with list of number words
+    text = text.replace(",", "").replace(".", "")
+    if text.isdigit():
+        return True
+    if text.count("/") == 1:
+        num, denom = text.split("/")
+        if num.isdigit() and denom.isdigit():
+            return True
+    return False
+
+
+def is_bracket(text):
+    return text in _brackets
+
+
+def is_quote(text):
+    return text in _quotes
+
+
+def is_left_punct(text):
+    return text in _left_punct
 
 
 def is_right_punct(text):
-    right_punct = (")", "]", "}", ">", '"', "'", "»", "’", "”", "›", "❯", "''")
-    return text in right_punct
+    return text in _right_punct
 
 
 def is_currency(text):
@@ -252,3 +258,171 @@ LEX_ATTRS = {
     Attributes.IS_CURRENCY: is_currency,
     Attributes.LIKE_URL: like_url,
 }
+
+
+# Batch versions of the attribute getters above. Each takes a list of
+# strings and returns the list of the values the getter returns for them,
+# with less Python work per string: characters are classified once per
+# batch rather than once per occurrence, strings are translated all at
+# once by joining them, and the expensive getters are only called on the
+# strings that can match.
+
+# The separator of joined strings
+_sep = "\x00"
+
+_long_runs = re.compile(r"(.)\1{4,}", re.DOTALL)
+_long_runs_joined = re.compile(r"([^\x00])\1{4,}")
+
+
+def _join(strings):
+    # Joins the strings, and tells whether the joined string can be split
+    # back into them, which is the case unless a string holds the separator
+    joined = _sep.join(strings)
+    return joined, len(strings) > 0 and joined.count(_sep) == len(strings) - 1
+
+
+def _all_chars(strings, test):
+    # True for the strings whose characters all pass `test`, which is called
+    # once per distinct character. Those characters are deleted, so that
+    # only these strings become empty.
+    joined, splittable = _join(strings)
+    table = {ord(char): None for char in set(joined) if test(char)}
+    if splittable:
+        table.pop(ord(_sep), None)
+        return [not string for string in joined.translate(table).split(_sep)]
+    return [not string.translate(table) for string in strings]
+
+
+def batch_is_punct(strings):
+    return _all_chars(strings, lambda char: unicodedata.category(char).startswith("P"))
+
+
+def batch_is_ascii(strings):
+    return list(map(str.isascii, strings))
+
+
+def batch_like_num(strings):
+    # A number contains a digit
+    no_digits = _all_chars(strings, lambda char: not char.isdigit())
+    return [not no_digit and like_num(string) for string, no_digit in zip(strings, no_digits)]
+
+
+def batch_is_bracket(strings):
+    return list(map(_brackets.__contains__, strings))
+
+
+def batch_is_quote(strings):
+    return list(map(_quotes.__contains__, strings))
+
+
+def batch_is_left_punct(strings):
+    return list(map(_left_punct.__contains__, strings))
+
+
+def batch_is_right_punct(strings):
+    return list(map(_right_punct.__contains__, strings))
+
+
+def batch_is_currency(strings):
+    return _all_chars(strings, lambda char: unicodedata.category(char) == "Sc")
+
+
+def batch_like_email(strings):
+    # An email contains "@"
+    return [("@" in string) and bool(_like_email(string)) for string in strings]
+
+
+def batch_like_url(strings):
+    # `like_url` is False for strings that have no "." and no URL scheme
+    return [
+        ("." in string or string.startswith("http")) and like_url(string) for string in strings
+    ]
+
+
+def batch_word_shape(strings):
+    joined, splittable = _join(strings)
+    # Map the letters and digits to their shape character
+    table = {}
+    for char in set(joined):
+        if char.isalpha():
+            table[ord(char)] = "X" if char.isupper() else "x"
+        elif char.isdigit():
+            table[ord(char)] = "d"
+    # Keep at most 4 characters of each run of the same shape character
+    if splittable:
+        shapes = _long_runs_joined.sub(r"\1\1\1\1", joined.translate(table)).split(_sep)
+    else:
+        shapes = [_long_runs.sub(r"\1\1\1\1", string.translate(table)) for string in strings]
+    return ["LONG" if len(string) >= 100 else shape for string, shape in zip(strings, shapes)]
+
+
+def batch_lower(strings):
+    return list(map(str.lower, strings))
+
+
+def batch_prefix(strings):
+    return [string[0] for string in strings]
+
+
+def batch_suffix(strings):
+    return [string[-3:] for string in strings]
+
+
+def batch_is_alpha(strings):
+    return list(map(str.isalpha, strings))
+
+
+def batch_is_digit(strings):
+    return list(map(str.isdigit, strings))
+
+
+def batch_is_lower(strings):
+    return list(map(str.islower, strings))
+
+
+def batch_is_space(strings):
+    return list(map(str.isspace, strings))
+
+
+def batch_is_title(strings):
+    return list(map(str.istitle, strings))
+
+
+def batch_is_upper(strings):
+    return list(map(str.isupper, strings))
+
+
+def batch_is_stop(strings, stops=set()):
+    return list(map(stops.__contains__, map(str.lower, strings)))
+
+
+def batch_is_oov(strings):
+    return [True] * len(strings)
+
+
+# The batch version of each attribute getter. Getters that are not in
+# this dict are called on each string.
+BATCH_LEX_ATTRS = {
+    lower: batch_lower,
+    prefix: batch_prefix,
+    suffix: batch_suffix,
+    is_alpha: batch_is_alpha,
+    is_digit: batch_is_digit,
+    is_lower: batch_is_lower,
+    is_space: batch_is_space,
+    is_title: batch_is_title,
+    is_upper: batch_is_upper,
+    is_stop: batch_is_stop,
+    is_oov: batch_is_oov,
+    like_email: batch_like_email,
+    like_num: batch_like_num,
+    is_punct: batch_is_punct,
+    is_ascii: batch_is_ascii,
+    word_shape: batch_word_shape,
+    is_bracket: batch_is_bracket,
+    is_quote: batch_is_quote,
+    is_left_punct: batch_is_left_punct,
+    is_right_punct: batch_is_right_punct,
+    is_currency: batch_is_currency,
+    like_url: batch_like_url,
+}
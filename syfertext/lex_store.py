@@ -0,0 +1,330 @@
+from .lexeme import LexemeMeta
+from .string_store import _empty_table
+from .string_store import _insert_keys
+from .string_store import _probe
+from .string_store import _probe_many
+
+import numpy as np
+
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+
+# The attributes of a lexeme stored in a LexStore besides its orth, and the
+# dtypes of their columns. A vector row of -1 in the `id` column means that
+# the lexeme has no vector row.
+LEX_STORE_COLUMNS = {
+    "flags": np.uint64,
+    "lower": np.uint64,
+    "shape": np.uint64,
+    "prefix": np.uint64,
+    "suffix": np.uint64,
+    "length": np.uint32,
+    "lang": np.uint64,
+    "id": np.int64,
+}
+
+
+class LexStore:
+    """Holds the lexemes of a vocabulary in columns rather than as a dict of
+    `LexemeMeta` objects: one NumPy array per attribute, plus an array of
+    orths indexed by an open-addressing hash table, as in `CompactStringStore`.
+
+    This uses about 80 bytes per lexeme instead of several hundred bytes for
+    a `LexemeMeta` object with its `__dict__` and its dict entry, and allows
+    scanning an attribute over the whole vocabulary with NumPy. The store
+    behaves like a dict mapping orths to `LexemeMeta` objects: it supports
+    `len()`, iteration over the orths, `in`, `get()`, indexing and `del`.
+    Indexing returns a `LexemeMeta` view created on demand.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """Initializes the LexStore object.
+
+        Args:
+            capacity (int): The number of lexemes that can be stored before
+                the arrays need to grow.
+        """
+
+        capacity = max(capacity, 1)
+
+        # The orth of the lexeme at each row. The arrays might be longer
+        # than the number of lexemes stored.
+        self._orths = np.zeros(capacity, dtype=np.uint64)
+
+        # The columns of the attributes, by attribute name
+        self._columns = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in LEX_STORE_COLUMNS.items()
+        }
+
+        # The number of lexemes stored
+        self._size = 0
+
+        # The open-addressing hash table mapping orths to rows. Each bucket
+        # holds a row, or -1 if it is empty. Its size is a power of two.
+        self._table = _empty_table(capacity)
+
+        # Incremented every time lexemes are removed, which moves the rows of
+        # the other lexemes, so that `LexemeMeta` views know when to find
+        # their row again
+        self.generation = 0
+
+    @property
+    def orths(self) -> np.ndarray:
+        """The array of the orths of the lexemes. It is a view on the storage
+        of the store, not a copy.
+        """
+        return self._orths[: self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns the array of the values of the attribute `name` of all the
+        lexemes, in the same order as `orths`. It is a view on the storage of
+        the store, not a copy.
+
+        Args:
+            name (str): The name of the attribute, one of `LEX_STORE_COLUMNS`.
+
+        Returns:
+            The array of values.
+        """
+
+        return self._columns[name][: self._size]
+
+    def with_flag(self, flag_id: int) -> np.ndarray:
+        """Returns the orths of the lexemes whose flag `flag_id` is set.
+
+        Args:
+            flag_id (int): The attribute ID of the flag.
+
+        Returns:
+            The uint64 array of orths.
+        """
+
+        mask = (self.column("flags") >> np.uint64(flag_id)) & np.uint64(1)
+
+        return self.orths[mask.astype(np.bool_)]
+
+    def _reserve(self, size: int) -> None:
+        """Makes sure that the arrays can hold `size` lexemes, growing them
+        geometrically if needed, and rebuilds the hash table if it becomes
+        too full.
+
+        Args:
+            size (int): The number of lexemes to hold.
+        """
+
+        if size <= len(self._orths):
+            return
+
+        capacity = max(size, 2 * len(self._orths))
+
+        orths = np.zeros(capacity, dtype=np.uint64)
+        orths[: self._size] = self.orths
+        self._orths = orths
+
+        for name, dtype in LEX_STORE_COLUMNS.items():
+
+            column = np.zeros(capacity, dtype=dtype)
+            column[: self._size] = self.column(name)
+            self._columns[name] = column
+
+        self._rebuild_table()
+
+    def _rebuild_table(self) -> None:
+        """Rebuilds the hash table from the orths of the lexemes stored."""
+
+        self._table = _empty_table(len(self._orths))
+        _insert_keys(self._table, self._orths, np.arange(self._size))
+
+    def find(self, orth: int) -> int:
+        """Returns the row of the lexeme `orth`, or -1 if it is not stored."""
+
+        return _probe(self._table, self._orths, orth)[1]
+
+    def find_many(self, orths: np.ndarray) -> np.ndarray:
+        """Returns the rows of several lexemes at once.
+
+        Args:
+            orths (np.ndarray): The uint64 array of the orths of the lexemes.
+
+        Returns:
+            The int64 array of rows, with -1 for the lexemes that are not stored.
+        """
+
+        return _probe_many(self._table, self._orths[: self._size], orths)
+
+    def add(
+        self,
+        orth: int,
+        flags: int = 0,
+        lower: int = 0,
+        shape: int = 0,
+        prefix: int = 0,
+        suffix: int = 0,
+        length: int = 0,
+        lang: int = 0,
+        id: int = None,
+    ) -> LexemeMeta:
+        """Stores a lexeme, replacing the one with the same orth if any.
+
+        Args:
+            orth (int): The hash of the string of the lexeme.
+            flags, lower, shape, prefix, suffix, length, lang: The attributes
+                of the lexeme, see `LexemeMeta`.
+            id (int): The row of the vector of the lexeme, or None.
+
+        Returns:
+            The LexemeMeta view on the lexeme.
+        """
+
+        bucket, row = _probe(self._table, self._orths, orth)
+
+        if row < 0:
+
+            if self._size == len(self._orths):
+
+                self._reserve(self._size + 1)
+
+                # The bucket changes if the hash table was rebuilt
+                bucket, _ = _probe(self._table, self._orths, orth)
+
+            row = self._size
+
+            self._orths[row] = orth
+            self._table[bucket] = row
+
+            self._size += 1
+
+        columns = self._columns
+
+        columns["flags"][row] = flags
+        columns["lower"][row] = lower
+        columns["shape"][row] = shape
+        columns["prefix"][row] = prefix
+        columns["suffix"][row] = suffix
+        columns["length"][row] = length
+        columns["lang"][row] = lang
+        columns["id"][row] = -1 if id is None else id
+
+        return LexemeMeta(self, orth, row)
+
+    def add_many(self, orths: np.ndarray, **columns: np.ndarray) -> None:
+        """Stores several new lexemes at once.
+
+        Args:
+            orths (np.ndarray): The distinct orths of the lexemes, none of
+                which should be stored yet.
+            columns (np.ndarray): The values of the attributes of the lexemes, by
+                attribute name, as in `add()`. Missing attributes are set to 0.
+                In the `id` column, -1 stands for None.
+        """
+
+        orths = np.asarray(orths, dtype=np.uint64)
+
+        start = self._size
+        size = start + len(orths)
+
+        self._reserve(size)
+
+        self._orths[start:size] = orths
+
+        for name in LEX_STORE_COLUMNS:
+            self._columns[name][start:size] = columns.get(name, 0)
+
+        self._size = size
+
+        _insert_keys(self._table, self._orths, np.arange(start, size))
+
+    def remove_many(self, orths: Iterable[int]) -> int:
+        """Removes several lexemes at once. The columns are compacted and the
+        hash table is rebuilt, so this takes a time proportional to the
+        number of lexemes stored.
+
+        Args:
+            orths (iterable of int): The orths of the lexemes to remove.
+
+        Returns:
+            The number of lexemes removed.
+        """
+
+        remove = np.isin(self.orths, np.fromiter(orths, dtype=np.uint64))
+
+        n_removed = int(remove.sum())
+
+        if n_removed == 0:
+            return 0
+
+        keep = ~remove
+
+        size = self._size - n_removed
+
+        self._orths[:size] = self.orths[keep]
+
+        for name in LEX_STORE_COLUMNS:
+            self._columns[name][:size] = self.column(name)[keep]
+
+        self._size = size
+
+        self._rebuild_table()
+
+        self.generation += 1
+
+        return n_removed
+
+    def clear(self) -> None:
+        """Removes all the lexemes."""
+
+        self._size = 0
+        self._table[:] = -1
+
+        self.generation += 1
+
+    def get(self, orth: int, default: Optional[LexemeMeta] = None) -> Optional[LexemeMeta]:
+        """Returns the LexemeMeta view on the lexeme `orth`, or `default` if it
+        is not stored.
+        """
+
+        row = _probe(self._table, self._orths, orth)[1]
+
+        if row < 0:
+            return default
+
+        return LexemeMeta(self, orth, row)
+
+    def __getitem__(self, orth: int) -> LexemeMeta:
+
+        lex_meta = self.get(orth)
+
+        if lex_meta is None:
+            raise KeyError(orth)
+
+        return lex_meta
+
+    def __delitem__(self, orth: int) -> None:
+
+        if not self.remove_many([orth]):
+            raise KeyError(orth)
+
+    def __contains__(self, orth: int) -> bool:
+
+        return self.find(orth) >= 0
+
+    def __len__(self) -> int:
+
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over the orths of the lexemes."""
+
+        return iter(self.orths.tolist())
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the columns and the hash table."""
+
+        return (
+            self._orths.nbytes
+            + sum(column.nbytes for column in self._columns.values())
+            + self._table.nbytes
+        )
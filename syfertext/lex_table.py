@@ -0,0 +1,194 @@
+"""A precomputed table of the lexical attributes of the words of a language
+model vocabulary.
+
+Computing a `LexemeMeta` calls every getter in `LEX_ATTRS`, which is slow
+when many new words are seen, e.g. by a freshly started worker. The table
+is built once for the whole model vocabulary, shipped with the model and
+read by `Vocab.get_lex_meta()` instead.
+
+Usage:
+    python -m syfertext.lex_table en_core_web_lg words.txt lex_table
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from typing import Dict
+from typing import Iterable
+
+from .string_store import CompactStringStore
+
+
+# The fields of a row of the table. `id` is the row of the vector of
+# the word, or -1 if it has no vector.
+LEX_TABLE_DTYPE = np.dtype(
+    [
+        ("orth", "<u8"),
+        ("flags", "<u8"),
+        ("lower", "<u8"),
+        ("shape", "<u8"),
+        ("prefix", "<u8"),
+        ("suffix", "<u8"),
+        ("length", "<u4"),
+        ("id", "<i8"),
+    ]
+)
+
+# The names of the files of a table saved with `LexTable.to_disk()`
+LEXEMES_FILE = "lexemes.npy"
+STRINGS_FILE = "strings"
+
+
+class LexTable:
+    """A read-only table of precomputed `LexemeMeta` attributes, sorted by orth."""
+
+    def __init__(self, data: np.ndarray, strings: CompactStringStore):
+        """Initializes the LexTable object.
+
+        Args:
+            data (np.ndarray): A structured array of dtype `LEX_TABLE_DTYPE`
+                sorted by orth.
+            strings (CompactStringStore): A store holding the strings of the
+                orth, lower, shape, prefix and suffix attributes of every row.
+        """
+
+        assert data.dtype == LEX_TABLE_DTYPE, "Argument `data` should be of dtype `LEX_TABLE_DTYPE`"
+
+        # Index memory-mapped arrays as plain arrays, which is much faster
+        self.data = data.view(np.ndarray)
+        self.strings = strings
+
+        # The sorted orths, used to find the row of an orth. They are copied
+        # since searching a strided field of the table copies it every time.
+        self.orths = np.ascontiguousarray(self.data["orth"])
+
+    def find(self, orth: int) -> int:
+        """Returns the index of the row of `orth`, or -1 if it is not in the table."""
+
+        index = int(np.searchsorted(self.orths, np.uint64(orth)))
+
+        if index < len(self.orths) and int(self.orths[index]) == orth:
+            return index
+
+        return -1
+
+    def row(self, index: int) -> Dict[str, int]:
+        """Returns the attributes of the lexeme of the row at `index`, as a dict
+        that can be passed to `LexStore.add()`.
+
+        The `lang` attribute is not part of the table.
+        """
+
+        orth, flags, lower, shape, prefix, suffix, length, row = self.data[index].tolist()
+
+        return dict(
+            orth=orth,
+            flags=flags,
+            lower=lower,
+            shape=shape,
+            prefix=prefix,
+            suffix=suffix,
+            length=length,
+            id=None if row < 0 else row,
+        )
+
+    def __contains__(self, orth: int) -> bool:
+
+        return self.find(orth) >= 0
+
+    def __len__(self) -> int:
+
+        return len(self.data)
+
+    def to_disk(self, path: str) -> None:
+        """Saves the table in the directory `path`, which is created if needed."""
+
+        os.makedirs(path, exist_ok=True)
+
+        np.save(os.path.join(path, LEXEMES_FILE), self.data)
+        self.strings.to_disk(os.path.join(path, STRINGS_FILE))
+
+    @classmethod
+    def from_disk(cls, path: str, mmap: bool = True) -> "LexTable":
+        """Loads a table saved with `to_disk()`.
+
+        Args:
+            path (str): The directory of the table.
+            mmap (bool): If True, the table and its strings are memory-mapped
+                instead of being read in memory.
+
+        Returns:
+            The LexTable object.
+        """
+
+        data = np.load(os.path.join(path, LEXEMES_FILE), mmap_mode="r" if mmap else None)
+        strings = CompactStringStore.from_disk(os.path.join(path, STRINGS_FILE), mmap=mmap)
+
+        return cls(data, strings)
+
+
+def build_lex_table(vocab: "Vocab", strings: Iterable[str]) -> LexTable:
+    """Computes the lexical attributes of `strings` with the attribute getters
+    of `vocab` and returns them as a LexTable.
+
+    The stop words of `vocab` and its vectors, which give the `id` attribute
+    and the IS_OOV flag, are those used. The table should be rebuilt if any
+    of them changes.
+
+    Args:
+        vocab (Vocab): The vocabulary of the language model.
+        strings (Iterable[str]): The words of the language model vocabulary.
+
+    Returns:
+        The LexTable object.
+    """
+
+    strings = list(dict.fromkeys(strings))
+
+    columns = vocab._compute_lex_metas(strings)
+
+    data = np.zeros(len(strings), dtype=LEX_TABLE_DTYPE)
+
+    for name in LEX_TABLE_DTYPE.names:
+        data[name] = columns.get(name, 0)
+
+    data.sort(order="orth")
+
+    # Keep the strings of the attributes along with the words
+    keys = np.unique(
+        np.concatenate([data[field] for field in ["orth", "lower", "shape", "prefix", "suffix"]])
+    )
+    keys = keys[keys != 0]
+
+    return LexTable(data, CompactStringStore(vocab.store.lookup_many(keys)))
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Builds the lexeme table of a language model.")
+    parser.add_argument("model_name", help="name of the language model, e.g. en_core_web_lg")
+    parser.add_argument("words", help="path of a text file holding one word per line")
+    parser.add_argument("output", help="directory to save the table to")
+    args = parser.parse_args()
+
+    # Imported here since `vocab` imports this module
+    from .vocab import Vocab
+
+    with open(args.words, encoding="utf-8") as f:
+        strings = [line.rstrip("\n") for line in f if line.rstrip("\n")]
+
+    vocab = Vocab(args.model_name)
+
+    # Load the vectors so that the vector rows are part of the table
+    vocab.vectors.has_vector("")
+
+    table = build_lex_table(vocab, strings)
+    table.to_disk(args.output)
+
+    print(f"{len(table)} lexemes saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,136 @@
 from .attrs import Attributes
 
+from typing import Optional
 from typing import Union
 
 
-class LexemeMeta(object):
+# The LexemeMeta attributes set by the attribute getters that are not flags
+LEX_META_FIELDS = {
+    Attributes.ID: "id",
+    Attributes.LOWER: "lower",
+    Attributes.SHAPE: "shape",
+    Attributes.PREFIX: "prefix",
+    Attributes.SUFFIX: "suffix",
+    Attributes.LANG: "lang",
+}
+
+
+class LexemeMeta:
     """This class holds some meta data about a Lexeme from the text held by a Doc object.
     This allows to create a Lexeme object when needed.
+
+    It is a view on the row of the lexeme in the `LexStore` of the vocabulary:
+    reading or setting an attribute reads or sets the value in the store.
     """
 
-    def __init__(self):
+    __slots__ = ("store", "orth", "_row", "_generation")
+
+    def __init__(self, store: "LexStore", orth: int, row: int):
         """Initializes a LexemeMeta object
+
+        Args:
+            store (LexStore): The store holding the lexeme.
+            orth (int): The hash of the string of the lexeme.
+            row (int): The row of the lexeme in the store.
         """
 
-        self.flags = 0
-        self.lang = 0
-        self.id = 0
-        self.length = 0
-        self.orth = 0
-        self.lower = 0
-        self.shape = 0
-        self.prefix = 0
-        self.suffix = 0
+        self.store = store
+        self.orth = orth
+
+        self._row = row
+        self._generation = store.generation
+
+    def _index(self) -> int:
+        """Returns the row of the lexeme, finding it again if lexemes were
+        removed from the store since it was last known.
+        """
+
+        if self._generation != self.store.generation:
+
+            row = self.store.find(self.orth)
+
+            if row < 0:
+                raise KeyError(f"The lexeme {self.orth} was removed from the lex store")
+
+            self._row = row
+            self._generation = self.store.generation
+
+        return self._row
+
+    @property
+    def flags(self) -> int:
+        """The bits of the boolean attributes, see `check_flag()`."""
+        return int(self.store._columns["flags"][self._index()])
+
+    @flags.setter
+    def flags(self, flags: int):
+        self.store._columns["flags"][self._index()] = flags
+
+    @property
+    def lang(self) -> int:
+        """The orth id of the language of the parent vocabulary."""
+        return int(self.store._columns["lang"][self._index()])
+
+    @lang.setter
+    def lang(self, lang: int):
+        self.store._columns["lang"][self._index()] = lang
+
+    @property
+    def id(self) -> Optional[int]:
+        """The row of the vector of the lexeme, or None."""
+
+        row = int(self.store._columns["id"][self._index()])
+
+        return None if row < 0 else row
+
+    @id.setter
+    def id(self, id: Optional[int]):
+        self.store._columns["id"][self._index()] = -1 if id is None else id
+
+    @property
+    def length(self) -> int:
+        """The number of characters of the lexeme."""
+        return int(self.store._columns["length"][self._index()])
+
+    @length.setter
+    def length(self, length: int):
+        self.store._columns["length"][self._index()] = length
+
+    @property
+    def lower(self) -> int:
+        """The orth id of the lowercase form of the lexeme."""
+        return int(self.store._columns["lower"][self._index()])
+
+    @lower.setter
+    def lower(self, lower: int):
+        self.store._columns["lower"][self._index()] = lower
+
+    @property
+    def shape(self) -> int:
+        """The orth id of the shape of the lexeme."""
+        return int(self.store._columns["shape"][self._index()])
+
+    @shape.setter
+    def shape(self, shape: int):
+        self.store._columns["shape"][self._index()] = shape
+
+    @property
+    def prefix(self) -> int:
+        """The orth id of the first character of the lexeme."""
+        return int(self.store._columns["prefix"][self._index()])
+
+    @prefix.setter
+    def prefix(self, prefix: int):
+        self.store._columns["prefix"][self._index()] = prefix
+
+    @property
+    def suffix(self) -> int:
+        """The orth id of the last three characters of the lexeme."""
+        return int(self.store._columns["suffix"][self._index()])
+
+    @suffix.setter
+    def suffix(self, suffix: int):
+        self.store._columns["suffix"][self._index()] = suffix
 
     def set_lexmeta_attr(self, attr_id: int, value: Union[int, bool]) -> None:
         """ Sets all the attributes for given attribute id for LexemeMeta object 
@@ -39,23 +149,8 @@ class LexemeMeta(object):
 
         # Assign the rest of the `LexemeMeta` object attributes.
         # length and orth attributes are assigned in Vocab class.
-        elif attr_id == Attributes.ID:
-            self.id = value
-
-        elif attr_id == Attributes.LOWER:
-            self.lower = value
-
-        elif attr_id == Attributes.SHAPE:
-            self.shape = value
-
-        elif attr_id == Attributes.PREFIX:
-            self.prefix = value
-
-        elif attr_id == Attributes.SUFFIX:
-            self.suffix = value
-
-        elif attr_id == Attributes.LANG:
-            self.lang = value
+        elif attr_id in LEX_META_FIELDS:
+            setattr(self, LEX_META_FIELDS[attr_id], value)
 
     # These 2 methods for checking and setting flags for
     # boolean attributes for Lexeme class are taken from Spacy.
@@ -113,6 +208,8 @@ class Lexeme:
     It holds various non-contextual attributes related to the corresponding string.  
     """
 
+    __slots__ = ("vocab", "orth", "lex_meta", "__weakref__")
+
     def __init__(self, vocab: "Vocab", orth: int) -> None:
         """Initializes a Lexeme object.
 
@@ -128,6 +225,9 @@ class Lexeme:
         # Note: This creates no entry in lex_store if the LexemeMeta is not already present
         self.lex_meta = vocab.get_lex_meta(orth)
 
+        # In bounded mode, the strings of the lexeme are not evicted while it is alive
+        vocab.track_lexeme(self)
+
     def check_flag(self, flag_id: int) -> bool:
         """Checks the value of a boolean flag. This method is inspired from Spacy.
         Args:
@@ -155,8 +255,13 @@ class Lexeme:
 
     @property
     def has_vector(self):
-        """Whether the word has a vector in vocabulary or not."""
-        return self.vocab.has_vector(self.orth_)
+        """Whether the word has a vector in vocabulary or not.
+
+        After `Vocab.prune_vectors()`, this is also True for the words whose
+        vector was removed, since they get the nearest kept vector.
+        """
+        self.vocab.refresh_vector_rows()
+        return self.lex_meta.id is not None
 
     @property
     def vector_norm(self) -> float:
@@ -168,12 +273,16 @@ class Lexeme:
     def vector(self):
         """ Returns the  vector of a given word in the vocabulary."""
 
-        return self.vocab.get_vector(self.lex_meta.orth)
+        self.vocab.refresh_vector_rows()
+
+        return self.vocab.vectors.vector_at(self.lex_meta.id)
 
     @property
     def rank(self):
         """ The key to index in the vectors array."""
 
+        self.vocab.refresh_vector_rows()
+
         return self.lex_meta.id
 
     @property
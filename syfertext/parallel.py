@@ -0,0 +1,166 @@
+"""Helpers used by `Language.pipe()` to run the tokenizer in a pool of
+worker processes.
+
+Each worker process builds its own `Tokenizer` (and `Vocab`) from the
+language model name at startup, so the word vectors are never pickled and
+sent to it. Tokenized documents are shipped back to the parent process as
+compact payloads: an array of orth values, one byte per token telling
+whether the token is followed by a space, and an array of the positions
+of the tokens in the text. Strings that the parent process
+might not know yet are shipped along with the payloads.
+"""
+
+from .tokenizer import Tokenizer
+from .doc import Doc
+from .vocab import Vocab
+
+import numpy as np
+
+from array import array
+
+from typing import List
+from typing import Tuple
+from typing import Dict
+
+# The tokenizer of the current worker process. It is created by `init_worker()`
+_tokenizer = None
+
+# The orth values whose strings were already shipped to the parent process
+_shipped = set()
+
+# Whether the strings of every batch should be shipped, even if they were
+# shipped before. It is set by `init_worker()`.
+_reship = False
+
+
+def get_tokenizer_config(tokenizer: Tokenizer) -> Dict[str, object]:
+    """Returns the arguments needed to create a copy of `tokenizer` in a
+    worker process, except for the vocabulary.
+
+    Args:
+        tokenizer (Tokenizer): The tokenizer to copy.
+
+    Returns:
+        dict: The keyword arguments of the `Tokenizer` constructor.
+    """
+
+    return dict(
+        exceptions=tokenizer.exceptions,
+        prefix_search=tokenizer.prefix_search,
+        suffix_search=tokenizer.suffix_search,
+        infix_finditer=tokenizer.infix_finditer,
+        cache_size=tokenizer.cache_info()["maxsize"],
+    )
+
+
+def init_worker(
+    model_name: str,
+    config: Dict[str, object],
+    store_path: str = None,
+    reship: bool = False,
+    max_strings: int = None,
+    compact_store: bool = False,
+) -> None:
+    """Initializes a worker process by creating its tokenizer.
+
+    Args:
+        model_name (str): The name of the language model.
+        config (dict): The keyword arguments of the `Tokenizer` constructor
+            as returned by `get_tokenizer_config()`.
+        store_path (str): The path of a string store file to memory-map as
+            the store of the vocabulary, if any.
+        reship (bool): If True, the strings of every batch are shipped to the
+            parent process, which is needed if it might evict them.
+        max_strings (int): The `max_strings` bound of the vocabulary of the
+            worker process, like that of the parent process. Since the Docs
+            of the worker process are discarded once shipped, its vocabulary
+            stays bounded across batches.
+        compact_store (bool): If True, the vocabulary of the worker process
+            holds its strings in a `CompactStringStore`.
+    """
+
+    global _tokenizer
+    global _reship
+
+    # A memory-mapped store is always a compact one
+    vocab = Vocab(
+        model_name,
+        compact_store=compact_store or store_path is not None,
+        max_strings=max_strings,
+        store_path=store_path,
+    )
+
+    _tokenizer = Tokenizer(vocab=vocab, **config)
+
+    _shipped.clear()
+
+    _reship = reship
+
+
+def tokenize_batch(texts: List[str]) -> Tuple[List[Tuple[array, bytes, array]], List[str]]:
+    """Tokenizes a batch of texts in a worker process.
+
+    Args:
+        texts (list of str): The texts to tokenize.
+
+    Returns:
+        (tuple): A list holding one `(orths, spaces, idxs)` payload per text,
+            and the list of strings used by these payloads that were not
+            shipped to the parent process before.
+    """
+
+    store = _tokenizer.vocab.store
+
+    if _reship:
+        _shipped.clear()
+
+    payloads = []
+    new_orths = []
+
+    # The Docs of the batch are kept alive until their strings are looked
+    # up, so that a bounded vocabulary does not evict them in the meantime
+    docs = []
+
+    for text in texts:
+
+        doc = _tokenizer(text)
+        docs.append(doc)
+
+        orths = array("Q", doc.container.orths.tobytes())
+        spaces = doc.container.spaces.tobytes()
+        idxs = array("q", doc.container.idxs.tobytes())
+
+        payloads.append((orths, spaces, idxs))
+
+        # Collect the strings the parent process does not know about yet
+        for orth in orths:
+
+            if orth not in _shipped:
+                _shipped.add(orth)
+                new_orths.append(orth)
+
+    return payloads, store.lookup_many(new_orths)
+
+
+def doc_from_payload(vocab: Vocab, payload: Tuple[array, bytes, array], text: str) -> Doc:
+    """Creates a Doc object from a payload returned by `tokenize_batch()`.
+
+    The strings of the payload should have been added to `vocab.store`
+    beforehand.
+
+    Args:
+        vocab (Vocab): The vocabulary of the parent process.
+        payload (tuple): The `(orths, spaces, idxs)` payload of a tokenized text.
+        text (str): The tokenized text.
+
+    Returns:
+        (Doc): The tokenized document.
+    """
+
+    orths, spaces, idxs = payload
+
+    doc = Doc(vocab, text=text)
+
+    doc.container.extend_orths(orths, np.frombuffer(spaces, dtype=np.bool_), idxs)
+
+    return doc
@@ -123,6 +123,26 @@ class SubPipeline(AbstractSendable):
         # Execute the first pipe in the subpipeline
         doc = self.subpipeline[0](input)
 
+        # Execute the rest of the pipes
+        return self.resume(doc=doc, start=1)
+
+    def resume(self, doc: Doc, start: int) -> Union[int, str, Doc]:
+        """Executes the pipes of the subpipeline starting from the one at
+        position `start`.
+
+        This is used when the first `start` pipes have already been applied
+        to `doc` by other means, for instance when the tokenizer is run in a
+        separate process.
+
+        Args:
+            doc (Doc): The Doc object created by the first `start` pipes.
+            start (int): The position of the first pipe to execute.
+
+        Returns:
+            (int, str, Doc): Either the modified Doc object,
+                or the ID of that Doc object (str or int).
+        """
+
         # set the owner of the Doc object to this SupPipeline's owner
         doc.owner = self.owner
 
@@ -135,7 +155,7 @@ class SubPipeline(AbstractSendable):
         doc.client_id = self.client_id
 
         # Execute the  rest of pipes in the subpipeline
-        for pipe in self.subpipeline[1:]:
+        for pipe in self.subpipeline[start:]:
             doc = pipe(doc)
 
         # If the Language object using this subpipeline
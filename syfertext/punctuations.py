@@ -7,6 +7,7 @@ from .char_classes import LIST_PUNCT, LIST_ELLIPSES, LIST_QUOTES, LIST_CURRENCY
 from .char_classes import LIST_ICONS, HYPHENS, CURRENCY, UNITS
 from .char_classes import CONCAT_QUOTES, ALPHA_LOWER, ALPHA_UPPER, ALPHA, PUNCT
 from .utils import compile_suffix_regex, compile_infix_regex, compile_prefix_regex
+from .affix_matcher import PrefixMatcher, SuffixMatcher
 import re
 
 
@@ -57,3 +58,7 @@ TOKENIZER_INFIXES = _infixes
 suffix_re = compile_suffix_regex(_suffixes)
 prefix_re = compile_prefix_regex(_prefixes)
 infix_re = compile_infix_regex(_infixes)
+
+# Faster drop-in replacements for `prefix_re.search` and `suffix_re.search`
+prefix_matcher = PrefixMatcher(_prefixes)
+suffix_matcher = SuffixMatcher(_suffixes)
@@ -1,5 +1,6 @@
 import syft
 import torch
+import numpy as np
 
 hook = syft.TorchHook(torch)
 
@@ -52,10 +53,19 @@ class Span(AbstractObject):
         # The owner of the span object will be same worker where doc resides
         self.owner = doc.owner
 
-        # Initialize the Underscore object (inspired by spaCy)
-        # This object will hold all the custom attributes set
-        # using the `self.set_attribute` method
-        self._ = Underscore()
+        # The Underscore object (inspired by spaCy) holding the custom
+        # attributes set using the `self.set_attribute` method. It is
+        # only created when it is first accessed.
+        self._underscore = None
+
+    @property
+    def _(self) -> Underscore:
+        """The Underscore object holding the custom attributes of the span."""
+
+        if self._underscore is None:
+            self._underscore = Underscore()
+
+        return self._underscore
 
     def set_attribute(self, name: str, value: object):
         """Creates a custom attribute with the name `name` and
@@ -73,6 +83,49 @@ class Span(AbstractObject):
 
         setattr(self._, name, value)
 
+    def has_attribute(self, name: str) -> bool:
+        """Returns `True` if the Underscore object `self._` has an attribute `name`. otherwise returns `False`
+
+        Args:
+            name (str): name of the custom attribute.
+
+        Returns:
+            attr_exists (bool): `True` if `self._.name` exists, otherwise `False`
+        """
+
+        # `True` if `self._` has attribute `name`, `False` otherwise
+        attr_exists = self._underscore is not None and hasattr(self._underscore, name)
+
+        return attr_exists
+
+    def remove_attribute(self, name: str):
+        """Removes the attribute `name` from the Underscore object `self._`
+
+        Args:
+            name (str): name of the custom attribute.
+        """
+
+        # Before removing the attribute, check if it exists
+        assert self.has_attribute(name), f"Span does not have the attribute {name}"
+
+        delattr(self._, name)
+
+    def get_attribute(self, name: str):
+        """Returns value of custom attribute with the name `name` if it is present, else raises `AttributeError`.
+
+        Args:
+            name (str): name of the custom attribute.
+
+        Returns:
+            value (obj): value of the custom attribute with name `name`.
+        """
+
+        # Avoid creating an Underscore object if the span has none
+        if self._underscore is None:
+            raise AttributeError(f"Span does not have the attribute {name}")
+
+        return getattr(self._underscore, name)
+
     def __getitem__(self, key: Union[int, slice]):
         """Returns a Token object at position `key` or returns Span using slice `key` or the
         id of the Token object or id of the Span object at remote location.
@@ -128,6 +181,29 @@ class Span(AbstractObject):
 
             return span
 
+    @property
+    def text(self) -> str:
+        """The text of the span, without the white space following its last token."""
+
+        if self.doc._text is not None:
+            return self.doc._slice_text(self.start, self.end, with_ws=False)
+
+        text = self.text_with_ws
+
+        if self.end > self.start and self.doc.container[self.end - 1].space_after:
+            text = text[:-1]
+
+        return text
+
+    @property
+    def text_with_ws(self) -> str:
+        """The text of the span, with the white space following its last token if any."""
+
+        if self.doc._text is not None:
+            return self.doc._slice_text(self.start, self.end, with_ws=True)
+
+        return "".join(token.text_with_ws for token in self)
+
     def __len__(self):
         """Return the number of tokens in the Span."""
         return self.end - self.start
@@ -162,31 +238,39 @@ class Span(AbstractObject):
             span_vector: Span vector ignoring excluded tokens
         """
 
-        # Get the valid tokens which are to be included
-        valid_tokens = self._get_valid_tokens(excluded_tokens)
+        vectors = self.doc.vocab.vectors
 
-        vectors = None
+        # Get the vector rows of the valid tokens which have a vector
+        rows = self.doc.vocab.get_vector_rows(self._get_valid_orths(excluded_tokens))
+        rows = rows[rows >= 0]
 
-        # Count the tokens that have vectors
-        vector_count = 0
+        # If no tokens with vectors were found, just get the default vector(zeros)
+        if len(rows) == 0:
+            span_vector = vectors.vector_at(None)
+        else:
+            # The Span vector, which is the average of all vectors
+            span_vector = vectors.vectors_at(rows).sum(dim=0) / len(rows)
 
-        for token in valid_tokens:
+        return span_vector
 
-            if token.has_vector:
-                # Increment the vector counter
-                vector_count += 1
+    def _get_valid_orths(self, excluded_tokens: Dict[str, Set[object]] = None) -> np.ndarray:
+        """Returns the orths of the tokens which are not excluded, see `_get_valid_tokens()`.
 
-                # Accumulate token's vector by summing them
-                vectors = token.vector if vectors is None else vectors + token.vector
+        Args:
+            excluded_tokens (Dict): A dictionary used to ignore tokens of the document based on values
+                of their attributes.
 
-        # If no tokens with vectors were found, just get the default vector(zeros)
-        if vector_count == 0:
-            span_vector = self.doc.vocab.vectors.default_vector
-        else:
-            # The Doc vector, which is the average of all vectors
-            span_vector = vectors / vector_count
+        Returns:
+            The uint64 array of the orths of the valid tokens, in the order of the tokens.
+        """
 
-        return span_vector
+        # Tokens are only created if some of them have to be excluded
+        if not excluded_tokens:
+            return self.doc.container.orths[self.start : self.end]
+
+        valid_tokens = self._get_valid_tokens(excluded_tokens)
+
+        return np.fromiter((token.orth for token in valid_tokens), dtype=np.uint64)
 
     def _get_valid_tokens(
         self, excluded_tokens: Dict[str, Set[object]] = None
@@ -239,13 +323,10 @@ class Span(AbstractObject):
         # Create a new doc object on the required location
         # Assign the same owner on which this object resides
         # Client of the doc created will be same as the span's client
-        doc = Doc(self.doc.vocab, owner=self.owner, client_id=self.client_id)
-
-        # Iterate over the token_meta present in span
-        for idx in range(self.start, self.end):
+        doc = Doc(self.doc.vocab, owner=self.owner, client_id=self.client_id, text=self.doc._text)
 
-            # Add token meta object to the new doc
-            doc.container.append(self.doc.container[idx])
+        # Copy the tokens present in span to the new doc
+        doc.container = self.doc.container[self.start : self.end]
 
         # Same reason as explained in __getitem__ above
         if doc.owner.id != doc.client_id:
@@ -1,4 +1,15 @@
 from .utils import hash_string
+from .utils import hash_strings
+
+import itertools
+import sys
+
+import numpy as np
+
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 
@@ -19,9 +30,16 @@ class StringStore:
         # str_to_key maps strings to hashes; i.e it stores (key == string : value == hash)
         self.str_to_key = {}
 
+        # The number of pinned strings, which `evict()` never removes. They
+        # are the first strings of the dicts since dicts keep insertion order.
+        self._n_pinned = 0
+
+        # Incremented every time strings are evicted, so that objects holding
+        # keys, like the tokenizer cache, know when to drop them
+        self.generation = 0
+
         if strings is not None:  # load strings
-            for word in strings:
-                self.add(word)
+            self.add_many(strings)
 
     def __contains__(self, string):
         """Check whether string is in the store
@@ -101,3 +119,932 @@ class StringStore:
         """Get the number of strings in the store."""
 
         return len(self.str_to_key)
+
+    def add_many(self, strings: Iterable[str]) -> np.ndarray:
+        """Add several strings to the StringStore at once. This is faster than
+        calling `add()` for each string.
+
+        Args:
+            strings (iterable of str): The strings to add to store
+
+        Returns:
+            keys (np.ndarray): The uint64 array of the hash keys of the strings
+        """
+
+        strings = list(strings)
+
+        _check_strings(strings)
+
+        # Only hash the distinct strings that are not in the store yet
+        new_strings = [string for string in dict.fromkeys(strings) if string not in self.str_to_key]
+
+        new_keys = hash_strings(new_strings)
+
+        self.str_to_key.update(zip(new_strings, new_keys.tolist()))
+        self.key_to_str.update(zip(new_keys.tolist(), new_strings))
+
+        # All the strings were new and distinct
+        if len(new_strings) == len(strings):
+            return new_keys
+
+        return np.fromiter(
+            map(self.str_to_key.__getitem__, strings), dtype=np.uint64, count=len(strings)
+        )
+
+    def lookup_many(self, keys: Iterable[int]) -> List[str]:
+        """Retrieve the strings of several hash keys at once.
+
+        Args:
+            keys (iterable of int): The hash keys, e.g. a uint64 array
+
+        Returns:
+            strings (list of str): The strings of the keys
+
+        Raises:
+            KeyError: If one of the keys is not in the store.
+        """
+
+        keys = np.asarray(keys, dtype=np.uint64).tolist()
+
+        return list(map(self.key_to_str.__getitem__, keys))
+
+    @property
+    def n_pinned(self) -> int:
+        """The number of pinned strings."""
+
+        return self._n_pinned
+
+    def pin(self) -> None:
+        """Pins all the strings currently in the store, e.g. the strings of
+        the base model, so that `evict()` never removes them.
+        """
+
+        self._n_pinned = len(self.str_to_key)
+
+    def unpinned_keys(self) -> np.ndarray:
+        """Returns the uint64 array of the keys of the strings that are not pinned."""
+
+        keys = itertools.islice(self.key_to_str, self._n_pinned, None)
+
+        return np.fromiter(keys, dtype=np.uint64, count=len(self.key_to_str) - self._n_pinned)
+
+    def evict(self, live_keys: np.ndarray) -> np.ndarray:
+        """Removes the strings that are not pinned and whose keys are not in
+        `live_keys`.
+
+        Args:
+            live_keys (np.ndarray): The keys of the strings still referenced.
+
+        Returns:
+            The uint64 array of the keys of the removed strings.
+        """
+
+        unpinned = self.unpinned_keys()
+
+        evicted = unpinned[~np.isin(unpinned, live_keys)]
+
+        for key in evicted.tolist():
+            del self.str_to_key[self.key_to_str.pop(key)]
+
+        if len(evicted):
+            self.generation += 1
+
+        return evicted
+
+    @property
+    def nbytes(self) -> int:
+        """An estimate of the number of bytes used by the dicts, the strings
+        and the keys. It takes a time proportional to the number of strings.
+        """
+
+        # Each key is an int object of 32 bytes
+        size = sys.getsizeof(self.key_to_str) + sys.getsizeof(self.str_to_key)
+        size += 32 * len(self.key_to_str)
+
+        return size + sum(map(sys.getsizeof, self.str_to_key))
+
+    def to_disk(self, path: str) -> None:
+        """Writes the strings of the store to a file that can be loaded by
+        `from_disk()` or memory-mapped by `CompactStringStore.from_disk()`.
+
+        Args:
+            path (str): The path of the file.
+        """
+
+        encoded = [string.encode("utf-8", "surrogatepass") for string in self.str_to_key]
+
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(string) for string in encoded], out=offsets[1:])
+
+        keys = np.fromiter(self.str_to_key.values(), dtype=np.uint64, count=len(encoded))
+
+        _write_strings(path, offsets, keys, b"".join(encoded))
+
+    @classmethod
+    def from_disk(cls, path: str, mmap: bool = False) -> Union["StringStore", "CompactStringStore"]:
+        """Loads the strings written to a file by `to_disk()`. They are
+        pinned.
+
+        Args:
+            path (str): The path of the file.
+            mmap (bool): If True, the file is memory-mapped by a
+                `CompactStringStore`, see `CompactStringStore.from_disk()`,
+                which is returned instead of a StringStore. Its strings are
+                not read, so it loads much faster and uses less memory. If
+                False, all the strings are read in a StringStore.
+
+        Returns:
+            The StringStore object, or the CompactStringStore object if `mmap`
+            is True.
+        """
+
+        if mmap:
+            return CompactStringStore.from_disk(path, mmap=True)
+
+        mapped = MappedStrings(path)
+
+        store = cls()
+
+        # The hashes are read from the file rather than computed again
+        for index, key in enumerate(mapped.keys.tolist()):
+
+            string = mapped.string(index)
+
+            store.str_to_key[string] = key
+            store.key_to_str[key] = string
+
+        # The loaded strings are those of the base model
+        store.pin()
+
+        return store
+
+
+# The first bytes of a file written by `to_disk()`
+MAGIC = b"SYFSTR01"
+
+# The hash tables are grown when they are more than two thirds full
+MAX_LOAD = 2 / 3
+
+
+def _empty_table(capacity: int) -> np.ndarray:
+    """Creates an empty hash table large enough for `capacity` strings.
+
+    Args:
+        capacity (int): The number of strings to hold.
+
+    Returns:
+        The array of buckets.
+    """
+
+    n_buckets = 8
+
+    while n_buckets * MAX_LOAD < capacity:
+        n_buckets *= 2
+
+    return np.full(n_buckets, -1, dtype=np.int32)
+
+
+def _probe(table: np.ndarray, keys: np.ndarray, key: int) -> Tuple[int, int]:
+    """Probes an open-addressing hash table for `key`.
+
+    Args:
+        table (np.ndarray): The hash table. Each bucket holds the index of a
+            string, or -1 if it is empty. Its size is a power of two.
+        keys (np.ndarray): The hashes of the strings.
+        key (int): The hash of a string.
+
+    Returns:
+        A `(bucket, index)` tuple. `index` is the index of the string whose
+        hash is `key`, or -1 if there is none, in which case `bucket`
+        is the empty bucket where it should be inserted.
+    """
+
+    mask = len(table) - 1
+
+    bucket = key & mask
+
+    while True:
+
+        index = table[bucket]
+
+        # Compare Python ints since older NumPy versions compare uint64
+        # values with Python ints as floats
+        if index < 0 or int(keys[index]) == key:
+            return bucket, int(index)
+
+        bucket = (bucket + 1) & mask
+
+
+def _probe_many(table: np.ndarray, keys: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Probes an open-addressing hash table for several keys at once. The
+    keys are probed in rounds: at each round, every key not resolved yet
+    probes its next bucket.
+
+    Args:
+        table (np.ndarray): The hash table.
+        keys (np.ndarray): The hashes of the strings.
+        queries (np.ndarray): The uint64 array of keys to look up.
+
+    Returns:
+        The array of the indices of the strings whose hashes are `queries`,
+        with -1 for the keys that are not found.
+    """
+
+    indices = np.full(len(queries), -1, dtype=np.int64)
+
+    # No key can be found in an empty table
+    if len(keys) == 0:
+        return indices
+
+    mask = len(table) - 1
+
+    pending = np.arange(len(queries))
+    buckets = (queries & np.uint64(mask)).astype(np.int64)
+
+    while len(pending):
+
+        candidates = table[buckets].astype(np.int64)
+
+        empty = candidates < 0
+        found = ~empty & (keys[np.maximum(candidates, 0)] == queries[pending])
+
+        indices[pending[found]] = candidates[found]
+
+        # The other keys probe the next bucket
+        remaining = ~(empty | found)
+
+        pending = pending[remaining]
+        buckets = (buckets[remaining] + 1) & mask
+
+    return indices
+
+
+def _decode_many(buffer: object, offsets: np.ndarray, indices: np.ndarray) -> List[str]:
+    """Decodes several strings of an arena.
+
+    Args:
+        buffer (bytes-like): The arena.
+        offsets (np.ndarray): The offsets of the strings in the arena.
+        indices (np.ndarray): The indices of the strings to decode.
+
+    Returns:
+        The list of strings.
+    """
+
+    starts = offsets[indices].tolist()
+    ends = offsets[indices + 1].tolist()
+
+    return [str(buffer[start:end], "utf-8", "surrogatepass") for start, end in zip(starts, ends)]
+
+
+def _check_strings(strings: List[str]) -> None:
+    """Raises a TypeError if one of `strings` is not a `str`.
+
+    Args:
+        strings (list): The strings to check.
+    """
+
+    # Checking the set of types avoids a Python call per string in the usual case
+    if set(map(type, strings)) <= {str}:
+        return
+
+    for string in strings:
+
+        if not isinstance(string, str):
+            raise TypeError(
+                f"Argument `strings` holds an item of type `{type(string)}`. Expected type is `str`"
+            )
+
+
+def _insert_keys(table: np.ndarray, keys: np.ndarray, indices: np.ndarray) -> None:
+    """Inserts the strings at `indices` into the empty buckets of `table`.
+    The strings are inserted in rounds: at each round, every string not
+    inserted yet probes its next bucket, and the first string of each
+    empty bucket is inserted there.
+
+    Args:
+        table (np.ndarray): The hash table.
+        keys (np.ndarray): The hashes of the strings.
+        indices (np.ndarray): The indices of the strings to insert.
+    """
+
+    mask = len(table) - 1
+
+    buckets = (keys[indices] & np.uint64(mask)).astype(np.int64)
+
+    while len(indices):
+
+        # The strings probing an empty bucket
+        free = table[buckets] < 0
+
+        # Only one string can be inserted per bucket
+        _, first = np.unique(buckets[free], return_index=True)
+        inserted = np.flatnonzero(free)[first]
+
+        table[buckets[inserted]] = indices[inserted]
+
+        # The other strings probe the next bucket
+        remaining = np.ones(len(indices), dtype=np.bool_)
+        remaining[inserted] = False
+
+        indices = indices[remaining]
+        buckets = (buckets[remaining] + 1) & mask
+
+
+def _write_strings(path: str, offsets: np.ndarray, keys: np.ndarray, arena: bytes) -> None:
+    """Writes strings to a file that can be memory-mapped by `MappedStrings`.
+
+    The file starts with a 32-byte header made of `MAGIC` and the number of
+    strings, of hash table buckets and of arena bytes as little-endian
+    64-bit integers. It is followed by the offsets of the strings in the
+    arena (int64), their hashes (uint64), the hash table (int32) and the
+    UTF-8 arena. All arrays are aligned on their item size.
+
+    Args:
+        path (str): The path of the file.
+        offsets (np.ndarray): The offsets of the strings in the arena, with
+            one more item holding the size of the arena.
+        keys (np.ndarray): The hashes of the strings.
+        arena (bytes): The UTF-8 encoded strings, one after the other.
+    """
+
+    table = _empty_table(len(keys))
+    _insert_keys(table, keys, np.arange(len(keys)))
+
+    header = np.array([len(keys), len(table), len(arena)], dtype="<u8")
+
+    with open(path, "wb") as f:
+
+        f.write(MAGIC)
+        f.write(header.tobytes())
+        f.write(offsets.astype("<i8").tobytes())
+        f.write(keys.astype("<u8").tobytes())
+        f.write(table.astype("<i4").tobytes())
+        f.write(arena)
+
+
+class MappedStrings:
+    """The strings of a file written by `to_disk()`, memory-mapped read-only.
+    Opening the file takes the same time whatever the number of strings,
+    and all processes mapping it share the same page-cached copy.
+    """
+
+    def __init__(self, path: str):
+        """Memory-maps the file at `path`.
+
+        Args:
+            path (str): The path of the file.
+        """
+
+        self.path = str(path)
+
+        buffer = np.memmap(self.path, dtype=np.uint8, mode="r")
+
+        if bytes(buffer[:8]) != MAGIC:
+            raise ValueError(f"`{self.path}` is not a string store file")
+
+        n_strings, n_buckets, arena_size = (int(n) for n in buffer[8:32].view("<u8"))
+
+        # The position of each array in the file
+        start = 32
+        keys_start = start + 8 * (n_strings + 1)
+        table_start = keys_start + 8 * n_strings
+        arena_start = table_start + 4 * n_buckets
+
+        self.offsets = buffer[start:keys_start].view("<i8")
+        self.keys = buffer[keys_start:table_start].view("<u8")
+        self.table = buffer[table_start:arena_start].view("<i4")
+        self.arena = buffer[arena_start : arena_start + arena_size]
+
+        # Slicing a memoryview is faster than slicing an array
+        self._buffer = memoryview(self.arena)
+
+    def find(self, key: int) -> int:
+        """Returns the index of the string whose hash is `key`, or -1 if
+        there is none.
+
+        Args:
+            key (int): The hash of a string.
+        """
+
+        return _probe(self.table, self.keys, key)[1]
+
+    def string(self, index: int) -> str:
+        """Returns the string at `index`.
+
+        Args:
+            index (int): The index of the string.
+        """
+
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+
+        return str(self._buffer[start:end], "utf-8", "surrogatepass")
+
+    def find_many(self, keys: np.ndarray) -> np.ndarray:
+        """Returns the indices of the strings whose hashes are `keys`, with -1
+        for the keys that are not found. See `_probe_many()`.
+        """
+
+        return _probe_many(self.table, self.keys, keys)
+
+    def string_many(self, indices: np.ndarray) -> List[str]:
+        """Returns the strings at `indices`."""
+
+        return _decode_many(self._buffer, self.offsets, indices)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class CompactStringStore:
+    """A StringStore holding its strings in a compact form. It has the same
+    `add`, `__getitem__`, `__contains__` and `__len__` methods as `StringStore`.
+
+    All strings are encoded in UTF-8 and concatenated in a single bytes
+    arena. The i-th string added to the store occupies the bytes between
+    `offsets[i]` and `offsets[i + 1]` of the arena, and its hash is
+    `keys[i]`. An open-addressing hash table with linear probing maps
+    hashes to string indices.
+
+    Compared with `StringStore`, this avoids one str object, one int object
+    and two dict entries per string, which makes large stores, like the one
+    holding the vocabulary of a language model, several times smaller.
+    As in spaCy, two strings with the same 64-bit hash are considered equal.
+    """
+
+    def __init__(self, strings=None, capacity: int = 1024):
+        """Create the CompactStringStore object
+
+        Args:
+            strings (list): List of Strings to add to store
+            capacity (int): The number of strings that can be added before
+                the arrays need to grow.
+        """
+
+        capacity = max(capacity, 1)
+
+        # The UTF-8 encoded strings, one after the other
+        self._arena = bytearray()
+
+        # The string at index i is `self._arena[self._offsets[i] : self._offsets[i + 1]]`
+        self._offsets = np.zeros(capacity + 1, dtype=np.int64)
+
+        # The hash of the string at index i
+        self._keys = np.zeros(capacity, dtype=np.uint64)
+
+        # The number of strings in the store
+        self._size = 0
+
+        # The open-addressing hash table. Each bucket holds the index of a
+        # string, or -1 if it is empty. Its size is a power of two.
+        self._table = _empty_table(capacity)
+
+        # The memory-mapped strings the store was loaded with by `from_disk()`, if
+        # any. New strings are added to the arrays above, which act as an overlay.
+        self._mapped = None
+
+        # The number of strings added in memory that are pinned, which `evict()`
+        # never removes. They are the first strings of the arrays above.
+        # Memory-mapped strings are always pinned.
+        self._n_pinned = 0
+
+        # Incremented every time strings are evicted, so that objects holding
+        # keys, like the tokenizer cache, know when to drop them
+        self.generation = 0
+
+        if strings is not None:  # load strings
+            self.add_many(strings)
+
+    def _find(self, key: int) -> Tuple[int, int]:
+        """Probes the hash table of the strings added to the store in memory
+        for `key`. See `_probe()`.
+        """
+
+        return _probe(self._table, self._keys, key)
+
+    def _reserve(self, size: int) -> None:
+        """Makes sure that the arrays can hold `size` strings, growing them
+        geometrically if needed, and rebuilds the hash table if it becomes
+        too full.
+
+        Args:
+            size (int): The number of strings to hold.
+        """
+
+        if size <= len(self._keys):
+            return
+
+        capacity = max(size, 2 * len(self._keys))
+
+        offsets = np.zeros(capacity + 1, dtype=np.int64)
+        offsets[: self._size + 1] = self._offsets[: self._size + 1]
+        self._offsets = offsets
+
+        keys = np.zeros(capacity, dtype=np.uint64)
+        keys[: self._size] = self._keys[: self._size]
+        self._keys = keys
+
+        if len(self._table) * MAX_LOAD < capacity:
+
+            self._table = _empty_table(capacity)
+            _insert_keys(self._table, self._keys, np.arange(self._size))
+
+    def _string(self, index: int) -> str:
+        """Decodes the string at `index` in the arena.
+
+        Args:
+            index (int): The index of the string.
+
+        Returns:
+            The string.
+        """
+
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+
+        return self._arena[start:end].decode("utf-8", "surrogatepass")
+
+    def __contains__(self, string):
+        """Check whether string is in the store
+
+        Args:
+            string (str): string to check
+
+        Returns:
+            Boolean: True if string in store else False
+        """
+
+        if not isinstance(string, str):
+            return False
+
+        key = hash_string(string)
+
+        if self._mapped is not None and self._mapped.find(key) >= 0:
+            return True
+
+        return self._find(key)[1] >= 0
+
+    def add(self, string: str):
+        """Add a sting to the StringStore
+
+        Args:
+            string (str): The string to add to store
+
+        Returns:
+            key (int): Hash key for corresponding string
+        """
+
+        if not isinstance(string, str):
+            raise TypeError(
+                f"Argument `string` is of type `{type(string)}`. Expected type is `str`"
+            )
+
+        key = hash_string(string)
+
+        # The string is one of the memory-mapped strings
+        if self._mapped is not None and self._mapped.find(key) >= 0:
+            return key
+
+        bucket, index = self._find(key)
+
+        # The store already contains the string
+        if index >= 0:
+            return key
+
+        if self._size == len(self._keys):
+
+            self._reserve(self._size + 1)
+
+            # The bucket changes if the hash table was rebuilt
+            bucket, _ = self._find(key)
+
+        index = self._size
+
+        self._arena += string.encode("utf-8", "surrogatepass")
+        self._offsets[index + 1] = len(self._arena)
+        self._keys[index] = key
+        self._table[bucket] = index
+
+        self._size += 1
+
+        return key
+
+    def __getitem__(self, string_or_id: Union[str, int]):
+        """Retrieve a string from a given hash or vice-versa.
+        If passed argument is a string which is not found in the store,
+        then it is added to the store and the corresponding key is returned.
+
+        Args:
+            string_or_id (str, int): The hash/string value
+
+        Returns:
+            key or string (int, str): Hash key for argument string or string for corresponding hash key
+        """
+
+        if isinstance(string_or_id, str):
+            return self.add(string_or_id)
+
+        if not isinstance(string_or_id, int):
+            # TODO: Add custom SyferText error messgage
+            raise TypeError(
+                f"Argument `key` is of type `{type(string_or_id)}`. Expected type is `str` or `int`"
+            )
+
+        # Keys are unsigned 64-bit integers
+        if not 0 <= string_or_id < 2 ** 64:
+            raise KeyError(string_or_id)
+
+        if self._mapped is not None:
+
+            index = self._mapped.find(string_or_id)
+
+            if index >= 0:
+                return self._mapped.string(index)
+
+        index = self._find(string_or_id)[1]
+
+        if index < 0:
+            raise KeyError(string_or_id)
+
+        return self._string(index)
+
+    def _find_many(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Looks up several keys in the memory-mapped strings and in the
+        strings added in memory.
+
+        Args:
+            keys (np.ndarray): The uint64 array of keys to look up.
+
+        Returns:
+            A `(mapped_indices, indices)` tuple of arrays. They hold the indices of
+            the keys in the memory-mapped strings and in the strings added in memory,
+            or -1 for the keys that are not found.
+        """
+
+        if self._mapped is not None:
+            mapped_indices = self._mapped.find_many(keys)
+
+        else:
+            mapped_indices = np.full(len(keys), -1, dtype=np.int64)
+
+        indices = np.full(len(keys), -1, dtype=np.int64)
+
+        # Look up the keys that are not memory-mapped
+        missing = np.flatnonzero(mapped_indices < 0)
+        indices[missing] = _probe_many(self._table, self._keys, keys[missing])
+
+        return mapped_indices, indices
+
+    def add_many(self, strings: Iterable[str]) -> np.ndarray:
+        """Add several strings to the StringStore at once. The strings are
+        hashed, looked up and inserted into the hash table in bulk, which is
+        much faster than calling `add()` for each string.
+
+        Args:
+            strings (iterable of str): The strings to add to store
+
+        Returns:
+            keys (np.ndarray): The uint64 array of the hash keys of the strings
+        """
+
+        strings = list(strings)
+
+        _check_strings(strings)
+
+        # Only hash each distinct string once
+        unique_strings = list(dict.fromkeys(strings))
+        unique_keys = hash_strings(unique_strings)
+
+        if len(unique_strings) == len(strings):
+            keys = unique_keys
+
+        else:
+            key_of = dict(zip(unique_strings, unique_keys.tolist()))
+            keys = np.fromiter(
+                map(key_of.__getitem__, strings), dtype=np.uint64, count=len(strings)
+            )
+
+        mapped_indices, indices = self._find_many(unique_keys)
+
+        # The positions in `unique_strings` of the strings to add
+        new = np.flatnonzero((mapped_indices < 0) & (indices < 0))
+
+        if len(new) == 0:
+            return keys
+
+        encoded = [unique_strings[i].encode("utf-8", "surrogatepass") for i in new.tolist()]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+
+        size = self._size + len(encoded)
+
+        self._reserve(size)
+
+        self._offsets[self._size + 1 : size + 1] = len(self._arena) + np.cumsum(lengths)
+        self._keys[self._size : size] = unique_keys[new]
+        self._arena += b"".join(encoded)
+
+        _insert_keys(self._table, self._keys, np.arange(self._size, size))
+
+        self._size = size
+
+        return keys
+
+    def lookup_many(self, keys: Iterable[int]) -> List[str]:
+        """Retrieve the strings of several hash keys at once.
+
+        Args:
+            keys (iterable of int): The hash keys, e.g. a uint64 array
+
+        Returns:
+            strings (list of str): The strings of the keys
+
+        Raises:
+            KeyError: If one of the keys is not in the store.
+        """
+
+        keys = np.asarray(keys, dtype=np.uint64)
+
+        mapped_indices, indices = self._find_many(keys)
+
+        missing = (mapped_indices < 0) & (indices < 0)
+
+        if missing.any():
+            raise KeyError(int(keys[np.argmax(missing)]))
+
+        # All the strings were added in memory
+        if self._mapped is None:
+            return _decode_many(self._arena, self._offsets, indices)
+
+        strings = [None] * len(keys)
+
+        positions = np.flatnonzero(mapped_indices >= 0)
+
+        if len(positions):
+
+            mapped_strings = self._mapped.string_many(mapped_indices[positions])
+
+            for position, string in zip(positions.tolist(), mapped_strings):
+                strings[position] = string
+
+        positions = np.flatnonzero(indices >= 0)
+
+        added_strings = _decode_many(self._arena, self._offsets, indices[positions])
+
+        for position, string in zip(positions.tolist(), added_strings):
+            strings[position] = string
+
+        return strings
+
+    def __len__(self):
+        """Get the number of strings in the store."""
+
+        if self._mapped is not None:
+            return len(self._mapped) + self._size
+
+        return self._size
+
+    @property
+    def n_pinned(self) -> int:
+        """The number of pinned strings, including the memory-mapped strings."""
+
+        if self._mapped is not None:
+            return len(self._mapped) + self._n_pinned
+
+        return self._n_pinned
+
+    def pin(self) -> None:
+        """Pins all the strings currently in the store, e.g. the strings of
+        the base model, so that `evict()` never removes them.
+        """
+
+        self._n_pinned = self._size
+
+    def unpinned_keys(self) -> np.ndarray:
+        """Returns the uint64 array of the keys of the strings that are not pinned."""
+
+        return self._keys[self._n_pinned : self._size].copy()
+
+    def evict(self, live_keys: np.ndarray) -> np.ndarray:
+        """Removes the strings that are not pinned and whose keys are not in
+        `live_keys`. The arena and the arrays are compacted and the hash
+        table is rebuilt.
+
+        Args:
+            live_keys (np.ndarray): The keys of the strings still referenced.
+
+        Returns:
+            The uint64 array of the keys of the removed strings.
+        """
+
+        unpinned = self.unpinned_keys()
+
+        keep = np.isin(unpinned, live_keys)
+
+        evicted = unpinned[~keep]
+
+        if len(evicted) == 0:
+            return evicted
+
+        # Remove the bytes of the evicted strings from the arena
+        start = int(self._offsets[self._n_pinned])
+        lengths = np.diff(self._offsets[self._n_pinned : self._size + 1])
+
+        arena = np.frombuffer(self._arena, dtype=np.uint8)
+        kept_bytes = arena[start:][np.repeat(keep, lengths)].tobytes()
+
+        # The bytearray cannot be resized while a NumPy array uses its memory
+        del arena
+
+        self._arena = self._arena[:start] + kept_bytes
+
+        size = self._n_pinned + int(keep.sum())
+
+        self._offsets[self._n_pinned + 1 : size + 1] = start + np.cumsum(lengths[keep])
+        self._keys[self._n_pinned : size] = unpinned[keep]
+        self._size = size
+
+        self._table = _empty_table(len(self._keys))
+        _insert_keys(self._table, self._keys, np.arange(size))
+
+        self.generation += 1
+
+        return evicted
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the arena, the arrays and the hash table.
+        Memory-mapped strings are not counted since their memory is shared
+        with the other processes mapping the same file.
+        """
+
+        return len(self._arena) + self._offsets.nbytes + self._keys.nbytes + self._table.nbytes
+
+    @property
+    def path(self) -> Optional[str]:
+        """The path of the memory-mapped file the store was loaded from, if any."""
+
+        return None if self._mapped is None else self._mapped.path
+
+    def to_disk(self, path: str) -> None:
+        """Writes all the strings of the store to a file that can be loaded,
+        and memory-mapped, by `from_disk()`.
+
+        Args:
+            path (str): The path of the file.
+        """
+
+        offsets = self._offsets[: self._size + 1]
+        keys = self._keys[: self._size]
+        arena = bytes(self._arena)
+
+        # Put the memory-mapped strings first
+        if self._mapped is not None:
+
+            mapped = self._mapped
+
+            offsets = np.concatenate([mapped.offsets, offsets[1:] + len(mapped.arena)])
+            keys = np.concatenate([mapped.keys, keys])
+            arena = mapped.arena.tobytes() + arena
+
+        _write_strings(path, offsets, keys, arena)
+
+    @classmethod
+    def from_disk(cls, path: str, mmap: bool = True) -> "CompactStringStore":
+        """Loads the strings written to a file by `to_disk()`.
+
+        Args:
+            path (str): The path of the file.
+            mmap (bool): If True, the file is memory-mapped read-only, which takes
+                the same time whatever the number of strings, and lets processes
+                loading the same file share its memory. Strings added later are
+                held in memory by the store. If False, the strings are copied
+                to memory. In both cases, the loaded strings are pinned.
+
+        Returns:
+            The CompactStringStore object.
+        """
+
+        mapped = MappedStrings(path)
+
+        if mmap:
+
+            store = cls()
+            store._mapped = mapped
+
+            return store
+
+        store = cls(capacity=len(mapped))
+
+        store._arena = bytearray(mapped.arena)
+        store._offsets[: len(mapped) + 1] = mapped.offsets
+        store._keys[: len(mapped)] = mapped.keys
+        store._size = len(mapped)
+
+        # The hash table of the file indexes the copied arrays as well
+        store._table = np.array(mapped.table, dtype=np.int32)
+
+        # The loaded strings are those of the base model
+        store.pin()
+
+        return store
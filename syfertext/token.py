@@ -30,20 +30,33 @@ class Token(AbstractObject):
         # corresponding hash value of this token
         self.orth = token_meta.orth
 
-        # LexMeta object for the corresponding token string
-        self.lex_meta = self.doc.vocab.get_lex_meta(self.orth)
+        # LexMeta object for the corresponding token string. It is looked
+        # up in the lex store the first time it is needed.
+        self._lex_meta = None
 
         # Whether the token is followed by a single white space
         self.space_after = token_meta.space_after
         self.position = position
 
-        # Initialize the Underscore object (inspired by spaCy)
-        # This object will hold all the custom attributes set
-        # using the `self.set_attribute` method
-        self._ = token_meta._
+        # The meta data of this token in the Doc container. The Underscore
+        # object holding the custom attributes is taken from it when needed.
+        self._token_meta = token_meta
 
-        # Whether this token has a vector or not
-        self.has_vector = self.doc.vocab.vectors.has_vector(self.orth_)
+    @property
+    def lex_meta(self) -> LexemeMeta:
+        """The LexemeMeta object holding the lexical attributes of the token."""
+
+        if self._lex_meta is None:
+            self._lex_meta = self.doc.vocab.get_lex_meta(self.orth)
+
+        return self._lex_meta
+
+    @property
+    def _(self):
+        """The Underscore object (inspired by spaCy) holding all the custom
+        attributes set using the `self.set_attribute` method.
+        """
+        return self._token_meta._
 
     def set_attribute(self, name: str, value: object):
         """Creates a custom attribute with the name `name` and
@@ -71,8 +84,11 @@ class Token(AbstractObject):
             attr_exists (bool): `True` if `self._.name` exists, otherwise `False`
         """
 
+        # Avoid creating an Underscore object if the token has none
+        underscore = self._token_meta._underscore
+
         # `True` if `self._` has attribute `name`, `False` otherwise
-        attr_exists = hasattr(self._, name)
+        attr_exists = underscore is not None and hasattr(underscore, name)
 
         return attr_exists
 
@@ -98,7 +114,11 @@ class Token(AbstractObject):
             value (obj): value of the custom attribute with name `name`.
         """
 
-        return getattr(self._, name)
+        # Avoid creating an Underscore object if the token has none
+        if self._token_meta._underscore is None:
+            raise AttributeError(f"Token does not have the attribute {name}")
+
+        return getattr(self._token_meta._underscore, name)
 
     def nbor(self, offset=1):
         """Gets the neighbouring token at `self.position + offset` if it exists
@@ -166,10 +186,21 @@ class Token(AbstractObject):
     def __repr__(self):
         return f"Token[{self.orth_}]"
 
+    @property
+    def has_vector(self) -> bool:
+        """Whether this token has a vector or not.
+
+        After `Vocab.prune_vectors()`, this is also True for the tokens whose
+        vector was removed, since they get the nearest kept vector.
+        """
+        self.doc.vocab.refresh_vector_rows()
+        return self.lex_meta.id is not None
+
     @property
     def vector(self):
         """Get the token vector"""
-        return self.doc.vocab.vectors[self.orth_]
+        self.doc.vocab.refresh_vector_rows()
+        return self.doc.vocab.vectors.vector_at(self.lex_meta.id)
 
     @property
     def vector_norm(self) -> torch.Tensor:
@@ -220,7 +251,7 @@ class Token(AbstractObject):
         ), "You need at least two workers in order to encrypt the vector with SMPC"
 
         # Get the vector
-        vector = self.doc.vocab.vectors[self.orth_]
+        vector = self.vector
 
         # Encrypt the vector using SMPC
         vector = vector.fix_precision().share(
@@ -232,24 +263,28 @@ class Token(AbstractObject):
     # Following attributes are inspired from Spacy, they have similar behaviour as in spacy.
     # Some of the attributes are redundant but they are to maintain consistency with other attributes
 
+    @property
+    def idx(self) -> int:
+        """The position of the first character of the token in the text
+        the Doc was created from.
+        """
+        return self._token_meta.idx
+
     @property
     def text_with_ws(self):
         """The text content of the token with the trailing whitespace(if any)."""
-        text = self.orth_
-
-        if self.space_after:
-            return text + " "
-        else:
-            return text
+        return self.orth_ + self.whitespace_
 
     @property
     def lex_id(self):
         """Sequential id of the token's lexical type. Used to index into words vector table"""
+        self.doc.vocab.refresh_vector_rows()
         return self.lex_meta.id
 
     @property
     def rank(self):
         """The index to corresponding word vector in words vector table."""
+        self.doc.vocab.refresh_vector_rows()
         return self.lex_meta.id
 
     @property
@@ -282,7 +317,17 @@ class Token(AbstractObject):
     @property
     def whitespace_(self):
         """The trailing whitespace character, if present."""
-        return " " if self.space_after else ""
+
+        if not self.space_after:
+            return ""
+
+        # Read the actual white space character from the text when it is known
+        if self.doc._text is None:
+            return " "
+
+        end = self.idx + len(self.orth_)
+
+        return self.doc._text[end : end + 1]
 
     @property
     def orth_(self):
@@ -290,7 +335,7 @@ class Token(AbstractObject):
             Exists mostly for consistency with the other
             attributes.
         """
-        return self.doc.vocab.store[self.lex_meta.orth]
+        return self.doc.vocab.store[self.orth]
 
     @property
     def lower_(self):
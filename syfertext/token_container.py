@@ -0,0 +1,269 @@
+from .underscore import Underscore
+
+import numpy as np
+
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+
+class TokenMetaView:
+    """A view on the meta data of one token stored in a `TokenContainer`.
+    It exposes the same attributes as a `TokenMeta` object, so that it
+    can be used wherever a `TokenMeta` object is expected.
+    """
+
+    __slots__ = ("container", "index")
+
+    def __init__(self, container: "TokenContainer", index: int):
+        """Initializes the TokenMetaView object.
+
+        Args:
+            container (TokenContainer): The container holding the token.
+            index (int): The position of the token in the container.
+        """
+
+        self.container = container
+        self.index = index
+
+    @property
+    def orth(self) -> int:
+        """The hash of the string of the token."""
+        return int(self.container._orths[self.index])
+
+    @property
+    def space_after(self) -> bool:
+        """Whether the token is followed by a single white space."""
+        return bool(self.container._spaces[self.index])
+
+    @space_after.setter
+    def space_after(self, space_after: bool):
+        self.container._spaces[self.index] = space_after
+
+    @property
+    def idx(self) -> int:
+        """The position of the first character of the token in the text."""
+        return int(self.container._idxs[self.index])
+
+    @property
+    def _(self) -> Underscore:
+        """The Underscore object holding the custom attributes of the token.
+        It is created the first time it is accessed.
+        """
+
+        underscores = self.container._underscores
+
+        if self.index not in underscores:
+            underscores[self.index] = Underscore()
+
+        return underscores[self.index]
+
+    @property
+    def _underscore(self) -> Optional[Underscore]:
+        """The Underscore object of the token, or None if it was never created."""
+        return self.container._underscores.get(self.index)
+
+
+class TokenContainer:
+    """Holds the tokens of a Doc in columns rather than as a list of
+    `TokenMeta` objects: a NumPy array of orth values, a NumPy array
+    of `space_after` flags and a NumPy array of character offsets.
+    Custom attributes are stored only for the tokens that have some.
+
+    This uses 17 bytes per token instead of a few hundred bytes for a
+    `TokenMeta` object and its Underscore object. The container behaves
+    like a list of `TokenMeta` objects: it supports `len()`, iteration,
+    indexing, slicing, `append()` and `extend()`. Indexing returns a
+    `TokenMetaView` object created on demand.
+    """
+
+    def __init__(self, capacity: int = 16):
+        """Initializes the TokenContainer object.
+
+        Args:
+            capacity (int): The number of tokens that can be stored before
+                the arrays need to grow.
+        """
+
+        # The arrays might be longer than the number of tokens stored
+        self._orths = np.empty(capacity, dtype=np.uint64)
+        self._spaces = np.empty(capacity, dtype=np.bool_)
+        self._idxs = np.empty(capacity, dtype=np.int64)
+
+        # The number of tokens stored
+        self._size = 0
+
+        # Maps the position of a token to its Underscore object, if any
+        self._underscores = dict()
+
+    @property
+    def orths(self) -> np.ndarray:
+        """The array of the orth values of the tokens. It is a view on
+        the storage of the container, not a copy.
+        """
+        return self._orths[: self._size]
+
+    @property
+    def spaces(self) -> np.ndarray:
+        """The array of the `space_after` flags of the tokens. It is a view on
+        the storage of the container, not a copy.
+        """
+        return self._spaces[: self._size]
+
+    @property
+    def idxs(self) -> np.ndarray:
+        """The array of the character offsets of the tokens in the text. It is
+        a view on the storage of the container, not a copy.
+        """
+        return self._idxs[: self._size]
+
+    def _reserve(self, size: int) -> None:
+        """Makes sure that the arrays can hold `size` tokens, growing them
+        geometrically if needed.
+
+        Args:
+            size (int): The number of tokens to hold.
+        """
+
+        capacity = len(self._orths)
+
+        if size <= capacity:
+            return
+
+        capacity = max(size, 2 * capacity)
+
+        orths = np.empty(capacity, dtype=np.uint64)
+        spaces = np.empty(capacity, dtype=np.bool_)
+        idxs = np.empty(capacity, dtype=np.int64)
+
+        orths[: self._size] = self._orths[: self._size]
+        spaces[: self._size] = self._spaces[: self._size]
+        idxs[: self._size] = self._idxs[: self._size]
+
+        self._orths = orths
+        self._spaces = spaces
+        self._idxs = idxs
+
+    def append_orth(self, orth: int, space_after: bool = False, idx: int = 0) -> None:
+        """Appends a token given by its orth value.
+
+        Args:
+            orth (int): The hash of the string of the token.
+            space_after (bool): Whether the token is followed by a single white space.
+            idx (int): The position of the first character of the token in the text.
+        """
+
+        self._reserve(self._size + 1)
+
+        self._orths[self._size] = orth
+        self._spaces[self._size] = space_after
+        self._idxs[self._size] = idx
+
+        self._size += 1
+
+    def extend_orths(
+        self, orths: Iterable[int], spaces: Iterable[bool] = None, idxs: Iterable[int] = None
+    ) -> None:
+        """Appends tokens given by their orth values.
+
+        Args:
+            orths (iterable of int): The hashes of the strings of the tokens.
+            spaces (iterable of bool): Whether each token is followed by a single
+                white space. Defaults to False for all tokens.
+            idxs (iterable of int): The positions of the first characters of the
+                tokens in the text. Defaults to 0 for all tokens.
+        """
+
+        orths = np.asarray(orths, dtype=np.uint64)
+
+        size = self._size + len(orths)
+
+        self._reserve(size)
+
+        self._orths[self._size : size] = orths
+        self._spaces[self._size : size] = False if spaces is None else spaces
+        self._idxs[self._size : size] = 0 if idxs is None else idxs
+
+        self._size = size
+
+    def append(self, token_meta: Union["TokenMeta", TokenMetaView]) -> None:
+        """Appends a token. Its Underscore object is shared with `token_meta`
+        unless it holds no custom attribute.
+
+        Args:
+            token_meta (TokenMeta or TokenMetaView): The meta data of the token.
+        """
+
+        index = self._size
+
+        self.append_orth(token_meta.orth, token_meta.space_after, token_meta.idx)
+
+        # Do not create an Underscore object for a token that has none
+        underscore = token_meta._underscore
+
+        # Empty Underscore objects are not worth storing
+        if underscore is not None and vars(underscore):
+            self._underscores[index] = underscore
+
+    def extend(self, token_metas: Iterable[Union["TokenMeta", TokenMetaView]]) -> None:
+        """Appends several tokens.
+
+        Args:
+            token_metas (iterable): The `TokenMeta` or `TokenMetaView` objects
+                of the tokens.
+        """
+
+        if isinstance(token_metas, TokenContainer):
+
+            # Shift the positions of the custom attributes
+            for index, underscore in token_metas._underscores.items():
+                self._underscores[self._size + index] = underscore
+
+            self.extend_orths(token_metas.orths, token_metas.spaces, token_metas.idxs)
+
+            return
+
+        for token_meta in token_metas:
+            self.append(token_meta)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[TokenMetaView]:
+        for index in range(self._size):
+            yield TokenMetaView(self, index)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[TokenMetaView, "TokenContainer"]:
+        """Returns a view on the token at position `key`, or a new container
+        holding a copy of the tokens in the slice `key`.
+
+        Args:
+            key (int or slice): The position of the token or the slice of tokens.
+
+        Returns:
+            TokenMetaView or TokenContainer.
+        """
+
+        if isinstance(key, slice):
+
+            positions = range(*key.indices(self._size))
+
+            container = TokenContainer(capacity=max(len(positions), 1))
+            container.extend_orths(self.orths[key], self.spaces[key], self.idxs[key])
+
+            # The tokens share their Underscore objects with this container
+            for index, underscore in self._underscores.items():
+
+                if index in positions:
+                    container._underscores[positions.index(index)] = underscore
+
+            return container
+
+        if key < 0:
+            key += self._size
+
+        if not 0 <= key < self._size:
+            raise IndexError("token index out of range")
+
+        return TokenMetaView(self, key)
@@ -1,10 +1,13 @@
 from .doc import Doc
 from .vocab import Vocab
 
-from .punctuations import prefix_re, infix_re, suffix_re
+from .punctuations import prefix_matcher, infix_re, suffix_matcher
+from .affix_matcher import PrefixMatcher
+from .affix_matcher import SuffixMatcher
 from .token_exception import TOKENIZER_EXCEPTIONS
 from .underscore import Underscore
 from .utils import msgpack_code_generator
+from .utils import LRUCache
 
 import re
 
@@ -22,19 +25,41 @@ from typing import Match
 from typing import DefaultDict
 from typing import Dict
 
+# Finds the runs of non-space characters in a text. `\S` matches exactly
+# the characters for which `str.isspace()` is False.
+_non_space_finditer = re.compile(r"\S+").finditer
+
+
+def _searches_offsets(search) -> bool:
+    """Tells whether an affix search function is the `search` method of
+    an affix matcher, which can search part of a string given by offsets
+    without copying it.
+
+    Args:
+        search: The function used to match prefixes or suffixes.
+
+    Returns:
+        bool: True if the function accepts offsets.
+    """
+
+    return isinstance(getattr(search, "__self__", None), (PrefixMatcher, SuffixMatcher))
+
 
 class TokenMeta(object):
     """This class holds some meta data about a token from the text held by a Doc object.
        This allows to create a Token object when needed.
     """
 
-    def __init__(self, hash_key: int, space_after: bool):
+    __slots__ = ("orth", "space_after", "idx", "_underscore")
+
+    def __init__(self, hash_key: int, space_after: bool, idx: int = 0):
         """Initializes a TokenMeta object
 
         Args:
             hash_key(int): hash value of the string stored by the Token object
             space_after (bool): Whether the token is followed by a single white
                 space (True) or not (False).
+            idx (int): The position of the first character of the token in the text.
         """
 
         # stores the hash of the hash of the string
@@ -42,10 +67,21 @@ class TokenMeta(object):
 
         self.space_after = space_after
 
-        # Initialize the Underscore object (inspired by spaCy)
-        # This object will hold all the custom attributes set
-        # using the `self.set_attribute` method
-        self._ = Underscore()
+        self.idx = idx
+
+        # The Underscore object (inspired by spaCy) holding the custom
+        # attributes of the token. Most tokens never get any custom
+        # attribute, so it is only created when it is first accessed.
+        self._underscore = None
+
+    @property
+    def _(self) -> Underscore:
+        """The Underscore object holding the custom attributes of the token."""
+
+        if self._underscore is None:
+            self._underscore = Underscore()
+
+        return self._underscore
 
 
 class Tokenizer(AbstractSendable):
@@ -53,9 +89,10 @@ class Tokenizer(AbstractSendable):
         self,
         vocab: Union[Vocab, str],
         exceptions=TOKENIZER_EXCEPTIONS,
-        prefix_search=prefix_re.search,
-        suffix_search=suffix_re.search,
+        prefix_search=prefix_matcher.search,
+        suffix_search=suffix_matcher.search,
         infix_finditer=infix_re.finditer,
+        cache_size: int = 10000,
     ):
         """Initializes the `Tokenizer` object
            
@@ -77,17 +114,30 @@ class Tokenizer(AbstractSendable):
             infix_finditer: A function matching the signature of
                 `re.compile(string).finditer` to match infixes.
                 Example: "Hell-o" : "-" is an infix
+            cache_size (int): The maximum number of whitespace-delimited chunks
+                whose tokenization is cached. The least recently used chunks are
+                evicted first. Set it to 0 to disable the cache.
         """
 
-        self.prefix_search = prefix_search
-        self.suffix_search = suffix_search
-        self.infix_finditer = infix_finditer
+        # Maps a whitespace-delimited chunk of text to the tuple of orth
+        # values of the tokens it is split into and the tuple of their
+        # positions in the chunk. It has to be created before the
+        # tokenization rules are set since setting them clears the cache.
+        self._cache = LRUCache(maxsize=cache_size)
+
+        # The store and the store generation the cached orth values are valid for
+        self._store = None
+        self._store_generation = 0
 
         if exceptions:
             self.exceptions = exceptions
         else:
             self.exceptions = {}
 
+        self.prefix_search = prefix_search
+        self.suffix_search = suffix_search
+        self.infix_finditer = infix_finditer
+
         if isinstance(vocab, Vocab):
             self.vocab = vocab
         else:
@@ -99,7 +149,77 @@ class Tokenizer(AbstractSendable):
         objects using subpipeline templates.
         """
 
-        return Tokenizer(vocab=self.vocab)
+        return Tokenizer(vocab=self.vocab, cache_size=self._cache.maxsize)
+
+    @property
+    def prefix_search(self):
+        """The function used to match prefixes."""
+        return self._prefix_search
+
+    @prefix_search.setter
+    def prefix_search(self, prefix_search):
+
+        # Cached chunks were split according to the old rule
+        self._prefix_search = prefix_search
+        self._prefix_offsets = _searches_offsets(prefix_search)
+        self.clear_cache()
+
+    @property
+    def suffix_search(self):
+        """The function used to match suffixes."""
+        return self._suffix_search
+
+    @suffix_search.setter
+    def suffix_search(self, suffix_search):
+
+        self._suffix_search = suffix_search
+        self._suffix_offsets = _searches_offsets(suffix_search)
+        self.clear_cache()
+
+    @property
+    def infix_finditer(self):
+        """The function used to find infixes."""
+        return self._infix_finditer
+
+    @infix_finditer.setter
+    def infix_finditer(self, infix_finditer):
+
+        self._infix_finditer = infix_finditer
+        self.clear_cache()
+
+    @property
+    def exceptions(self):
+        """The dict of exception cases.
+
+        Note:
+            If this dict is modified inplace, `clear_cache()` should be
+            called for the changes to be taken into account.
+        """
+        return self._exceptions
+
+    @exceptions.setter
+    def exceptions(self, exceptions):
+
+        self._exceptions = exceptions
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Empties the cache of tokenized chunks."""
+
+        self._cache.clear()
+
+        # Substrings longer than the longest exception case are never looked
+        # up in the exceptions dict, which saves copying long substrings.
+        self._max_exception_length = max(map(len, self.exceptions), default=0)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Returns the statistics of the cache of tokenized chunks.
+
+        Returns:
+            dict: A dict with the `hits`, `misses`, `size` and `maxsize` keys.
+        """
+
+        return self._cache.info()
 
     def __call__(self, text: Union[String, str]):
         """The real tokenization procedure takes place here.
@@ -125,14 +245,31 @@ class Tokenizer(AbstractSendable):
 
         """
 
+        # The call to `str()` accounts for the case when text is
+        # of type String (a Syft string type)
+        text = str(text)
+
+        # Cached orth values might belong to strings that were evicted
+        # from the store, or to another store
+        store = self.vocab.store
+
+        if store is not self._store or store.generation != self._store_generation:
+
+            self.clear_cache()
+
+            self._store = store
+            self._store_generation = store.generation
+
         # Create a document that will hold meta data of tokens
         # By meta data I mean the hash value of the string stored by the Token object
-        # in the original text, and if the token is followed by a white space.
+        # in the original text, its position in the text, and if the token is followed
+        # by a white space. The Doc keeps a reference to the text to be able to
+        # slice it instead of rebuilding it from the tokens.
 
         # I do not assign the Doc here any owner, this will
         # be done by the SupPipeline object that operates
         # this tokenizer.
-        doc = Doc(self.vocab)
+        doc = Doc(self.vocab, text=text)
 
         # The number of characters in the text
         text_size = len(text)
@@ -141,119 +278,131 @@ class Tokenizer(AbstractSendable):
         if text_size == 0:
             return doc
 
-        # Initialize a pointer to the position of the first character of 'text'
+        # The position of the first character that does not belong to an already
+        # created token. A single white space following a non-space chunk is not
+        # a token in itself, it is recorded by setting `space_after` to True.
         pos = 0
 
-        # This is a flag to indicate whether the character we are comparing
-        # to is a white space or not
-        is_space = text[0].isspace()
-
-        # Start tokenization
-        for i, char in enumerate(text):
+        # Start tokenization by visiting each run of non-space characters
+        for match in _non_space_finditer(text):
 
-            # We are looking for a character that is the opposite of 'is_space'
-            # if 'is_space' is True, then we want to find a character that is
-            # not a space. and vice versa. This event marks the end of a token.
-            is_current_space = char.isspace()
-            if is_current_space != is_space:
-                # Create the TokenMeta object that can be later used to retrieve the token
-                # from the text
-                token_meta = TokenMeta(
-                    # get hash key for string stored in the TokenMeta object, where string is
-                    # substring of text from start_pos == pos to end_pos + 1 == (i - 1) + 1
-                    # Note: If the store doesn't contain string, then it is added to store
-                    # and the corresponding key is returned back
-                    hash_key=self.vocab.store[str(text[pos : (i - 1) + 1])],
-                    space_after=is_current_space,
-                )
+            start, end = match.span()
 
-                # if is_space is True that means detected token is composed of only whitespaces
-                # so we dont need to check for prefix, infixes etc.
-                if is_space:
+            # The white spaces between the previous chunk and this one form a token.
+            # This token is never followed by a space since it is followed by `chunk`.
+            if start > pos:
+                self._append_space_token(doc, text[pos:start], space_after=False, idx=pos)
 
-                    # Append the token to the document
-                    doc.container.append(token_meta)
-                else:
+            # Whether the chunk is followed by a white space
+            space_after = end < text_size
 
-                    # Process substring for prefix, infix, suffix and exception cases
-                    span = str(text[pos:i])
+            # Process the chunk for prefix, infix, suffix and exception cases
+            doc = self._tokenize(match.group(), space_after, doc, idx=start)
 
-                    doc = self._tokenize(span, token_meta, doc)
+            # Skip the white space following the chunk if any
+            pos = end + 1 if space_after else end
 
-                # Adjust the position 'pos' against which
-                # we compare the currently visited chararater
-                if is_current_space:
-                    pos = i + 1
-                else:
-                    pos = i
+        # The remaining white spaces at the end of the text form the last token.
+        # For backward compatibility, `space_after` is set to True for this token.
+        if pos < text_size:
+            self._append_space_token(doc, text[pos:], space_after=True, idx=pos)
 
-                # Update the character type of which we are searching
-                # the opposite (space vs. not space).
-                # prevent 'pos' from being out of bound
-                if pos < text_size:
-                    is_space = text[pos].isspace()
-
-            # Create the last token if the end of the string is reached
-            if i == text_size - 1 and pos <= i:
-
-                # Create the TokenMeta object that can be later used to retrieve the token
-                # from the text
-                token_meta = TokenMeta(
-                    # hash key for string stored in the TokenMeta object, where string is
-                    # substring of text from start_pos == pos to end_pos == None
-                    # Note: If the store doesn't contain string, then it is added to store
-                    # and the corresponding key is returned back
-                    hash_key=self.vocab.store[str(text[pos:])],
-                    space_after=is_current_space,
-                )
+        # In bounded mode, strings that are not used anymore might be evicted
+        self.vocab.evict_strings()
 
-                # if is_space is True that means detected token is composed of only whitespaces
-                # so we dont need to check for prefix, infixes etc.
-                if is_space:
+        return doc
 
-                    # Append the token to the document
-                    doc.container.append(token_meta)
-                else:
+    def _append_space_token(self, doc: Doc, string: str, space_after: bool, idx: int) -> None:
+        """Appends a token made of white spaces only to the doc container.
+        Such tokens are not processed for prefix, infix, suffix and exception cases.
 
-                    # Process substring for prefix, infix, suffix and exception cases
-                    span = str(text[pos:None])
-                    doc = self._tokenize(span, token_meta, doc)
+        Args:
+            doc: The document to append the token to.
+            string: The white spaces forming the token.
+            space_after: Whether the token is followed by a space.
+            idx: The position of the token in the text.
+        """
 
-        return doc
+        # Note: If the store doesn't contain string, then it is added to store
+        # and the corresponding key is returned back
+        doc.container.append_orth(self.vocab.store[string], space_after, idx)
 
-    def _tokenize(self, substring: str, token_meta: TokenMeta, doc: Doc) -> Doc:
+    def _tokenize(self, substring: str, space_after: bool, doc: Doc, idx: int) -> Doc:
         """ Tokenize each substring formed after splitting affixes and processing 
             exceptions. Returns Doc object.
 
         Args:
             substring: The substring to tokenize.
-            token_meta: The TokenMeta object of original substring
-                before splitting affixes and exceptions.
+            space_after: Whether the substring is followed by a white space
+                in the text.
             doc: Document object. 
+            idx: The position of the substring in the text.
 
         Returns:    
             doc: Document with all the TokenMeta objects of every token after splitting 
                 affixes and exceptions.
         """
 
-        # If there is trailing space after the substring in text.
-        space_after = token_meta.space_after
+        # Get the orth values of the tokens `substring` was split into
+        # the last time it was seen and their positions in `substring`,
+        # if they are still cached.
+        cached = self._cache.get(substring)
+
+        if cached is not None:
+
+            orths, offsets = cached
+
+            doc.container.extend_orths(orths, idxs=[idx + offset for offset in offsets])
+
+            # Only the last token of the substring can be followed by a space
+            doc.container[-1].space_after = space_after
+
+            return doc
+
+        # The position in the doc container of the first token of `substring`
+        start = len(doc.container)
 
         # Get the remaining substring,affixes containing list of
         # TokenMeta for each type affix and list of TokenMeta of
         # exceptions after splitting the affixes.
-        substring, affixes, exception_tokens = self._split_affixes(substring=substring)
+        remaining, affixes, exception_tokens = self._split_affixes(substring=substring)
 
         # Attach all the `TokenMeta` objects formed as result of splitting
         # the affixes and exception cases in the doc container.
         doc = self._attach_tokens(
             doc=doc,
-            substring=substring,
+            substring=remaining,
             space_after=space_after,
             affixes=affixes,
             exception_tokens=exception_tokens,
         )
 
+        orths = tuple(doc.container.orths[start:].tolist())
+
+        # The positions of the tokens in `substring` follow from the lengths of
+        # their strings. Suffixes are positioned from the end of `substring`,
+        # and the other tokens from its start.
+        n_suffixes = len(affixes["suffix"])
+
+        offsets = [0] * len(orths)
+        offset = 0
+
+        for i in range(len(orths) - n_suffixes):
+            offsets[i] = offset
+            offset += len(self.vocab.store[orths[i]])
+
+        offset = len(substring)
+
+        for i in range(len(orths) - 1, len(orths) - n_suffixes - 1, -1):
+            offset -= len(self.vocab.store[orths[i]])
+            offsets[i] = offset
+
+        doc.container.idxs[start:] = offsets
+        doc.container.idxs[start:] += idx
+
+        # Cache the orth values and positions of the tokens created for `substring`
+        self._cache.put(substring, (orths, tuple(offsets)))
+
         return doc
 
     def _split_affixes(self, substring: str) -> Tuple[str, DefaultDict, List[TokenMeta]]:
@@ -269,55 +418,74 @@ class Tokenizer(AbstractSendable):
             exception_tokens: The list of exception tokens TokenMeta objects.
         """
 
-        suffixes = []
-        prefixes = []
-        infixes = []
         exception_tokens = []
 
-        next_affix = ["prefix", "suffix"]
-
         # Dict holding TokenMeta lists of each affix types(prefix, suffix, infix)
         affixes = defaultdict(list)
 
-        # The first element in the `next_affix` list is 'prefix'.
-        # since we should start by finding prefixes, we fix the
-        # index i = 0.
+        # The substring remaining after splitting affixes is `substring[start:end]`.
+        # These offsets are moved each time an affix is split instead of copying
+        # the substring, so that chunks made of many affixes are split in a time
+        # linear in their length.
+        start = 0
+        end = len(substring)
+
         # Start by finding prefixes.
-        i = 0
+        find_prefix = True
 
-        # Holds the last value of `i` at the moment when either a prefix or a suffix is matched.
-        # If the difference between `i` and l`ast_i` is greater than 2, it means that neither a
-        # prefix nor a suffix is found.
-        last_i = 0
+        # The number of consecutive searches that did not match any affix.
+        misses = 0
 
-        # In each iteration, `substring` is searched for a prefix first, then for a suffix, and thus
+        # The remaining substring is searched for a prefix first, then for a suffix, and thus
         # alternatively. The loop terminates when an exception substring is encountered,
-        # or when the substring is not updated for 2 continuous iterations, i.e, when
-        # neither a prefix nor a suffix is matched in the substring.
-        while i - last_i <= 2:
+        # or when neither a prefix nor a suffix is matched in the remaining substring.
+        while misses < 2:
 
-            if substring in self.exceptions:
+            if (
+                end - start <= self._max_exception_length
+                and substring[start:end] in self.exceptions
+            ):
                 # Get a list of exception  `TokenMeta` objects to be added in the Doc container
-                exception_tokens, substring = self._get_exception_token_metas(substring)
+                exception_tokens, _ = self._get_exception_token_metas(substring[start:end])
+
+                # There is no remaining substring
+                start = end
 
                 break
 
-            # Get affix type (prefix or suffix)
-            affix_type = next_affix[i % 2]
+            if find_prefix:
+
+                affix_len = self._find_prefix_length(substring, start, end)
+                affix = substring[start : start + affix_len]
+
+                start += affix_len
+
+            else:
+
+                affix_len = self._find_suffix_length(substring, start, end)
+                affix = substring[end - affix_len : end]
+
+                end -= affix_len
 
-            affix_finder = getattr(self, f"find_{affix_type}")
+            if affix_len:
 
-            if affix_finder(substring):
-                # Get the `TokenMeta` object of the affix along with updated
-                # substring after removing the affix
-                token_meta, substring = getattr(self, f"_get_{affix_type}_token_meta")(substring)
+                # Create the TokenMeta object of the affix
+                token_meta = TokenMeta(
+                    hash_key=self.vocab.store[affix],
+                    space_after=False,  # for the last token space_after will be updated explicitly according to the original substring.
+                )
 
-                affixes[f"{affix_type}"].append(token_meta)
+                affixes["prefix" if find_prefix else "suffix"].append(token_meta)
 
-                last_i = i
+                misses = 0
+
+            else:
+                misses += 1
 
             # Change the affix type.
-            i += 1
+            find_prefix = not find_prefix
+
+        substring = substring[start:end]
 
         # Get infix TokenMeta objects if any.
         if self.infix_matches(substring):
@@ -380,64 +548,6 @@ class Tokenizer(AbstractSendable):
 
         return doc
 
-    def _get_prefix_token_meta(self, substring: str) -> Tuple[TokenMeta, str]:
-        """Makes TokenMeta data for substring which are prefixes.
-
-        Args:
-            substring: The substring to tokenize.
-            
-        Returns:
-            token_meta: The TokenMeta object with TokenMeta data of prefix.
-            substring: The updated substring after removing prefix.           
-        """
-
-        # Get the length of prefix match in the substring.
-        pre_len = self.find_prefix(substring)
-
-        # break if pattern matches the empty string
-        if pre_len == 0:
-            return None, substring
-
-        # Create the TokenMeta object
-        token_meta = TokenMeta(
-            hash_key=self.vocab.store[str(substring[:pre_len])],
-            space_after=False,  # for the last token space_after will be updated explicitly according to the original substring.
-        )
-
-        # Update the remaining substring after removing the prefix.
-        substring = substring[pre_len:]
-
-        return token_meta, substring
-
-    def _get_suffix_token_meta(self, substring: str) -> Tuple[TokenMeta, str]:
-        """Makes TokenMeta data for substring suffixes.
-
-        Args:
-            substring: The `substring` to tokenize.
-            
-        Returns:
-            token_meta: The TokenMeta object of the suffix.
-            substring: The updated substring after removing the suffix.
-        """
-
-        # Get the length of suffix match in the substring.
-        suff_len = self.find_suffix(substring)
-
-        # break if pattern matches the empty string
-        if suff_len == 0:
-            return None, substring
-
-        # Create the TokenMeta object
-        token_meta = TokenMeta(
-            hash_key=self.vocab.store[str(substring[len(substring) - suff_len :])],
-            space_after=False,  # for the last token space_after will be updated explicitly in end.
-        )
-
-        # Update the remaining substring after removing the suffix.
-        substring = substring[:-suff_len]
-
-        return token_meta, substring
-
     def _get_infix_token_metas(self, substring: str) -> Tuple[List[TokenMeta], str]:
         """Makes list of TokenMeta data for substring which are infixes.
 
@@ -549,7 +659,35 @@ class Tokenizer(AbstractSendable):
 
         Args:
             substring: The string to segment.
-            
+
+        Returns:
+            The length of the prefix if present, otherwise 0.
+        """
+
+        return self._find_prefix_length(substring, 0, len(substring))
+
+    def find_suffix(self, substring: str) -> int:
+        """Find the length of a suffix that should be segmented from the
+        string, or None if no suffix rules match.
+
+        Args:
+            substring: The string to segment.
+
+        Returns:
+            The length of the suffix if present, otherwise 0.
+        """
+
+        return self._find_suffix_length(substring, 0, len(substring))
+
+    def _find_prefix_length(self, substring: str, start: int, end: int) -> int:
+        """Find the length of the prefix of `substring[start:end]` that should
+        be segmented.
+
+        Args:
+            substring: The string to segment.
+            start: The position where the segmented part of `substring` starts.
+            end: The position where the segmented part of `substring` ends.
+
         Returns:
             The length of the prefix if present, otherwise 0.
         """
@@ -558,18 +696,24 @@ class Tokenizer(AbstractSendable):
         if self.prefix_search is None:
             return 0
 
-        # The MatchObject with the end and start postion of the prefix in the substring.
-        match = self.prefix_search(substring)
+        # The MatchObject with the end and start postion of the prefix. Affix
+        # matchers search the substring in place, other functions search a copy.
+        if self._prefix_offsets:
+            match = self.prefix_search(substring, start, end)
+        else:
+            match = self.prefix_search(substring[start:end])
 
         # Return the length of the prefix match in the substring.
         return (match.end() - match.start()) if match is not None else 0
 
-    def find_suffix(self, substring: str) -> int:
-        """Find the length of a suffix that should be segmented from the
-        string, or None if no suffix rules match.
+    def _find_suffix_length(self, substring: str, start: int, end: int) -> int:
+        """Find the length of the suffix of `substring[start:end]` that should
+        be segmented.
 
         Args:
             substring: The string to segment.
+            start: The position where the segmented part of `substring` starts.
+            end: The position where the segmented part of `substring` ends.
 
         Returns:
             The length of the suffix if present, otherwise 0.
@@ -579,8 +723,12 @@ class Tokenizer(AbstractSendable):
         if self.suffix_search is None:
             return 0
 
-        # The MatchObject with the end and start postion of the suffix in the substring.
-        match = self.suffix_search(substring)
+        # The MatchObject with the end and start postion of the suffix. Affix
+        # matchers search the substring in place, other functions search a copy.
+        if self._suffix_offsets:
+            match = self.suffix_search(substring, start, end)
+        else:
+            match = self.suffix_search(substring[start:end])
 
         # Return the length of the suffix match in the substring.
         return (match.end() - match.start()) if match is not None else 0
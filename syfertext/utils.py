@@ -1,11 +1,18 @@
+import itertools
 import mmh3
+import numpy as np
+import operator
 import os
 import re
 from pathlib import Path
+from collections import OrderedDict
 
 from typing import Pattern
 from typing import Match
 from typing import Tuple
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
 
 import tempfile
 import shutil
@@ -22,6 +29,24 @@ def hash_string(string: str) -> int:
     return key
 
 
+def hash_strings(strings: Iterable[str]) -> np.ndarray:
+    """Creates the hashes of several strings at once, as `hash_string()`
+    does for one string, without calling a Python function per string.
+
+    Args:
+        strings (iterable of str): The strings to hash.
+
+    Returns:
+        The uint64 array of hashes.
+    """
+
+    # Passing keyword arguments through `functools.partial` is slow, so the
+    # signed hashes are computed and then viewed as unsigned integers
+    hashes = map(mmh3.hash64, strings, itertools.repeat(1))
+
+    return np.fromiter(map(operator.itemgetter(0), hashes), dtype=np.int64).view(np.uint64)
+
+
 def normalize_slice(length: int, start: int, stop: int, step: int = None):
     """This function is used to convert the negative slice boundaries to positive values.
     eg. start = -4, stop = -1, length = 6 gets converted to start = 2, stop = 5
@@ -116,6 +141,97 @@ def compile_infix_regex(entries: Tuple) -> Pattern:
     return re.compile(expression)
 
 
+class LRUCache:
+    """A mapping of bounded size that evicts its least recently used
+    entry when a new entry would make it exceed its maximum size.
+
+    It also counts cache hits and misses in order to help choosing
+    the right size for the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initializes the LRUCache object.
+
+        Args:
+            maxsize (int): The maximum number of entries to keep. If it
+                is 0, nothing is ever stored in the cache.
+        """
+
+        assert (
+            isinstance(maxsize, int) and maxsize >= 0
+        ), "Argument `maxsize` should be a non-negative `int`"
+
+        self.maxsize = maxsize
+
+        # Entries are kept ordered from the least to the most recently used
+        self.data = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """Returns the value stored for `key` and marks it as the most
+        recently used entry. If `key` is not found, `default` is returned.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (object): The value to return on a cache miss.
+
+        Returns:
+            The cached value or `default`.
+        """
+
+        try:
+            value = self.data[key]
+
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.data.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Stores `value` for `key`, evicting the least recently used
+        entry if the cache is full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (object): The value to store.
+        """
+
+        if self.maxsize == 0:
+            return
+
+        self.data[key] = value
+        self.data.move_to_end(key)
+
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache. Hit and miss counters are kept."""
+
+        self.data.clear()
+
+    def info(self) -> Dict[str, int]:
+        """Returns the cache statistics.
+
+        Returns:
+            dict: A dict with the `hits`, `misses`, `size` and `maxsize` keys.
+        """
+
+        return dict(hits=self.hits, misses=self.misses, size=len(self.data), maxsize=self.maxsize)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
 class MsgpackCodeGenerator:
     def __init__(self):
 
@@ -0,0 +1,270 @@
+"""An approximate nearest-neighbour index over the vectors of a language
+model, used by `Vectors.most_similar()`.
+
+The index is an inverted file: the normalized vectors are clustered with
+spherical k-means, and a query is only compared to the vectors of the
+`n_probe` clusters whose centroids are the most similar to it, instead of
+to the whole table. The index holds the rows of the vectors, not the
+vectors, so it should be rebuilt if the vectors change, e.g. when they are
+pruned.
+
+Usage:
+    python -m syfertext.vector_index en_core_web_lg vector_index --n-lists 1024
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from typing import Tuple
+
+
+# The names of the files of an index saved with `VectorIndex.to_disk()`
+CENTROIDS_FILE = "centroids.npy"
+ORDER_FILE = "order.npy"
+OFFSETS_FILE = "offsets.npy"
+
+# The number of rows compared to the centroids at once
+CHUNK_ROWS = 8192
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Returns the vectors divided by their L2 norms. Zero vectors stay zeros."""
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    return vectors / np.where(norms > 0, norms, 1)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Returns the indices of the `k` largest scores, by decreasing score."""
+
+    if k < len(scores):
+        indices = np.argpartition(-scores, k - 1)[:k]
+
+    else:
+        indices = np.arange(len(scores))
+
+    return indices[np.argsort(-scores[indices], kind="stable")]
+
+
+def _normalized_rows(vectors: "Vectors", rows: np.ndarray) -> np.ndarray:
+    """Returns the normalized float32 vectors at `rows` of `vectors`."""
+
+    return normalize(vectors.vectors_at(rows).numpy())
+
+
+def _nearest_centroids(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Returns the index of the most similar centroid of each normalized vector."""
+
+    return np.concatenate(
+        [
+            (data[start : start + CHUNK_ROWS] @ centroids.T).argmax(axis=1)
+            for start in range(0, len(data), CHUNK_ROWS)
+        ]
+        or [np.zeros(0, dtype=np.int64)]
+    )
+
+
+class VectorIndex:
+    """An inverted file index over the rows of a vector table. The rows are
+    grouped in lists, one per centroid: the rows of list `i` are
+    `order[offsets[i] : offsets[i + 1]]`.
+    """
+
+    def __init__(self, centroids: np.ndarray, order: np.ndarray, offsets: np.ndarray):
+        """Initializes the VectorIndex object.
+
+        Args:
+            centroids (np.ndarray): The float32 array of the normalized centroids,
+                of shape (n_lists, dim).
+            order (np.ndarray): The int64 array of all the rows of the table,
+                grouped by list.
+            offsets (np.ndarray): The int64 array of the positions in `order`
+                where each list starts, followed by the number of rows.
+        """
+
+        assert len(offsets) == len(centroids) + 1, "There should be one more offset than centroids"
+
+        # Index memory-mapped arrays as plain arrays, which is faster
+        self.centroids = np.asarray(centroids, dtype=np.float32).view(np.ndarray)
+        self.order = np.asarray(order, dtype=np.int64).view(np.ndarray)
+        self.offsets = np.asarray(offsets, dtype=np.int64).view(np.ndarray)
+
+    @property
+    def n_lists(self) -> int:
+        """The number of lists of the index."""
+
+        return len(self.centroids)
+
+    @classmethod
+    def build(
+        cls, vectors: "Vectors", n_lists: int = None, n_iter: int = 10, seed: int = 0
+    ) -> "VectorIndex":
+        """Builds the index of the vectors of a language model. The centroids
+        are trained with spherical k-means on a sample of the vectors, then
+        every row is put in the list of its most similar centroid.
+
+        Args:
+            vectors (Vectors): The vectors of the language model.
+            n_lists (int): The number of lists. It defaults to the square
+                root of the number of rows.
+            n_iter (int): The number of k-means iterations.
+            seed (int): The seed of the random sampling of the vectors.
+
+        Returns:
+            The VectorIndex object.
+        """
+
+        # If data is not yet loaded, then load it
+        if not vectors.loaded:
+            vectors._load_data()
+
+        n_rows = len(vectors.data)
+
+        if n_lists is None:
+            n_lists = int(np.sqrt(n_rows))
+
+        n_lists = max(1, min(n_lists, n_rows))
+
+        rng = np.random.RandomState(seed)
+
+        # Train the centroids on a sample of 64 vectors per list
+        sample = np.sort(rng.choice(n_rows, size=min(n_rows, 64 * n_lists), replace=False))
+        data = _normalized_rows(vectors, sample)
+
+        centroids = data[rng.choice(len(data), size=n_lists, replace=False)]
+
+        for _ in range(n_iter):
+
+            assignments = _nearest_centroids(data, centroids)
+
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, data)
+
+            # A centroid that no vector is nearest to stays where it is
+            empty = np.bincount(assignments, minlength=n_lists) == 0
+            sums[empty] = centroids[empty]
+
+            centroids = normalize(sums).astype(np.float32)
+
+        # Put every row in the list of its nearest centroid
+        assignments = np.concatenate(
+            [
+                _nearest_centroids(
+                    _normalized_rows(vectors, np.arange(start, min(start + CHUNK_ROWS, n_rows))),
+                    centroids,
+                )
+                for start in range(0, n_rows, CHUNK_ROWS)
+            ]
+        )
+
+        order = np.argsort(assignments, kind="stable")
+
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(assignments, minlength=n_lists))
+
+        return cls(centroids, order, offsets)
+
+    def search(
+        self, vectors: "Vectors", queries: np.ndarray, k: int, n_probe: int = 8
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds the rows of `vectors` whose vectors are approximately the most
+        similar to each query, by cosine similarity.
+
+        Args:
+            vectors (Vectors): The vectors the index was built from.
+            queries (np.ndarray): The float32 array of the queries, of shape
+                (n_queries, dim).
+            k (int): The number of rows to find for each query.
+            n_probe (int): The number of lists searched for each query. More
+                lists give more exact results but take longer.
+
+        Returns:
+            The int64 array of the rows and the float32 array of their cosine
+            similarities with the queries, both of shape (n_queries, k), by
+            decreasing similarity. If fewer than `k` rows are in the lists
+            searched, the remaining rows are -1 and their similarities -inf.
+        """
+
+        queries = normalize(np.asarray(queries, dtype=np.float32))
+
+        n_probe = max(1, min(n_probe, self.n_lists))
+
+        # The lists whose centroids are the most similar to each query
+        lists = np.argpartition(-(queries @ self.centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+
+        rows = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+
+        for i, query in enumerate(queries):
+
+            candidates = np.concatenate(
+                [self.order[self.offsets[j] : self.offsets[j + 1]] for j in lists[i]]
+            )
+
+            similarities = _normalized_rows(vectors, candidates) @ query
+
+            best = top_k(similarities, k)
+
+            rows[i, : len(best)] = candidates[best]
+            scores[i, : len(best)] = similarities[best]
+
+        return rows, scores
+
+    def to_disk(self, path: str) -> None:
+        """Saves the index in the directory `path`, which is created if needed."""
+
+        os.makedirs(path, exist_ok=True)
+
+        np.save(os.path.join(path, CENTROIDS_FILE), self.centroids)
+        np.save(os.path.join(path, ORDER_FILE), self.order)
+        np.save(os.path.join(path, OFFSETS_FILE), self.offsets)
+
+    @classmethod
+    def from_disk(cls, path: str, mmap: bool = True) -> "VectorIndex":
+        """Loads an index saved with `to_disk()`.
+
+        Args:
+            path (str): The directory of the index.
+            mmap (bool): If True, the index is memory-mapped instead of being
+                read in memory.
+
+        Returns:
+            The VectorIndex object.
+        """
+
+        mmap_mode = "r" if mmap else None
+
+        return cls(
+            np.load(os.path.join(path, CENTROIDS_FILE), mmap_mode=mmap_mode),
+            np.load(os.path.join(path, ORDER_FILE), mmap_mode=mmap_mode),
+            np.load(os.path.join(path, OFFSETS_FILE), mmap_mode=mmap_mode),
+        )
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Builds the nearest-neighbour index of the vectors of a language model."
+    )
+    parser.add_argument("model_name", help="name of the language model, e.g. en_core_web_lg")
+    parser.add_argument("output", help="directory to save the index to")
+    parser.add_argument("--n-lists", type=int, help="number of lists of the index")
+    parser.add_argument("--n-iter", type=int, default=10, help="number of k-means iterations")
+    args = parser.parse_args()
+
+    # Imported here since `vectors` imports this module
+    from .vectors import Vectors
+
+    vectors = Vectors(args.model_name)
+
+    index = VectorIndex.build(vectors, n_lists=args.n_lists, n_iter=args.n_iter)
+    index.to_disk(args.output)
+
+    print(f"index of {len(index.order)} rows in {index.n_lists} lists saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
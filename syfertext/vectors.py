@@ -1,11 +1,109 @@
+"""Word vectors of a language model.
+
+The vectors are loaded from the `LOADERS` of the language model package,
+either by reading the whole table in memory with the `vectors` and `key2row`
+loaders, or by memory-mapping a table converted to the on-disk format below,
+whose directory is given by the `vectors_path` loader.
+
+A table saved with `Vectors.to_disk()` is a directory holding four or five
+NumPy `.npy` files:
+
+    vectors.npy         array of shape (n_rows, dim), one vector per row, of
+                        dtype float32, float16 or int8
+    scales.npy          float32 array of shape (n_rows,), only for int8 vectors:
+                        the float32 vector of a row is its int8 vector times
+                        the scale of the row
+    keys.npy            uint64 array of the word hashes that have a vector, sorted
+    rows.npy            int64 array of the row of the vector of each key in `keys`
+    default_vector.npy  float32 array of shape (dim,), returned for unknown words
+
+float16 vectors take half the memory of float32 vectors, and int8 vectors
+about a quarter. They are converted back to float32 when they are looked up.
+
+Since `.npy` files are memory-mapped read-only, the vectors are not read when
+the table is loaded but when they are looked up, and all the processes of a
+machine using the same table share the pages of the vectors in the page cache.
+The keys are searched in place by a `KeyIndex`.
+
+Vectors are loaded when first needed. To avoid stalling the first documents
+processed, `load_async()` starts loading them in a background thread, and
+`wait()` blocks until they are loaded, see also `Language.warmup()`.
+
+A language model package whose vectors are memory-mapped from such a table
+only needs a `vectors_path` loader, see `save_package()`.
+
+Usage:
+    python -m syfertext.vectors en_core_web_lg vectors [--dtype int8] [--prune 20000]
+    python -m syfertext.vectors en_core_web_lg models --package en_core_web_lg_20k --prune 20000
+"""
+
+import argparse
 import pickle
 import os
 from pathlib import Path
 import importlib
+import threading
+import time
+import numpy as np
 import torch
+from typing import Dict
+from typing import Optional
+from typing import Tuple
 from typing import Union
+from typing import Iterable
+from typing import Any
 
+from .key_index import KeyIndex
 from .utils import hash_string
+from .vector_index import VectorIndex
+from .vector_index import normalize
+
+
+# The names of the files of a table saved with `Vectors.to_disk()`
+VECTORS_FILE = "vectors.npy"
+KEYS_FILE = "keys.npy"
+ROWS_FILE = "rows.npy"
+DEFAULT_VECTOR_FILE = "default_vector.npy"
+SCALES_FILE = "scales.npy"
+
+# The dtypes vectors can be saved with by `Vectors.to_disk()`
+VECTOR_DTYPES = ("float32", "float16", "int8")
+
+# The number of rows converted at once by `Vectors.to_disk()`
+CHUNK_ROWS = 65536
+
+# The `__init__.py` file of a language model package written by `save_package()`
+PACKAGE_INIT = '''"""The language model `{model_name}`, made of the vectors of `{source}`."""
+
+import os
+
+# The directory of the vectors, saved with `Vectors.to_disk()`
+VECTORS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vectors")
+
+LOADERS = {{"vectors_path": lambda: VECTORS_PATH}}
+'''
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantizes float vectors to int8 with one scale per vector, such that
+    the largest absolute value of each vector is mapped to 127.
+
+    Args:
+        vectors (np.ndarray): The float array of shape (n_rows, dim).
+
+    Returns:
+        The int8 array of shape (n_rows, dim) and the float32 array of the
+        scales of the rows, of shape (n_rows,).
+    """
+
+    scales = (np.abs(vectors).max(axis=1) / 127).astype(np.float32)
+
+    # Rows of zeros stay zeros whatever their scale
+    divisors = np.where(scales > 0, scales, 1)
+
+    quantized = np.rint(vectors / divisors[:, None]).astype(np.int8)
+
+    return quantized, scales
 
 
 class Vectors:
@@ -18,11 +116,58 @@ class Vectors:
         # requested for the first time
         self.loaded = False
 
+        # The scales of the rows of int8 vectors, or None if the
+        # vectors are not quantized
+        self.scales = None
+
+        # The key of each row, built by `row_keys()` when it is first needed
+        self._row_keys = None
+
+        # Incremented whenever the rows of the vectors change after they are
+        # first loaded, e.g. by `prune()`. While it is 0, the vector rows
+        # precomputed by a lexeme table of the language model are valid.
+        self.generation = 0
+
+        # Held while the vectors are being loaded, so that they are loaded
+        # once even if several threads need them at the same time
+        self._load_lock = threading.Lock()
+
+        # The thread started by `load_async()` and the error it raised, if any
+        self._load_thread = None
+        self._load_error = None
+
+        # Load metrics, see `load_metrics()`
+        self._load_progress = 0.0
+        self._load_seconds = None
+        self._wait_seconds = 0.0
+
     def _load_data(self):
         """Loads the vectors from the language model package named
         `self.model_name` which should be installed.
+
+        If another thread, such as the one started by `load_async()`, is
+        already loading them, this waits until it is done instead.
         """
 
+        start = time.perf_counter()
+
+        with self._load_lock:
+
+            # The vectors were loaded by another thread while waiting for the lock
+            if self.loaded:
+                self._wait_seconds += time.perf_counter() - start
+                return
+
+            self._load_progress = 0.0
+
+            self._read_data()
+
+            self._load_progress = 1.0
+            self._load_seconds = time.perf_counter() - start
+
+    def _read_data(self):
+        """Reads the vectors with the `LOADERS` of the language model package."""
+
         # Import the language model
         model = importlib.import_module(f"syfertext_{self.model_name}")
 
@@ -31,18 +176,121 @@ class Vectors:
         # `vectors` array and `key2row` dictionary
         LOADERS = getattr(model, "LOADERS")
 
+        # Memory-map the vectors if the model ships them in the format of `to_disk()`
+        if "vectors_path" in LOADERS:
+            self.from_disk(LOADERS["vectors_path"]())
+            return
+
         # Load the array holding the word vectors
         self.data, self.default_vector = LOADERS["vectors"]()
 
+        # The vectors are read, the keys are left
+        self._load_progress = 0.5
+
         # Convert the default vector to torch Tensor
         self.default_vector = torch.Tensor(self.default_vector)
 
-        # Load the mappings between word hashes and row indices in 'self.data'
-        self.key2row = LOADERS["key2row"]()
+        self.scales = None
+        self._row_keys = None
+
+        # Load the mappings between word hashes and row indices in 'self.data',
+        # and keep them in a KeyIndex, which is much smaller than the dict
+        self.key2row = KeyIndex.from_dict(LOADERS["key2row"]())
 
         # Set the `loaded` property to True since data is now loaded
         self.loaded = True
 
+    def load_async(self) -> Optional[threading.Thread]:
+        """Starts loading the vectors in a background thread, so that they are
+        ready when the first vector is needed. Threads needing the vectors
+        before they are loaded wait for the background thread to finish
+        instead of loading them again. Does nothing if the vectors are
+        already loaded or being loaded by this method.
+
+        Returns:
+            The background thread, or None if the vectors are already loaded.
+        """
+
+        if self.loaded:
+            return None
+
+        if self._load_thread is None or not self._load_thread.is_alive():
+
+            self._load_error = None
+
+            self._load_thread = threading.Thread(
+                target=self._load_in_background,
+                name=f"syfertext-vectors-{self.model_name}",
+                daemon=True,
+            )
+            self._load_thread.start()
+
+        return self._load_thread
+
+    def _load_in_background(self) -> None:
+        """Loads the vectors in the thread started by `load_async()`, keeping
+        the error raised, if any, for `wait()`.
+        """
+
+        try:
+            self._load_data()
+
+        except Exception as error:
+            self._load_error = error
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the vectors loaded by `load_async()` are loaded.
+
+        Args:
+            timeout (float): The number of seconds to wait at most. If None,
+                waits until the vectors are loaded.
+
+        Returns:
+            True if the vectors are loaded, False if the timeout expired or
+            the loading was never started.
+
+        Raises:
+            The error raised while loading the vectors in the background, if any.
+        """
+
+        thread = self._load_thread
+
+        if thread is not None:
+
+            thread.join(timeout)
+
+            if self._load_error is not None:
+                raise self._load_error
+
+        return self.loaded
+
+    def load_metrics(self) -> Dict[str, Any]:
+        """Returns metrics describing the loading of the vectors.
+
+        Returns:
+            dict: A dict with the following keys:
+                loaded: Whether the vectors are loaded.
+                loading: Whether the vectors are being loaded.
+                background: Whether the vectors were loaded or are being loaded
+                    by `load_async()`.
+                progress: The share of the loading done, from 0.0 to 1.0. It
+                    is coarse: the vectors and the keys each count for half
+                    when they are read with the loaders of the model.
+                load_seconds: The time the loading took, or None if the
+                    vectors are not loaded by `_load_data()` yet.
+                wait_seconds: The total time threads needing the vectors
+                    waited for another thread to load them.
+        """
+
+        return dict(
+            loaded=self.loaded,
+            loading=self._load_lock.locked(),
+            background=self._load_thread is not None,
+            progress=1.0 if self.loaded else self._load_progress,
+            load_seconds=self._load_seconds,
+            wait_seconds=self._wait_seconds,
+        )
+
     def has_vector(self, key: Union[str, int]) -> bool:
         """Checks whether 'word' has a vector or not in self.data
 
@@ -50,7 +298,9 @@ class Vectors:
             key: the word or its hash to which we wish to test whether a vector exists or not.
 
         Returns:
-            True if a vector for 'word' already exists.
+            True if a vector for 'word' already exists. After `prune()`, this
+            is also True for the keys whose row was removed, since they are
+            mapped to the row of the nearest kept vector.
         """
 
         # If data is not yet loaded, then load it
@@ -71,6 +321,131 @@ class Vectors:
         else:
             return False
 
+    def has_vector_many(self, keys: Iterable[int]) -> np.ndarray:
+        """Checks which of several word hashes have a vector in self.data
+
+        Args:
+            keys (iterable of int): the hashes of the words.
+
+        Returns:
+            The bool array which is True for the keys that have a vector.
+        """
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        return self.get_rows(keys) >= 0
+
+    def get_row(self, key: int) -> int:
+        """Returns the row in self.data of the vector of a word hash
+
+        Args:
+            key (int): the hash of the word.
+
+        Returns:
+            The row of the vector, or -1 if the key has no vector.
+        """
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        return self.key2row.find(key)
+
+    def get_rows(self, keys: Iterable[int]) -> np.ndarray:
+        """Returns the rows in self.data of the vectors of several word hashes
+
+        Args:
+            keys (iterable of int): the hashes of the words.
+
+        Returns:
+            The int64 array of rows, which is -1 for the keys that have no vector.
+        """
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        return self.key2row.find_many(np.fromiter(keys, dtype=np.uint64))
+
+    def get_batch(self, keys: Iterable[int]) -> torch.Tensor:
+        """Returns the vectors of several word hashes at once, gathered from
+        self.data in a single indexing operation.
+
+        Args:
+            keys (iterable of int): the hashes of the words.
+
+        Returns:
+            The float32 tensor of shape (number of keys, vector size) whose
+            rows are the vectors of the keys. The row of a key that has no
+            vector is self.default_vector.
+        """
+
+        return self.vectors_at(self.get_rows(keys))
+
+    def vector_at(self, row: Optional[int]) -> torch.Tensor:
+        """Returns the vector at a row of self.data
+
+        Args:
+            row (int): the row of the vector, as given by `get_row()` or
+                the `id` attribute of a lexeme. It can be -1 or None.
+
+        Returns:
+            The vector, or self.default_vector if `row` is -1 or None.
+        """
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        if row is None or row < 0:
+            return self.default_vector
+
+        # Convert the vector to a torch Tensor
+        vector = torch.tensor(self.data[row], dtype=torch.float32)
+
+        # Dequantize int8 vectors
+        if self.scales is not None:
+            vector *= float(self.scales[row])
+
+        return vector
+
+    def vectors_at(self, rows: np.ndarray) -> torch.Tensor:
+        """Returns the vectors at several rows of self.data, gathered in a
+        single indexing operation.
+
+        Args:
+            rows (np.ndarray): the int64 array of the rows, as given by
+                `get_rows()`. It can hold -1 values.
+
+        Returns:
+            The float32 tensor of shape (number of rows, vector size) whose
+            rows are the vectors at `rows`, and self.default_vector where
+            `rows` is -1.
+        """
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        has_vector = rows >= 0
+
+        rows = np.where(has_vector, rows, 0)
+
+        # Gather the vectors in a new array, so that the tensor can share its memory
+        vectors = np.asarray(self.data)[rows]
+        vectors = vectors.astype(np.float32, copy=False)
+
+        # Dequantize int8 vectors
+        if self.scales is not None:
+            vectors *= np.asarray(self.scales)[rows][:, None]
+
+        if not has_vector.all():
+            vectors[~has_vector] = self.default_vector.numpy()
+
+        return torch.from_numpy(vectors)
+
     def __getitem__(self, word):
         """takes a word as a string and returns the corresponding vector
 
@@ -82,24 +457,349 @@ class Vectors:
             if no vector is found, self.default_vector is returned.
         """
 
+        # Get the vector row corresponding to the hash of the word
+        row = self.get_row(hash_string(word))
+
+        # The default vector is returned if the word has no vector
+        return self.vector_at(row)
+
+    def row_keys(self) -> np.ndarray:
+        """Returns the uint64 array of one key of each row of self.data, or 0
+        for the rows that no key is mapped to. The array is built once.
+        """
+
         # If data is not yet loaded, then load it
         if not self.loaded:
             self._load_data()
 
-        # Create the word hash key
-        key = hash_string(word)
+        if self._row_keys is None:
 
-        # if the key does not exists return default vector
-        if not self.has_vector(word):
-            return self.default_vector
+            self._row_keys = np.zeros(len(self.data), dtype=np.uint64)
+            self._row_keys[self.key2row.rows] = self.key2row.keys
 
-        # Get the vector row corresponding to the hash
-        row = self.key2row[key]
+        return self._row_keys
 
-        # Get the vector
-        vector = self.data[row]
+    def most_similar(
+        self,
+        queries: np.ndarray,
+        k: int = 1,
+        index: Optional[VectorIndex] = None,
+        n_probe: int = 8,
+        batch_size: int = 16384,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Finds the `k` rows of self.data whose vectors are the most similar
+        to each query by cosine similarity.
 
-        # Convert the vectors to torch Tensors
-        vector = torch.tensor(vector, dtype=torch.float32)
+        Without `index`, the queries are compared to all the rows, by batches
+        of rows. With a `VectorIndex` built from these vectors, only the rows
+        of the `n_probe` lists nearest to each query are compared, which is
+        much faster on large tables but may miss some of the nearest rows.
 
-        return vector
+        Args:
+            queries (np.ndarray): The array of the query vectors, of shape
+                (n_queries, dim), or a single vector of shape (dim,).
+            k (int): The number of rows to find for each query.
+            index (VectorIndex): The approximate index to search, if any.
+            n_probe (int): The number of lists of `index` searched for each query.
+            batch_size (int): The number of rows compared to the queries in one
+                matrix multiplication, when `index` is None.
+
+        Returns:
+            The arrays of the keys, the rows and the cosine similarities of the
+            nearest rows, of shape (n_queries, k), by decreasing similarity.
+            The key of a row is one of the keys mapped to it, see `row_keys()`.
+            The rows that the index did not find are -1, with key 0.
+        """
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+
+        k = min(k, len(self.data))
+
+        if index is not None:
+            rows, scores = index.search(self, queries, k, n_probe=n_probe)
+
+        else:
+            rows, scores = self._most_similar_exact(queries, k, batch_size)
+
+        keys = np.where(rows >= 0, self.row_keys()[rows], 0).astype(np.uint64)
+
+        return keys, rows, scores
+
+    def _most_similar_exact(
+        self, queries: np.ndarray, k: int, batch_size: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compares the queries to all the rows of self.data, keeping the `k`
+        best rows of each query as the batches of rows are compared.
+
+        Returns:
+            The int64 array of the rows and the float32 array of the cosine
+            similarities, of shape (n_queries, k).
+        """
+
+        queries = torch.from_numpy(normalize(queries).astype(np.float32))
+
+        rows = torch.full((len(queries), k), -1, dtype=torch.int64)
+        scores = torch.full((len(queries), k), -float("inf"), dtype=torch.float32)
+
+        for start in range(0, len(self.data), batch_size):
+
+            end = min(start + batch_size, len(self.data))
+
+            batch = self.vectors_at(np.arange(start, end))
+            batch /= batch.norm(dim=1, keepdim=True).clamp(min=1e-12)
+
+            # The best rows of the batch, merged with the best rows so far
+            batch_scores, batch_rows = (queries @ batch.T).topk(min(k, end - start), dim=1)
+
+            scores, best = torch.cat([scores, batch_scores], dim=1).topk(k, dim=1)
+            rows = torch.cat([rows, batch_rows + start], dim=1).gather(1, best)
+
+        return rows.numpy(), scores.numpy()
+
+    def prune(self, n_rows: int, batch_size: int = 1024) -> Dict[int, Tuple[int, float]]:
+        """Keeps the first `n_rows` rows of self.data only, and maps the keys of
+        the other rows to the kept row of the most similar vector by cosine
+        similarity. Since the rows of language models are sorted by word
+        frequency, the vectors of the most frequent words are kept.
+
+        The remapped keys still have a vector: `has_vector()` is True for them
+        and they get the vector of their nearest kept row.
+
+        The vocabularies using these vectors resolve the vector rows of their
+        lexemes again before reading them, see `Vocab.refresh_vector_rows()`.
+
+        Args:
+            n_rows (int): The number of rows to keep.
+            batch_size (int): The number of removed rows whose nearest kept row
+                is searched in one matrix multiplication.
+
+        Returns:
+            A dict mapping each remapped key to the tuple of its new row and the
+            cosine similarity between its former vector and the new one.
+        """
+
+        assert n_rows >= 1, "Argument `n_rows` should be at least 1"
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        total = len(self.data)
+
+        if n_rows >= total:
+            return {}
+
+        # The new row of each former row
+        new_rows = np.arange(total)
+        similarities = np.ones(total, dtype=np.float32)
+
+        kept = self.vectors_at(np.arange(n_rows))
+        kept /= kept.norm(dim=1, keepdim=True).clamp(min=1e-12)
+
+        for start in range(n_rows, total, batch_size):
+
+            end = min(start + batch_size, total)
+
+            removed = self.vectors_at(np.arange(start, end))
+            removed /= removed.norm(dim=1, keepdim=True).clamp(min=1e-12)
+
+            # The cosine similarities of the removed rows with all the kept rows
+            best, nearest = (removed @ kept.T).max(dim=1)
+
+            new_rows[start:end] = nearest.numpy()
+            similarities[start:end] = best.numpy()
+
+        keys = self.key2row.keys
+        rows = self.key2row.rows
+
+        self.key2row = KeyIndex(keys, new_rows[rows])
+        self._row_keys = None
+
+        self.generation += 1
+
+        # Copy the kept rows, so that a memory-mapped table can be released
+        self.data = np.array(self.data[:n_rows])
+
+        if self.scales is not None:
+            self.scales = np.array(self.scales[:n_rows])
+
+        remapped = rows >= n_rows
+
+        return dict(
+            zip(
+                keys[remapped].tolist(),
+                zip(new_rows[rows[remapped]].tolist(), similarities[rows[remapped]].tolist()),
+            )
+        )
+
+    def to_disk(self, path: str, dtype: str = "float32") -> None:
+        """Saves the vectors in the directory `path`, which is created if
+        needed, in the format described in the docstring of this module.
+
+        Args:
+            path (str): The directory to save the vectors to.
+            dtype (str): The dtype to save the vectors with, one of
+                `VECTOR_DTYPES`. int8 vectors are quantized with one
+                scale per row, see `quantize_int8()`.
+        """
+
+        assert dtype in VECTOR_DTYPES, f"Argument `dtype` should be one of {VECTOR_DTYPES}"
+
+        # If data is not yet loaded, then load it
+        if not self.loaded:
+            self._load_data()
+
+        os.makedirs(path, exist_ok=True)
+
+        n_rows, dim = self.data.shape
+
+        data = np.lib.format.open_memmap(
+            os.path.join(path, VECTORS_FILE), mode="w+", dtype=dtype, shape=(n_rows, dim)
+        )
+
+        if dtype == "int8":
+            scales = np.lib.format.open_memmap(
+                os.path.join(path, SCALES_FILE), mode="w+", dtype=np.float32, shape=(n_rows,)
+            )
+
+        elif os.path.exists(os.path.join(path, SCALES_FILE)):
+            os.remove(os.path.join(path, SCALES_FILE))
+
+        # Convert the vectors by chunks, so that a float32 copy of the
+        # whole table is never held in memory
+        for start in range(0, n_rows, CHUNK_ROWS):
+
+            end = min(start + CHUNK_ROWS, n_rows)
+
+            vectors = self.vectors_at(np.arange(start, end)).numpy()
+
+            if dtype == "int8":
+                data[start:end], scales[start:end] = quantize_int8(vectors)
+
+            else:
+                data[start:end] = vectors
+
+        data.flush()
+
+        if dtype == "int8":
+            scales.flush()
+
+        np.save(os.path.join(path, KEYS_FILE), self.key2row.keys)
+        np.save(os.path.join(path, ROWS_FILE), self.key2row.rows)
+        np.save(
+            os.path.join(path, DEFAULT_VECTOR_FILE),
+            np.asarray(self.default_vector, dtype=np.float32),
+        )
+
+    def from_disk(self, path: str, mmap: bool = True) -> "Vectors":
+        """Loads vectors saved with `to_disk()`, replacing those of the language
+        model.
+
+        Args:
+            path (str): The directory of the vectors.
+            mmap (bool): If True, the vectors are memory-mapped read-only
+                instead of being read in memory.
+
+        Returns:
+            The Vectors object itself.
+        """
+
+        mmap_mode = "r" if mmap else None
+
+        # The vectors of the language model are replaced
+        if self.loaded:
+            self.generation += 1
+
+        self.data = np.load(os.path.join(path, VECTORS_FILE), mmap_mode=mmap_mode)
+
+        if self.data.dtype == np.int8:
+            self.scales = np.load(os.path.join(path, SCALES_FILE), mmap_mode=mmap_mode)
+
+        else:
+            self.scales = None
+
+        # The default vector is small, so it is always read in memory
+        self.default_vector = torch.Tensor(np.load(os.path.join(path, DEFAULT_VECTOR_FILE)))
+
+        keys = np.load(os.path.join(path, KEYS_FILE), mmap_mode=mmap_mode)
+        rows = np.load(os.path.join(path, ROWS_FILE), mmap_mode=mmap_mode)
+
+        # The keys are saved sorted, so they are searched in place
+        self.key2row = KeyIndex(keys, rows)
+        self._row_keys = None
+
+        self.loaded = True
+
+        return self
+
+
+def save_package(vectors: Vectors, path: str, model_name: str, dtype: str = "float32") -> str:
+    """Saves a language model package named `syfertext_{model_name}` in the
+    directory `path`, whose vectors are memory-mapped from a copy of `vectors`.
+    The package is used by adding `path` to the Python path, or by copying it
+    to an installed location, and loading the language model `model_name`.
+
+    Args:
+        vectors (Vectors): The vectors of the language model.
+        path (str): The directory to save the package in.
+        model_name (str): The name of the language model.
+        dtype (str): The dtype to save the vectors with, see `Vectors.to_disk()`.
+
+    Returns:
+        The directory of the package.
+    """
+
+    package_path = os.path.join(path, f"syfertext_{model_name}")
+
+    vectors.to_disk(os.path.join(package_path, "vectors"), dtype=dtype)
+
+    with open(os.path.join(package_path, "__init__.py"), "w") as f:
+        f.write(PACKAGE_INIT.format(model_name=model_name, source=vectors.model_name))
+
+    return package_path
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Converts the vectors of a language model to a memory-mappable table."
+    )
+    parser.add_argument("model_name", help="name of the language model, e.g. en_core_web_lg")
+    parser.add_argument("output", help="directory to save the vectors to")
+    parser.add_argument(
+        "--dtype", default="float32", choices=VECTOR_DTYPES, help="dtype of the saved vectors"
+    )
+    parser.add_argument("--prune", type=int, help="number of rows to keep, the others are remapped")
+    parser.add_argument(
+        "--package", help="name of a language model package to save in the output directory"
+    )
+    args = parser.parse_args()
+
+    vectors = Vectors(args.model_name)
+
+    if args.prune is not None:
+
+        remapped = vectors.prune(args.prune)
+
+        if remapped:
+            mean = sum(similarity for _, similarity in remapped.values()) / len(remapped)
+            print(f"{len(remapped)} keys remapped, mean cosine similarity {mean:.3f}")
+
+    if args.package is not None:
+        output = save_package(vectors, args.output, args.package, dtype=args.dtype)
+
+    else:
+        output = args.output
+        vectors.to_disk(output, dtype=args.dtype)
+
+    print(
+        f"{len(vectors.key2row)} keys and {len(vectors.data)} {args.dtype} vectors saved to {output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
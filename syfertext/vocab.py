@@ -3,21 +3,59 @@ import os
 from pathlib import Path
 from typing import Union
 from typing import List
+from typing import Dict
 from typing import Callable
+from typing import Optional
+from typing import Tuple
 import functools
+import importlib
 import warnings
+import weakref
+
+import numpy as np
 
 from .vectors import Vectors
 from .string_store import StringStore
+from .string_store import CompactStringStore
 from .lexeme import Lexeme
 from .lexeme import LexemeMeta
+from .lexeme import LEX_META_FIELDS
+from .lex_store import LexStore
+from .lex_table import LexTable
 from .attrs import Attributes
 from .lex_attrs import LEX_ATTRS
+from .lex_attrs import BATCH_LEX_ATTRS
 from .stop_words import STOP_WORDS
 
 
 class Vocab:
-    def __init__(self, model_name: str):
+    def __init__(
+        self,
+        model_name: str,
+        compact_store: bool = False,
+        max_strings: int = None,
+        store_path: str = None,
+    ):
+        """Initializes the Vocab object.
+
+        Args:
+            model_name (str): The name of the language model.
+            compact_store (bool): If True, strings are held in a `CompactStringStore`
+                which uses much less memory than a `StringStore` for large
+                vocabularies, at the cost of slower lookups.
+            max_strings (int): If set, the vocabulary is bounded: when more than
+                `max_strings` strings that do not belong to the base model are
+                stored, those that no live Doc or Lexeme references anymore are
+                evicted along with their lexemes. See `evict_strings()`.
+            store_path (str): The path of a file written by `to_disk()` of a
+                string store, holding the strings of the base model. They are
+                memory-mapped if `compact_store` is True, and read in memory
+                otherwise. See `StringStore.from_disk()`.
+        """
+
+        assert max_strings is None or (
+            isinstance(max_strings, int) and max_strings >= 0
+        ), "Argument `max_strings` should be a non-negative `int`"
 
         self.model_name = model_name
 
@@ -26,10 +64,15 @@ class Vocab:
         # their hashes. It can be used to retrieve a string given its hash
         # key, or vice versa.
         # Only strings that are encountered during tokenization will be stored here
-        self.store = StringStore()
+        if store_path is not None:
+            self.store = StringStore.from_disk(store_path, mmap=compact_store)
+
+        else:
+            self.store = CompactStringStore() if compact_store else StringStore()
 
-        # Lookup table of Lexeme objects, the key is equal to orth value of lex(hash of string)
-        self.lex_store = {}
+        # Lookup table of the attributes of the lexemes, indexed by their orth value
+        # (hash of string). Indexing it returns a LexemeMeta object.
+        self.lex_store = LexStore()
 
         # Function to get the lexical attributes stored in a dict
         # with key as correseponding attribute ID.
@@ -49,6 +92,35 @@ class Vocab:
         # Create the Vectors object
         self.vectors = Vectors(model_name)
 
+        # The generation of the vectors the `id` attributes of the lexemes
+        # were resolved with, see `refresh_vector_rows()`
+        self._vectors_generation = self.vectors.generation
+
+        # The precomputed lexeme table of the language model, if it ships one.
+        # Like the vectors, it is loaded when first needed.
+        self._lex_table = None
+        self._lex_table_loaded = False
+
+        self.max_strings = max_strings
+
+        # The live Docs created with this vocabulary, keyed by their `id()`.
+        # They are only tracked in bounded mode.
+        self._docs = weakref.WeakValueDictionary()
+
+        # The live Lexemes created with this vocabulary, keyed by their `id()`.
+        # Like Docs, they are only tracked in bounded mode.
+        self._lexemes = weakref.WeakValueDictionary()
+
+        # The number of unpinned strings above which strings are evicted. It
+        # grows when many strings are still referenced after an eviction, so
+        # that evictions do not happen for every Doc.
+        self._eviction_threshold = max_strings
+
+        # Eviction counters, see `memory_usage()`
+        self._evictions = 0
+        self._evicted_strings = 0
+        self._evicted_lexemes = 0
+
     def load_strings(self) -> List[str]:
         """load the pickled list of words that the Vocab object knows and has vectors for"""
 
@@ -90,6 +162,10 @@ class Vocab:
         previously unseen string is given, a new lexeme is created and
         stored.
 
+        In bounded mode, the string and the lexeme are not evicted while the
+        returned Lexeme is alive. Its `lex_meta` should not be used after the
+        Lexeme itself is discarded, since it might be evicted then.
+
         Args:
             key: The word hash, or its plaintext. 
 
@@ -128,9 +204,80 @@ class Vocab:
 
         return self.vectors.has_vector(key)
 
+    def refresh_vector_rows(self) -> None:
+        """Resolves the `id` attributes of the lexemes again if the vectors
+        changed since they were resolved, e.g. with `Vectors.prune()` or
+        `Vectors.from_disk()`, which increment `Vectors.generation`.
+
+        It is called before the vector rows of lexemes are read, so that
+        lexemes created before the change get the rows of the new vectors.
+        """
+
+        if self._vectors_generation != self.vectors.generation:
+
+            self.lex_store.column("id")[:] = self.vectors.get_rows(self.lex_store.orths)
+
+            self._vectors_generation = self.vectors.generation
+
+    def prune_vectors(self, n_rows: int, batch_size: int = 1024) -> Dict[int, Tuple[int, float]]:
+        """Prunes the vectors with `Vectors.prune()`, keeping their first
+        `n_rows` rows, and updates the vector rows of the lexemes.
+
+        The lexemes whose vector row was removed are mapped to the row of the
+        nearest kept vector, so they still have a vector.
+
+        Args:
+            n_rows (int): The number of rows to keep.
+            batch_size (int): See `Vectors.prune()`.
+
+        Returns:
+            A dict mapping each remapped key to the tuple of its new row and the
+            cosine similarity between its former vector and the new one.
+        """
+
+        remapped = self.vectors.prune(n_rows, batch_size=batch_size)
+
+        # Update the `id` attributes in place
+        self.refresh_vector_rows()
+
+        return remapped
+
+    @property
+    def lex_table(self) -> Optional[LexTable]:
+        """The precomputed lexeme table of the language model, or None if the
+        language model package has no `lex_table` loader. The loader returns
+        the path of a table saved with `LexTable.to_disk()`.
+        """
+
+        if not self._lex_table_loaded:
+
+            # Import the language model
+            model = importlib.import_module(f"syfertext_{self.model_name}")
+
+            loader = getattr(model, "LOADERS").get("lex_table")
+
+            if loader is not None:
+                self._lex_table = LexTable.from_disk(loader())
+
+            self._lex_table_loaded = True
+
+        return self._lex_table
+
+    def load_lex_table(self, path: str) -> None:
+        """Uses the lexeme table saved in `path` instead of the one of the
+        language model package.
+
+        Args:
+            path (str): The directory of a table saved with `LexTable.to_disk()`.
+        """
+
+        self._lex_table = LexTable.from_disk(path)
+        self._lex_table_loaded = True
+
     def get_lex_meta(self, orth: int) -> Union[LexemeMeta]:
         """Get a LexemeMeta from the lexstore, creating a new
-        Lexeme if necessary.
+        Lexeme if necessary. The attributes of new lexemes are read from
+        the lexeme table if `orth` is in it, and computed otherwise.
         
         Args:
             orth: The word hash for which the LexemeMeta object is requested.
@@ -146,16 +293,59 @@ class Vocab:
         lex_meta = self.lex_store.get(orth)
 
         # If the LexemeMeta object already exist it returned.
-        if lex_meta:
+        if lex_meta is not None:
             return lex_meta
 
         # LexemeMeta instance doesn't exist for the given orth
         else:
+            lex_table = self.lex_table
+
+            # Read the attributes from the lexeme table
+            if lex_table is not None:
+
+                index = lex_table.find(orth)
+
+                if index >= 0:
+                    return self._read_lex_meta(lex_table, index)
+
             # Create the new LexemeMeta object.
             return self._create_lex_meta(self.store[orth])
 
+    def _read_lex_meta(self, lex_table: LexTable, index: int) -> LexemeMeta:
+        """Stores the lexeme of the row at `index` of `lex_table` in the lex
+        store.
+
+        Args:
+            lex_table (LexTable): The lexeme table.
+            index (int): The index of the row.
+
+        Returns:
+            The LexemeMeta object.
+        """
+
+        attrs = lex_table.row(index)
+
+        # The row of the vector precomputed by the table is only valid for the
+        # vectors of the language model. If they were changed since, e.g. by
+        # `prune_vectors()`, it is looked up in the vectors instead.
+        if self.vectors.generation > 0:
+            row = self.vectors.get_row(attrs["orth"])
+            attrs["id"] = None if row < 0 else row
+
+        # Add the strings of the attributes to the store if they are not there yet
+        for name in ("lower", "shape", "prefix", "suffix"):
+
+            try:
+                self.store[attrs[name]]
+
+            except KeyError:
+                self.store.add(lex_table.strings[attrs[name]])
+
+        return self.lex_store.add(lang=self.store.add(self.model_name), **attrs)
+
     def _create_lex_meta(self, string: str) -> LexemeMeta:
-        """Creates a LexemeMeta object corresponding to `string`.
+        """Creates a LexemeMeta object corresponding to `string` and stores
+        it in the lex store.
         
         Args:
             string: The plaintext string for which a LexemeMeta object is to be created.
@@ -164,22 +354,32 @@ class Vocab:
             A LexemeMeta object corresponding to `string`.
         """
 
-        # create the new LexemeMeta object
-        lex_meta = LexemeMeta()
+        return self.lex_store.add(**self._compute_lex_meta(string))
+
+    def _compute_lex_meta(self, string: str) -> Dict[str, int]:
+        """Computes the attributes of the lexeme corresponding to `string` by
+        running the lexical attribute getters, without storing it.
+
+        Args:
+            string: The plaintext string for which the attributes are to be computed.
+
+        Returns:
+            A dict mapping the names of the attributes to their values, which
+            can be passed to `LexStore.add()`.
+        """
 
         # Assign the lex attributes
-        lex_meta.orth = self.store.add(string)
-        lex_meta.length = len(string)
+        attrs = dict(orth=self.store.add(string), length=len(string), flags=0)
 
         # The language model name of parent vocabulary
-        lex_meta.lang = self.store.add(self.model_name)
+        attrs["lang"] = self.store.add(self.model_name)
 
-        # id is the index of the corresponding vector
-        # in self.vectors if we vectors are loaded.
-        if not self.vectors.loaded:
-            lex_meta.id = None
-        else:
-            lex_meta.id = self.vectors.key2row.get(lex_meta.orth)
+        # id is the index of the corresponding vector in self.vectors, which
+        # are loaded if needed. Tokens and lexemes read their vector through
+        # it instead of hashing their string again. It is resolved again if
+        # the vectors change, see `refresh_vector_rows()`.
+        row = self.vectors.get_row(attrs["orth"])
+        attrs["id"] = None if row < 0 else row
 
         # Traverse all the lexical attributes getters in the dict.
         for attr, func in self.lex_attr_getters.items():
@@ -187,18 +387,325 @@ class Vocab:
 
             # check if string id out of vocabulary
             if attr == Attributes.IS_OOV:
-                value = not self.has_vector(string)
+                value = attrs["id"] is None
 
             # For attributes with string values add them to string store
             # and assign the orth id of that to LexemeMeta object
             if isinstance(value, str):
                 value = self.store.add(value)
 
-            # Assign rest of the attributes to the LexemeMeta object
-            if value:
-                lex_meta.set_lexmeta_attr(attr_id=attr, value=value)
+            # Assign rest of the attributes, setting the bit of flags
+            if not value:
+                continue
+
+            if attr > 9:
+                attrs["flags"] |= 1 << attr
+
+            elif attr in LEX_META_FIELDS:
+                attrs[LEX_META_FIELDS[attr]] = value
+
+        return attrs
+
+    def create_lex_metas(self, strings: List[str]) -> List[LexemeMeta]:
+        """Gets the LexemeMeta objects of several strings at once, creating
+        those that are not in the lex store yet.
+
+        New lexemes are read from the lexeme table when possible, and the
+        attributes of the others are computed for all of them in one pass,
+        which is faster than calling `get_lex_meta()` for each string
+        when many of them are new.
+
+        Args:
+            strings (list of str): The strings for which LexemeMeta objects are requested.
+
+        Returns:
+            The list of the LexemeMeta objects of `strings`, in the same order.
+        """
+
+        strings = list(strings)
+
+        orths = self.store.add_many(strings)
+
+        # The distinct orths that are not in the lex store yet, and the
+        # position of their first string
+        unique_orths, first = np.unique(orths, return_index=True)
+
+        missing = self.lex_store.find_many(unique_orths) < 0
+
+        lex_table = self.lex_table
+
+        new_strings = []
+
+        for orth, index in zip(unique_orths[missing].tolist(), first[missing].tolist()):
+
+            # Read the attributes from the lexeme table
+            if lex_table is not None:
+
+                table_index = lex_table.find(orth)
+
+                if table_index >= 0:
+                    self._read_lex_meta(lex_table, table_index)
+                    continue
+
+            new_strings.append(strings[index])
+
+        # Store the new lexemes in the lex store.
+        if new_strings:
+
+            columns = self._compute_lex_metas(new_strings)
+
+            self.lex_store.add_many(columns.pop("orth"), **columns)
+
+        rows = self.lex_store.find_many(orths)
 
-        # Store the LexemeMeta object in the lex store.
-        self.lex_store[lex_meta.orth] = lex_meta
+        return [
+            LexemeMeta(self.lex_store, orth, row)
+            for orth, row in zip(orths.tolist(), rows.tolist())
+        ]
 
-        return lex_meta
+    def get_vector_rows(self, orths: np.ndarray) -> np.ndarray:
+        """Returns the rows in `self.vectors` of the vectors of several lexemes
+        at once, read from their `id` attribute. The lexemes that are not in
+        the lex store yet are created.
+
+        Args:
+            orths (np.ndarray): The uint64 array of the orths of the lexemes.
+                Their strings should be in the string store.
+
+        Returns:
+            The int64 array of rows, which is -1 for the lexemes that have no vector.
+        """
+
+        orths = np.asarray(orths, dtype=np.uint64)
+
+        self.refresh_vector_rows()
+
+        rows = self.lex_store.find_many(orths)
+
+        missing = rows < 0
+
+        if missing.any():
+
+            self.create_lex_metas(self.store.lookup_many(np.unique(orths[missing])))
+
+            rows = self.lex_store.find_many(orths)
+
+        return self.lex_store.column("id")[rows]
+
+    def _compute_lex_metas(self, strings: List[str]) -> Dict[str, np.ndarray]:
+        """Computes the attributes of the lexemes corresponding to several
+        distinct strings without storing them. The attributes are the same as
+        those `_compute_lex_meta()` gives, but each attribute getter is run on
+        all the strings at once using its batch version in `BATCH_LEX_ATTRS`,
+        if it has one.
+
+        Args:
+            strings (list of str): The distinct plaintext strings.
+
+        Returns:
+            A dict mapping the names of the attributes to the arrays of their values,
+            in the same order as `strings`. The `orth` array can be passed to
+            `LexStore.add_many()` along with the others. In the `id` array, -1
+            stands for None.
+        """
+
+        n = len(strings)
+
+        orths = self.store.add_many(strings)
+
+        # The values of the attributes of the lexemes, by attribute name
+        columns = dict(
+            orth=orths,
+            length=np.fromiter(map(len, strings), dtype=np.uint32, count=n),
+            lang=np.full(n, self.store.add(self.model_name), dtype=np.uint64),
+        )
+
+        # id is the index of the corresponding vector in self.vectors
+        columns["id"] = self.vectors.get_rows(orths)
+
+        flags = np.zeros(n, dtype=np.uint64)
+
+        # Traverse all the lexical attributes getters in the dict.
+        for attr, func in self.lex_attr_getters.items():
+
+            # check which strings are out of vocabulary
+            if attr == Attributes.IS_OOV:
+                values = columns["id"] < 0
+
+            else:
+                values = self._get_lex_attr_values(func, strings)
+
+            # Set the bit of the flag for the strings whose value is true
+            if attr > 9:
+                bits = np.fromiter(map(bool, values), dtype=np.bool_, count=n)
+                flags |= bits.astype(np.uint64) << np.uint64(attr)
+                continue
+
+            # For attributes with string values add them to string store
+            # and use the orth ids of these strings
+            if set(map(type, values)) <= {str}:
+                values = self.store.add_many(values)
+
+            else:
+                values = [self.store.add(v) if isinstance(v, str) else v or 0 for v in values]
+
+            if attr in LEX_META_FIELDS:
+                columns[LEX_META_FIELDS[attr]] = np.asarray(values, dtype=np.uint64)
+
+        columns["flags"] = flags
+
+        return columns
+
+    def _get_lex_attr_values(self, func: Callable, strings: List[str]) -> list:
+        """Returns the values of the attribute getter `func` for `strings`,
+        using its batch version if it has one.
+        """
+
+        # The stop word getter is a partial function holding the stop words
+        if isinstance(func, functools.partial):
+            batch_func = BATCH_LEX_ATTRS.get(func.func)
+
+            if batch_func is not None:
+                return batch_func(strings, *func.args, **func.keywords)
+
+        elif func in BATCH_LEX_ATTRS:
+            return BATCH_LEX_ATTRS[func](strings)
+
+        return list(map(func, strings))
+
+    def pin(self) -> None:
+        """Pins all the strings currently in the store, and thus their lexemes,
+        as belonging to the base model, so that they are never evicted in
+        bounded mode.
+        """
+
+        self.store.pin()
+
+    def track_doc(self, doc: "Doc") -> None:
+        """Registers a Doc created with this vocabulary so that the strings of its
+        tokens are not evicted while it is alive. This is a no-op unless the
+        vocabulary is bounded.
+
+        Args:
+            doc (Doc): The Doc object.
+        """
+
+        if self.max_strings is not None:
+            self._docs[id(doc)] = doc
+
+    def track_lexeme(self, lexeme: Lexeme) -> None:
+        """Registers a Lexeme created with this vocabulary so that its string
+        and the strings of its attributes are not evicted while it is alive.
+        This is a no-op unless the vocabulary is bounded.
+
+        Args:
+            lexeme (Lexeme): The Lexeme object.
+        """
+
+        if self.max_strings is not None:
+            self._lexemes[id(lexeme)] = lexeme
+
+    def evict_strings(self, force: bool = False) -> int:
+        """In bounded mode, evicts the strings that do not belong to the base
+        model and are not referenced anymore, along with their lexemes.
+
+        Strings belonging to the base model are those pinned by `pin()`, those
+        memory-mapped by the store, and those having a vector, if the vectors
+        are loaded. A string is referenced if it is the string of a token of
+        a live Doc or of a live Lexeme, or an attribute (e.g. `lower`) of a
+        lexeme that is kept.
+        The lexemes of evicted strings are removed from the lexeme store.
+
+        This is called by the tokenizer after each Doc it creates, and only
+        does something once the number of unpinned strings exceeds `max_strings`.
+
+        Args:
+            force (bool): If True, evict even if `max_strings` is not exceeded.
+
+        Returns:
+            The number of evicted strings.
+        """
+
+        if self.max_strings is None:
+            return 0
+
+        n_unpinned = len(self.store) - self.store.n_pinned
+
+        if not force and n_unpinned <= self._eviction_threshold:
+            return 0
+
+        unpinned = self.store.unpinned_keys()
+
+        # Strings having a vector belong to the base model
+        if self.vectors.loaded:
+
+            has_vector = self.vectors.has_vector_many(unpinned.tolist())
+
+            live = [unpinned[has_vector]]
+            unpinned = unpinned[~has_vector]
+
+        else:
+            live = []
+
+        # The strings of the tokens of live Docs
+        docs = list(self._docs.values())
+
+        live += [doc.container.orths for doc in docs]
+
+        # The strings of live Lexemes
+        lexemes = list(self._lexemes.values())
+
+        live.append(np.array([lexeme.orth for lexeme in lexemes], dtype=np.uint64))
+
+        runtime = set(unpinned.tolist()).difference(*(keys.tolist() for keys in live))
+
+        # Remove the lexemes of the strings to evict, and keep the strings of the
+        # attributes of the other lexemes
+        evict = np.isin(self.lex_store.orths, np.fromiter(runtime, dtype=np.uint64))
+
+        for name in ("lower", "shape", "prefix", "suffix", "lang"):
+            live.append(self.lex_store.column(name)[~evict])
+
+        self._evicted_lexemes += self.lex_store.remove_many(self.lex_store.orths[evict].tolist())
+
+        evicted = self.store.evict(np.concatenate(live))
+
+        self._evictions += 1
+        self._evicted_strings += len(evicted)
+
+        # Evict again only once the number of unpinned strings has doubled
+        n_unpinned = len(self.store) - self.store.n_pinned
+        self._eviction_threshold = max(self.max_strings, 2 * n_unpinned)
+
+        return len(evicted)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Returns counters describing the memory used by the vocabulary.
+
+        Returns:
+            dict: A dict with the following keys:
+                strings: The number of strings in the store.
+                pinned_strings: The number of pinned strings.
+                store_bytes: The number of bytes used by the store (see `nbytes`
+                    of the store classes).
+                lexemes: The number of lexemes in the lexeme store.
+                lex_store_bytes: The number of bytes used by the lexeme store.
+                live_docs: The number of live Docs tracked in bounded mode.
+                live_lexemes: The number of live Lexemes tracked in bounded mode.
+                evictions: The number of times strings were evicted.
+                evicted_strings: The total number of evicted strings.
+                evicted_lexemes: The total number of evicted lexemes.
+        """
+
+        return dict(
+            strings=len(self.store),
+            pinned_strings=self.store.n_pinned,
+            store_bytes=self.store.nbytes,
+            lexemes=len(self.lex_store),
+            lex_store_bytes=self.lex_store.nbytes,
+            live_docs=len(self._docs),
+            live_lexemes=len(self._lexemes),
+            evictions=self._evictions,
+            evicted_strings=self._evicted_strings,
+            evicted_lexemes=self._evicted_lexemes,
+        )
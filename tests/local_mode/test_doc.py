@@ -226,6 +226,19 @@ def test_get_token_vectors():
     assert doc.get_token_vectors().shape[0] == 5
 
 
+def test_get_token_vectors_match_token_vectors():
+    """Test that the vectors gathered at once by get_token_vectors are
+    those of the tokens, including the default vector of unknown tokens.
+    """
+
+    doc = nlp("Joey outofvocabularytoken share food")
+
+    token_vectors = doc.get_token_vectors()
+
+    for i, token in enumerate(doc):
+        assert torch.equal(token_vectors[i], token.vector)
+
+
 def test_ownership_doc_local():
     """Tests that the doc object created on the local worker is owned by the local worker itself"""
 
@@ -267,3 +280,57 @@ def test_nbor():
     nbor_ids = range(-2, 2)
 
     assert all([doc[idx].text == token.nbor(offset).text for idx, offset in enumerate(nbor_ids)])
+
+
+def test_container_behaves_like_a_list():
+    """Test that the columnar token container supports length, indexing,
+    slicing and iteration like a list of TokenMeta objects.
+    """
+
+    doc = nlp("I love  apples ")
+
+    metas = list(doc.container)
+
+    assert len(doc.container) == len(metas) == len(doc)
+    assert doc.container[-1].orth == metas[-1].orth
+    assert [meta.space_after for meta in doc.container] == [True, True, False, True]
+
+    # Slicing gives a container holding copies of the tokens
+    sliced = doc.container[1:3]
+
+    assert [meta.orth for meta in sliced] == [meta.orth for meta in metas[1:3]]
+
+    sliced[1].space_after = True
+    assert not doc.container[2].space_after
+
+
+def test_container_keeps_custom_attributes():
+    """Test that custom attributes set on tokens are stored in the container
+    and follow the tokens when the Doc is sliced.
+    """
+
+    doc = nlp("on your left")
+
+    doc[1].set_attribute(name="tag", value="PRON")
+
+    # Only the token with a custom attribute has an Underscore object
+    assert len(doc.container._underscores) == 1
+
+    assert doc[1].get_attribute("tag") == "PRON"
+    assert doc[1:3].as_doc()[0].get_attribute("tag") == "PRON"
+
+
+def test_custom_attributes_are_allocated_lazily():
+    """Test that looking up custom attributes does not create Underscore
+    objects for a Doc and its tokens.
+    """
+
+    doc = nlp("on your left")
+
+    for token in doc:
+        assert not token.has_attribute("tag")
+
+    assert not doc.has_attribute("tag")
+
+    assert doc._underscore is None
+    assert len(doc.container._underscores) == 0
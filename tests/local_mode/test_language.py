@@ -88,3 +88,63 @@ def test_correctness_of_tokens_created():
     excep = "U.S.A"
 
     assert len(nlp(excep)) == 1  # ['U.S.A']
+
+
+def test_pipe_matches_call():
+    """Test that `pipe()` yields the same Docs as calling the Language
+    object on each text, in the same order.
+    """
+
+    texts = ["I love apples", "Hell-o world!", "", "U.S.A is big", "  spaces  "]
+
+    # Feed a generator with a batch size that does not divide the number of texts
+    docs = list(nlp.pipe((text for text in texts), batch_size=2))
+
+    assert len(docs) == len(texts)
+
+    for text, doc in zip(texts, docs):
+
+        expected = [token.text for token in nlp(text)]
+        actual = [token.text for token in doc]
+
+        assert actual == expected
+
+
+def test_pipe_is_lazy():
+    """Test that `pipe()` does not consume more texts than needed."""
+
+    consumed = []
+
+    def texts():
+        for i in range(10):
+            consumed.append(i)
+            yield f"text number {i}"
+
+    docs = nlp.pipe(texts(), batch_size=3)
+
+    # Getting the first Doc should only consume the first batch
+    next(docs)
+
+    assert len(consumed) == 3
+
+
+def test_multiprocessing_pipe():
+    """Test that tokenizing with several processes gives the same Docs,
+    in the same order, as tokenizing in the current process.
+    """
+
+    texts = [f"Text number {i}: it's (e.g.) a new-ish token_{i}!" for i in range(50)]
+
+    docs = list(nlp.pipe(texts, batch_size=4, n_process=2))
+
+    assert len(docs) == len(texts)
+
+    for text, doc in zip(texts, docs):
+
+        # The strings of the tokens should have been merged into the store
+        # before tokenizing the text in this process
+        actual = [token.text_with_ws for token in doc]
+        expected = [token.text_with_ws for token in nlp(text)]
+
+        assert actual == expected
+        assert doc.text == text
@@ -2,6 +2,10 @@ import syft as sy
 import torch
 import syfertext
 from syfertext.attrs import Attributes
+from syfertext.lex_store import LexStore
+from syfertext.lex_table import build_lex_table
+from syfertext.vocab import Vocab
+import pytest
 
 
 hook = sy.TorchHook(torch)
@@ -219,3 +223,144 @@ def test_lex_word_shape():
     for word, shape in words.items():
         # test shape of each word in the dict
         assert vocab[word].shape_ == shape
+
+
+def test_lex_table(tmp_path):
+    """Test that lexemes read from a lexeme table have the same attributes
+    as those computed by the attribute getters.
+    """
+
+    words = ["Apple", "hello", "3.14", "https://openmined.org", "the", "SyferText"]
+
+    # A fresh vocabulary, since other tests set flags on the lexemes of `vocab`
+    reference_vocab = Vocab(lang)
+
+    path = str(tmp_path / "lex_table")
+    build_lex_table(reference_vocab, words).to_disk(path)
+
+    table_vocab = Vocab(lang)
+    table_vocab.load_lex_table(path)
+
+    for word in words + ["unseen-word"]:
+
+        expected = reference_vocab[word]
+        lexeme = table_vocab[word]
+
+        assert lexeme.flags == expected.flags
+        assert lexeme.lower_ == expected.lower_
+        assert lexeme.shape_ == expected.shape_
+        assert lexeme.prefix_ == expected.prefix_
+        assert lexeme.suffix_ == expected.suffix_
+        assert lexeme.lang_ == expected.lang_
+
+    assert table_vocab.store["Apple"] in table_vocab.lex_table
+    assert table_vocab.store["unseen-word"] not in table_vocab.lex_table
+
+
+def test_lex_table_vector_rows(tmp_path):
+    """Test that lexemes read from a lexeme table take the rows of their
+    vectors from the table, without loading the vectors.
+    """
+
+    words = ["Apple", "hello", "the", "noobmaster69"]
+
+    reference_vocab = Vocab(lang)
+
+    path = str(tmp_path / "lex_table")
+    build_lex_table(reference_vocab, words).to_disk(path)
+
+    table_vocab = Vocab(lang)
+    table_vocab.load_lex_table(path)
+
+    rows = [table_vocab[word].lex_meta.id for word in words]
+
+    assert not table_vocab.vectors.loaded
+
+    assert rows == [reference_vocab[word].lex_meta.id for word in words]
+
+
+def test_create_lex_metas():
+    """Test that `create_lex_metas()` gives the same attributes as creating
+    the lexemes one string at a time.
+    """
+
+    strings = [
+        "Apple",
+        "hello",
+        "HELLO",
+        "3.14",
+        "1/2",
+        "$",
+        "(",
+        "''",
+        "...",
+        "https://openmined.org",
+        "www.openmined.org",
+        "john@openmined.org",
+        "aaaaaaBBBBBBB111111",
+        "x" * 120,
+        "café",
+        "the",
+        "Apple",
+    ]
+
+    batch_vocab = Vocab(lang)
+
+    # A fresh vocabulary creating the lexemes one string at a time, since
+    # other tests set flags on the lexemes of `vocab`
+    reference_vocab = Vocab(lang)
+
+    lex_metas = batch_vocab.create_lex_metas(strings)
+
+    assert len(lex_metas) == len(strings)
+    assert lex_metas[0].orth == lex_metas[-1].orth
+
+    for string, lex_meta in zip(strings, lex_metas):
+
+        expected = reference_vocab[string]
+        lexeme = batch_vocab[string]
+
+        assert lexeme.lex_meta.orth == lex_meta.orth
+        assert lexeme.flags == expected.flags
+        assert lexeme.lower_ == expected.lower_
+        assert lexeme.shape_ == expected.shape_
+        assert lexeme.prefix_ == expected.prefix_
+        assert lexeme.suffix_ == expected.suffix_
+        assert lexeme.is_oov == expected.is_oov
+
+
+def test_lex_store():
+    """Test that LexemeMeta objects are views on the lex store that stay
+    valid when other lexemes are removed, and that attributes can be
+    scanned over the whole store.
+    """
+
+    lex_store = LexStore(capacity=2)
+
+    for orth in range(1, 101):
+        lex_store.add(orth, flags=(orth % 2) << Attributes.IS_DIGIT, length=orth, id=orth - 1)
+
+    lex_meta = lex_store[100]
+
+    assert len(lex_store) == 100
+    assert lex_meta.length == 100
+    assert lex_meta.check_flag(Attributes.IS_DIGIT) is False
+
+    # Setting an attribute through a view sets it in the store
+    lex_meta.set_flag(Attributes.IS_DIGIT, True)
+
+    assert lex_store[100].check_flag(Attributes.IS_DIGIT)
+    assert sorted(lex_store.with_flag(Attributes.IS_DIGIT).tolist()) == list(range(1, 100, 2)) + [100]
+
+    # Removing lexemes moves the others, which the views follow
+    assert lex_store.remove_many(range(1, 51)) == 50
+
+    assert len(lex_store) == 50
+    assert 1 not in lex_store
+    assert lex_meta.length == 100
+    assert lex_meta.id == 99
+
+    del lex_store[100]
+
+    with pytest.raises(KeyError):
+        lex_meta.length
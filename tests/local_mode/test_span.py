@@ -177,3 +177,36 @@ def test_remote_span_from_remote_span():
 
     # assert returned span_pointer points to Span object on alice's machine
     assert new_span.id_at_location == new_span_alice.id
+
+
+def test_span_custom_attributes():
+    """Test setting, getting and removing custom attributes of a Span."""
+
+    doc = nlp("the quick brown fox")
+    span = doc[1:3]
+
+    assert not span.has_attribute("label")
+
+    span.set_attribute(name="label", value="ADJ")
+
+    assert span.has_attribute("label")
+    assert span.get_attribute("label") == "ADJ"
+
+    span.remove_attribute("label")
+
+    assert not span.has_attribute("label")
+
+
+def test_span_text():
+    """Test that the text of a Span is the slice of the text of its Doc,
+    including the original white spaces between the tokens.
+    """
+
+    doc = nlp("the quick\tbrown\nfox jumps")
+    span = doc[1:4]
+
+    assert span.text == "quick\tbrown\nfox"
+    assert span.text_with_ws == "quick\tbrown\nfox "
+
+    # The text of a Span converted to a Doc is sliced the same way
+    assert span.as_doc().text == "quick\tbrown\nfox "
@@ -2,6 +2,13 @@ import syft
 import torch
 import syfertext
 from syfertext.string_store import StringStore
+from syfertext.string_store import CompactStringStore
+from syfertext.tokenizer import Tokenizer
+from syfertext.vocab import Vocab
+from syfertext import parallel
+
+import numpy as np
+import pytest
 
 # Create a torch hook for PySyft
 hook = syft.TorchHook(torch)
@@ -78,3 +85,321 @@ def test_dynamic_store_size():
 
     # Check that 4 strings have been added in store
     assert len(nlp.vocab.store) == 4
+
+
+def test_compact_store_matches_store():
+    """Test that CompactStringStore gives the same keys and strings as StringStore,
+    also after its arrays and hash table grow.
+    """
+
+    words = [f"word{i}" for i in range(1000)] + ["", "naïve", "日本語", "apple"]
+
+    # Start with a small capacity so that the arrays grow several times
+    compact_store = CompactStringStore(strings=words[:10], capacity=2)
+    dict_store = StringStore(strings=words[:10])
+
+    for word in words:
+        assert compact_store.add(word) == dict_store.add(word)
+
+    # Adding a string twice does not store it twice
+    assert len(compact_store) == len(dict_store) == len(words)
+
+    for word in words:
+
+        key = dict_store[word]
+
+        assert word in compact_store
+        assert compact_store[word] == key
+        assert compact_store[key] == word
+
+
+def test_compact_store_unknown_strings():
+    """Test that unknown strings are not in a CompactStringStore until they
+    are looked up, and that unknown keys raise a KeyError.
+    """
+
+    compact_store = CompactStringStore(strings=strings)
+
+    assert "banana" not in compact_store
+
+    key = compact_store["banana"]
+
+    assert "banana" in compact_store
+    assert compact_store[key] == "banana"
+
+    with pytest.raises(KeyError):
+        compact_store[key + 1]
+
+    with pytest.raises(TypeError):
+        compact_store[1.0]
+
+
+def test_tokenize_with_compact_store():
+    """Test that a tokenizer gives the same tokens with a compact store."""
+
+    text = "(e.g. it's U.S.  the apple-pie!) naïve"
+
+    doc = Tokenizer(Vocab("en_core_web_lg"))(text)
+    compact_doc = Tokenizer(Vocab("en_core_web_lg", compact_store=True))(text)
+
+    assert [token.text for token in compact_doc] == [token.text for token in doc]
+    assert compact_doc.text == text
+
+
+def test_store_to_disk_and_from_disk(tmp_path):
+    """Test that the strings written by `to_disk()` are loaded back by
+    `from_disk()`, with and without memory-mapping.
+    """
+
+    words = [f"word{i}" for i in range(100)] + ["", "naïve", "日本語"]
+
+    path = str(tmp_path / "strings")
+
+    StringStore(strings=words).to_disk(path)
+
+    loaded_stores = [
+        StringStore.from_disk(path),
+        StringStore.from_disk(path, mmap=True),
+        CompactStringStore.from_disk(path, mmap=True),
+        CompactStringStore.from_disk(path, mmap=False),
+    ]
+
+    for loaded_store in loaded_stores:
+
+        assert len(loaded_store) == len(words)
+
+        for word in words:
+
+            assert word in loaded_store
+            assert loaded_store[loaded_store[word]] == word
+
+
+def test_vocab_store_path(tmp_path):
+    """Test that a Vocab loads the strings of its `store_path`, memory-mapped
+    with a compact store and read in memory otherwise.
+    """
+
+    path = str(tmp_path / "strings")
+    StringStore(strings=strings).to_disk(path)
+
+    mapped_vocab = Vocab("en_core_web_lg", compact_store=True, store_path=path)
+    dict_vocab = Vocab("en_core_web_lg", store_path=path)
+
+    assert isinstance(mapped_vocab.store, CompactStringStore)
+    assert mapped_vocab.store.path == path
+    assert isinstance(dict_vocab.store, StringStore)
+
+    for vocab in (mapped_vocab, dict_vocab):
+
+        assert len(vocab.store) == len(strings)
+        assert vocab.store.n_pinned == len(strings)
+        assert vocab.store[vocab.store["apple"]] == "apple"
+
+        # The strings of the base model are not evicted
+        assert len(vocab.store.unpinned_keys()) == 0
+
+
+def test_mapped_store_overlay(tmp_path):
+    """Test that strings added to a memory-mapped store are kept in memory
+    without changing the file, and are written along with the mapped strings
+    by `to_disk()`.
+    """
+
+    path = str(tmp_path / "strings")
+    CompactStringStore(strings=strings).to_disk(path)
+
+    mapped_store = CompactStringStore.from_disk(path)
+
+    assert mapped_store.path == path
+
+    # Adding a mapped string does not add it again
+    mapped_store.add("apple")
+    key = mapped_store.add("banana")
+
+    assert len(mapped_store) == len(strings) + 1
+    assert mapped_store[key] == "banana"
+
+    # The file is unchanged
+    assert "banana" not in CompactStringStore.from_disk(path)
+
+    # Both the mapped and the added strings are written
+    new_path = str(tmp_path / "new_strings")
+    mapped_store.to_disk(new_path)
+
+    new_store = CompactStringStore.from_disk(new_path)
+
+    assert len(new_store) == len(strings) + 1
+    assert all(word in new_store for word in strings + ["banana"])
+
+
+@pytest.mark.parametrize("store_class", [StringStore, CompactStringStore])
+def test_add_many_and_lookup_many(store_class):
+    """Test that `add_many()` and `lookup_many()` give the same results as
+    `add()` and `__getitem__()` called for each string.
+    """
+
+    words = ["apple", "banana", "apple", "naïve", "", "banana"] + [f"word{i}" for i in range(100)]
+
+    bulk_store = store_class(strings=["apple"])
+    store = store_class(strings=["apple"])
+
+    keys = bulk_store.add_many(words)
+
+    assert keys.dtype == np.uint64
+    assert keys.tolist() == [store.add(word) for word in words]
+    assert len(bulk_store) == len(store)
+
+    assert bulk_store.lookup_many(keys) == words
+    assert bulk_store.lookup_many(keys.tolist()) == words
+
+    with pytest.raises(KeyError):
+        bulk_store.lookup_many([keys[0], keys[0] + 1])
+
+    with pytest.raises(TypeError):
+        bulk_store.add_many(["cherry", 1])
+
+    # Nothing is added if a type check fails
+    assert "cherry" not in bulk_store
+
+
+def test_add_many_to_mapped_store(tmp_path):
+    """Test that `add_many()` only adds the strings that are not memory-mapped."""
+
+    path = str(tmp_path / "strings")
+    CompactStringStore(strings=strings).to_disk(path)
+
+    mapped_store = CompactStringStore.from_disk(path)
+
+    keys = mapped_store.add_many(["apple", "banana", "have"])
+
+    assert len(mapped_store) == len(strings) + 1
+    assert mapped_store.lookup_many(keys) == ["apple", "banana", "have"]
+
+
+@pytest.mark.parametrize("store_class", [StringStore, CompactStringStore])
+def test_evict_unpinned_strings(store_class):
+    """Test that `evict()` only removes the strings that are neither pinned
+    nor live, and that the remaining strings can still be looked up.
+    """
+
+    store = store_class(strings=strings)
+    store.pin()
+
+    runtime_keys = store.add_many([f"id{i}" for i in range(100)])
+
+    # Keep every other runtime string
+    live_keys = runtime_keys[::2]
+
+    evicted = store.evict(live_keys)
+
+    assert sorted(evicted.tolist()) == sorted(runtime_keys[1::2].tolist())
+    assert store.generation == 1
+    assert len(store) == len(strings) + 50
+    assert store.n_pinned == len(strings)
+
+    assert all(word in store for word in strings)
+    assert store.lookup_many(live_keys) == [f"id{i}" for i in range(0, 100, 2)]
+    assert "id1" not in store
+
+    # Evicted strings can be added again
+    assert store.add("id1") == runtime_keys[1]
+    assert store["id1"] == runtime_keys[1]
+
+
+def test_bounded_vocab_evicts_unused_strings():
+    """Test that a bounded vocabulary evicts the strings that no live Doc
+    references, and keeps those of live Docs and of the base model.
+    """
+
+    vocab = Vocab("en_core_web_lg", max_strings=50)
+    tokenizer = Tokenizer(vocab)
+
+    # The strings of the base model are pinned
+    tokenizer("the quick brown fox")
+    vocab.pin()
+
+    text = "apple-pie id_live it's!"
+    live_doc = tokenizer(text)
+
+    # Create the lexemes of the tokens
+    lowers = [token.lower_ for token in live_doc]
+
+    for i in range(200):
+        doc = tokenizer(f"the id_{i} fox")
+
+    del doc
+
+    usage = vocab.memory_usage()
+
+    assert usage["evictions"] > 0
+    assert usage["evicted_strings"] > 0
+    assert usage["strings"] <= usage["pinned_strings"] + 2 * 50
+
+    # The tokens of the live Doc and the pinned strings are still there
+    assert [token.lower_ for token in live_doc] == lowers
+    assert live_doc.text == text
+    assert "quick" in vocab.store
+
+    # Tokenizing after an eviction does not use stale cached tokens
+    doc = tokenizer("the id_0 fox")
+
+    assert [token.text for token in doc] == ["the", "id_0", "fox"]
+
+
+def test_bounded_pipe_worker():
+    """Test that the vocabulary of a `Language.pipe()` worker process is
+    bounded like that of the parent process, and that the strings of a batch
+    are shipped even if they are evicted from the worker vocabulary.
+    """
+
+    config = parallel.get_tokenizer_config(Tokenizer(Vocab("en_core_web_lg")))
+
+    parallel.init_worker("en_core_web_lg", config, reship=True, max_strings=20, compact_store=True)
+
+    vocab = parallel._tokenizer.vocab
+
+    assert vocab.max_strings == 20
+    assert isinstance(vocab.store, CompactStringStore)
+
+    for i in range(20):
+
+        texts = [f"the id_{i}_{j} fox" for j in range(10)]
+
+        payloads, strings = parallel.tokenize_batch(texts)
+
+        assert len(payloads) == len(texts)
+        assert sorted(strings) == sorted(set(" ".join(texts).split()))
+
+    usage = vocab.memory_usage()
+
+    assert usage["evictions"] > 0
+    assert usage["strings"] <= usage["pinned_strings"] + 2 * 20
+
+
+def test_bounded_vocab_keeps_strings_of_live_lexemes():
+    """Test that a bounded vocabulary does not evict the strings of a live
+    Lexeme, and evicts them once it is discarded.
+    """
+
+    vocab = Vocab("en_core_web_lg", max_strings=20)
+    tokenizer = Tokenizer(vocab)
+
+    lexeme = vocab["Zorblax"]
+    lex_meta = lexeme.lex_meta
+
+    for i in range(100):
+        tokenizer(f"the id_{i} fox")
+
+    assert vocab.memory_usage()["evictions"] > 0
+
+    # The lexeme and its attributes can still be read
+    assert lexeme.text == "Zorblax"
+    assert lexeme.lower_ == "zorblax"
+    assert vocab.store[lex_meta.orth] == "Zorblax"
+    assert lex_meta.lower == vocab.store["zorblax"]
+
+    del lexeme, lex_meta
+
+    vocab.evict_strings(force=True)
+
+    assert "Zorblax" not in vocab.store
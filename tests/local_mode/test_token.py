@@ -57,6 +57,20 @@ def test_oov_token_norm_is_zero():
     assert norm == 0.0
 
 
+def test_token_vector_from_lexeme():
+    """Test that the vector of a token, which is read through the row
+    stored in its lexeme, is the one of its string in the vectors.
+    """
+
+    doc = nlp("banana notvalidtoken")
+
+    for token in doc:
+
+        assert token.has_vector == nlp.vocab.vectors.has_vector(token.text)
+        assert token.has_vector == (not token.is_oov)
+        assert torch.equal(token.vector, nlp.vocab.vectors[token.text])
+
+
 def test_similarity_tokens():
     """Test that the similarity of valid tokens"""
 
@@ -0,0 +1,234 @@
+import os
+import shutil
+import subprocess
+import types
+
+import pytest
+import syft as sy
+import torch
+import syfertext
+from syfertext import affix_matcher
+from syfertext.tokenizer import Tokenizer
+from syfertext.affix_matcher import parse_literal
+from syfertext.affix_matcher import PrefixMatcher
+from syfertext.affix_matcher import SuffixMatcher
+from syfertext.punctuations import prefix_re
+from syfertext.punctuations import suffix_re
+
+hook = sy.TorchHook(torch)
+me = hook.local_worker
+
+nlp = syfertext.load("en_core_web_lg", owner=me)
+
+
+def test_cached_tokenization_is_unchanged():
+    """Test that tokenizing with the chunk cache gives the same tokens
+    as tokenizing without it.
+    """
+
+    text = "(e.g. it's U.S.  the apple-pie!) it's (e.g. the apple-pie!) "
+
+    cached_tokenizer = Tokenizer(nlp.vocab, cache_size=100)
+    uncached_tokenizer = Tokenizer(nlp.vocab, cache_size=0)
+
+    # Tokenize twice so that the second run is served by the cache
+    cached_tokenizer(text)
+    cached_doc = cached_tokenizer(text)
+    uncached_doc = uncached_tokenizer(text)
+
+    cached_tokens = [(meta.orth, meta.space_after) for meta in cached_doc.container]
+    uncached_tokens = [(meta.orth, meta.space_after) for meta in uncached_doc.container]
+
+    assert cached_tokens == uncached_tokens
+
+
+def test_cache_info():
+    """Test that cache hits and misses are counted and that the cache
+    size is bounded.
+    """
+
+    tokenizer = Tokenizer(nlp.vocab, cache_size=2)
+
+    tokenizer("apple apple banana cherry")
+
+    info = tokenizer.cache_info()
+
+    # 'apple' is found in the cache the second time it is seen
+    assert info["hits"] == 1
+    assert info["misses"] == 3
+
+    # 'apple' was evicted to make room for 'cherry'
+    assert info["size"] == 2
+    assert info["maxsize"] == 2
+
+
+def test_cache_is_cleared_when_rules_change():
+    """Test that changing a tokenization rule invalidates the cache."""
+
+    tokenizer = Tokenizer(nlp.vocab)
+
+    doc = tokenizer("(apple)")
+    assert len(doc) == 3
+
+    # Stop splitting prefixes
+    tokenizer.prefix_search = None
+
+    assert tokenizer.cache_info()["size"] == 0
+
+    doc = tokenizer("(apple)")
+
+    # Only the suffix is split now: ['(apple', ')']
+    assert len(doc) == 2
+
+
+def test_affix_matchers_agree_with_regexes():
+    """Test that the prefix and suffix matchers find the same affixes
+    as the regexes they replace.
+    """
+
+    words = [
+        "",
+        "apple",
+        "(apple)",
+        '"Hello!"',
+        "US$10",
+        "$10",
+        "10km",
+        "10kg.",
+        "it's",
+        "end...",
+        "end.....",
+        "e.g.",
+        "ABC.",
+        "...(",
+        "100%",
+        "5°C",
+        "don't!?",
+        "«quote»",
+    ]
+
+    prefix_matcher = PrefixMatcher(syfertext.punctuations.TOKENIZER_PREFIXES)
+    suffix_matcher = SuffixMatcher(syfertext.punctuations.TOKENIZER_SUFFIXES)
+
+    for word in words:
+
+        prefix_match = prefix_re.search(word)
+        suffix_match = suffix_re.search(word)
+
+        assert (prefix_match and prefix_match.span()) == (
+            prefix_matcher.search(word) and prefix_matcher.search(word).span()
+        )
+        assert (suffix_match and suffix_match.span()) == (
+            suffix_matcher.search(word) and suffix_matcher.search(word).span()
+        )
+
+
+def test_parse_literal():
+    """Test that only the affix rules matching a fixed string are literals."""
+
+    assert parse_literal("US") == "US"
+    assert parse_literal(r"\?") == "?"
+    assert parse_literal(r"\.\.\.") == "..."
+    assert parse_literal("#") == "#"
+    assert parse_literal("US$") is None
+    assert parse_literal(r"\d") is None
+    assert parse_literal("(?i)us") is None
+    assert parse_literal("\\") is None
+
+
+def test_affix_matchers_without_pattern_state(monkeypatch):
+    """Test that the affix matchers can be built when parsed regexes keep
+    their flags in `pattern` instead of `state`, as before Python 3.8.
+    """
+
+    parse = affix_matcher.sre_parse.parse
+
+    def parse_without_state(entry):
+
+        parsed = parse(entry)
+
+        if hasattr(parsed, "state"):
+            parsed.pattern = parsed.state
+            del parsed.state
+
+        return parsed
+
+    sre_parse = types.SimpleNamespace(**vars(affix_matcher.sre_parse))
+    sre_parse.parse = parse_without_state
+
+    monkeypatch.setattr(affix_matcher, "sre_parse", sre_parse)
+
+    prefix_matcher = PrefixMatcher(syfertext.punctuations.TOKENIZER_PREFIXES)
+    suffix_matcher = SuffixMatcher(syfertext.punctuations.TOKENIZER_SUFFIXES)
+
+    assert prefix_matcher.search("(apple").span() == prefix_re.search("(apple").span()
+    assert suffix_matcher.search("apple)").span() == suffix_re.search("apple)").span()
+
+
+def test_affix_matchers_on_minimum_python():
+    """Test that the affix matchers are built by the minimum supported
+    Python, given by the `SYFERTEXT_MIN_PYTHON` environment variable
+    (python3.7 by default), if it is installed.
+    """
+
+    python = shutil.which(os.environ.get("SYFERTEXT_MIN_PYTHON", "python3.7"))
+
+    if python is None or subprocess.run([python, "-c", ""]).returncode != 0:
+        pytest.skip("the minimum supported Python is not installed")
+
+    # The module is run on its own, since the dependencies of the package
+    # might not be installed for that Python
+    code = (
+        "import runpy\n"
+        f"module = runpy.run_path({affix_matcher.__file__!r})\n"
+        f"module['PrefixMatcher']({tuple(syfertext.punctuations.TOKENIZER_PREFIXES)!r})\n"
+        f"module['SuffixMatcher']({tuple(syfertext.punctuations.TOKENIZER_SUFFIXES)!r})\n"
+    )
+
+    result = subprocess.run([python, "-c", code], stderr=subprocess.PIPE)
+
+    assert result.returncode == 0, result.stderr.decode()
+
+
+def test_long_chunk_affixes_are_split_in_place():
+    """Test that splitting a chunk made of many affixes in place gives the
+    same tokens as splitting copies of the chunk with the regexes.
+    """
+
+    text = "(" * 200 + "U.S." + ")" * 100 + "!?" * 50 + "..."
+
+    tokenizer = Tokenizer(nlp.vocab, cache_size=0)
+    regex_tokenizer = Tokenizer(
+        nlp.vocab, prefix_search=prefix_re.search, suffix_search=suffix_re.search, cache_size=0
+    )
+
+    doc = tokenizer(text)
+    regex_doc = regex_tokenizer(text)
+
+    assert [meta.orth for meta in doc.container] == [meta.orth for meta in regex_doc.container]
+
+    # Brackets, the 'U.S.' exception, punctuation marks and the ellipsis
+    assert len(doc) == 200 + 1 + 100 + 100 + 1
+
+
+def test_token_offsets_point_into_the_text():
+    """Test that the `idx` of every token is the position of its string in
+    the text, with and without the chunk cache, and that the Doc text is
+    the original text.
+    """
+
+    text = "(e.g. it's\tU.S.\n\nthe apple-pie!) it's (e.g. the apple-pie!)  "
+
+    for cache_size in [0, 100]:
+
+        tokenizer = Tokenizer(nlp.vocab, cache_size=cache_size)
+
+        # Tokenize twice so that the second run is served by the cache, if any
+        for _ in range(2):
+
+            doc = tokenizer(text)
+
+            for token in doc:
+                assert text[token.idx : token.idx + len(token.text)] == token.text
+
+            assert doc.text == text
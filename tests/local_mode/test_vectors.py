@@ -0,0 +1,269 @@
+import numpy as np
+import pytest
+import syft as sy
+import torch
+import syfertext
+from syfertext.key_index import KeyIndex
+from syfertext.utils import hash_string
+from syfertext.vector_index import VectorIndex
+from syfertext.vectors import Vectors
+
+
+hook = sy.TorchHook(torch)
+me = hook.local_worker
+
+nlp = syfertext.load("en_core_web_lg", owner=me)
+
+
+def small_vectors(words):
+    """Returns a Vectors object holding the vectors of `words` in the
+    language model only, so that the tables saved in tests are small.
+    """
+
+    vectors = Vectors("en_core_web_lg")
+    vectors.data = torch.stack([nlp.vocab.vectors[word] for word in words]).numpy()
+    vectors.default_vector = nlp.vocab.vectors.default_vector
+    vectors.key2row = KeyIndex.from_dict(
+        {
+            nlp.vocab.store[word]: row
+            for row, word in enumerate(words)
+            if nlp.vocab.vectors.has_vector(word)
+        }
+    )
+    vectors.loaded = True
+
+    return vectors
+
+
+def test_key_index_matches_dict():
+    """Test that a KeyIndex finds the same rows as the dict it is made from."""
+
+    words = ["I", "have", "an", "apple"]
+
+    key2row = {hash_string(word): row for row, word in enumerate(words)}
+    key2row[2 ** 64 - 1] = len(key2row)
+
+    index = KeyIndex.from_dict(key2row)
+
+    assert len(index) == len(key2row)
+    assert sorted(index) == sorted(key2row)
+
+    for key, row in key2row.items():
+        assert key in index
+        assert index[key] == row
+        assert index.get(key) == row
+
+    unknown = [0, 1, 2 ** 63, 2 ** 64 - 2]
+
+    for key in unknown:
+        assert key not in index
+        assert index.get(key) is None
+
+    with pytest.raises(KeyError):
+        index[0]
+
+    keys = np.array(list(key2row) + unknown, dtype=np.uint64)
+    expected = list(key2row.values()) + [-1] * len(unknown)
+
+    assert index.find_many(keys).tolist() == expected
+
+
+def test_memory_mapped_vectors(tmp_path):
+    """Test that vectors saved with `to_disk()` and memory-mapped back
+    are the same as those of the language model.
+    """
+
+    words = ["banana", "apple", "outofvocabularytoken"]
+
+    path = str(tmp_path / "vectors")
+    small_vectors(words).to_disk(path)
+
+    mmap_vectors = Vectors("en_core_web_lg").from_disk(path)
+
+    for word in words:
+
+        assert mmap_vectors.has_vector(word) == nlp.vocab.vectors.has_vector(word)
+        assert torch.equal(mmap_vectors[word], nlp.vocab.vectors[word])
+
+
+def test_reduced_precision_vectors(tmp_path):
+    """Test that vectors saved as float16 or int8 are close to the float32
+    vectors of the language model, looked up one by one or in a batch.
+    """
+
+    words = ["banana", "apple", "outofvocabularytoken"]
+    keys = [nlp.vocab.store[word] for word in words]
+
+    expected = torch.stack([nlp.vocab.vectors[word] for word in words])
+
+    for dtype in ["float16", "int8"]:
+
+        path = str(tmp_path / dtype)
+        small_vectors(words).to_disk(path, dtype=dtype)
+
+        vectors = Vectors("en_core_web_lg").from_disk(path)
+
+        assert str(vectors.data.dtype) == dtype
+
+        batch = vectors.get_batch(keys)
+
+        assert batch.dtype == torch.float32
+        assert torch.allclose(batch, expected, atol=0.1)
+
+        for i, word in enumerate(words):
+            assert torch.equal(vectors[word], batch[i])
+
+            if vectors.has_vector(word):
+                similarity = torch.cosine_similarity(batch[i], expected[i], dim=0)
+                assert similarity > 0.999
+
+
+def test_prune_vectors():
+    """Test that pruning the vectors maps the keys of the removed rows
+    to the most similar kept vector.
+    """
+
+    words = ["banana", "apple", "orange", "car"]
+
+    vectors = small_vectors(words)
+
+    remapped = vectors.prune(2)
+
+    assert len(vectors.data) == 2
+    assert set(remapped) == {nlp.vocab.store["orange"], nlp.vocab.store["car"]}
+
+    for word in ["orange", "car"]:
+
+        row, similarity = remapped[nlp.vocab.store[word]]
+
+        # The word still has a vector, which is the nearest kept one
+        assert vectors.has_vector(word)
+        assert torch.equal(vectors[word], vectors[words[row]])
+
+        similarities = [
+            torch.cosine_similarity(nlp.vocab.vectors[word], nlp.vocab.vectors[kept], dim=0)
+            for kept in words[:2]
+        ]
+
+        assert row == int(torch.stack(similarities).argmax())
+        assert abs(similarity - similarities[row].item()) < 1e-5
+
+
+def test_prune_vectors_to_no_rows():
+    """Test that pruning the vectors to less than one row is refused."""
+
+    vectors = small_vectors(["banana", "apple"])
+
+    for n_rows in (0, -1):
+        with pytest.raises(AssertionError):
+            vectors.prune(n_rows)
+
+    assert len(vectors.data) == 2
+
+
+def test_prune_vectors_of_vocab_in_use():
+    """Test that the Docs created before the vectors are pruned through
+    `Vectors.prune()` get the vectors of their tokens after pruning.
+    """
+
+    nlp = syfertext.load("en_core_web_lg", owner=me)
+
+    doc = nlp("the of and banana zebra")
+    token = doc[3]
+
+    # Resolve the vector rows of the lexemes before pruning
+    doc.get_vector()
+    assert token.has_vector
+
+    nlp.vocab.vectors.prune(2)
+
+    expected = torch.stack([nlp.vocab.vectors[word.text] for word in doc])
+
+    assert torch.equal(doc.get_token_vectors(), expected)
+    assert torch.allclose(doc.get_vector(), expected.mean(dim=0))
+    assert torch.equal(token.vector, nlp.vocab.vectors["banana"])
+    assert token.rank < 2
+
+
+def test_vectors_replaced_from_disk(tmp_path):
+    """Test that the Docs created before the vectors are replaced with
+    `Vectors.from_disk()` get the vectors of their tokens in the new table.
+    """
+
+    nlp = syfertext.load("en_core_web_lg", owner=me)
+
+    doc = nlp("banana apple car")
+
+    # Resolve the vector rows of the lexemes before replacing the vectors
+    doc.get_token_vectors()
+
+    # The new table has "apple" and "banana" only, in another order
+    path = str(tmp_path / "vectors")
+    small_vectors(["apple", "banana"]).to_disk(path)
+
+    nlp.vocab.vectors.from_disk(path)
+
+    assert [token.rank for token in doc] == [1, 0, None]
+    assert not doc[2].has_vector
+
+    expected = torch.stack([nlp.vocab.vectors[token.text] for token in doc])
+
+    assert torch.equal(doc.get_token_vectors(), expected)
+
+
+def test_most_similar(tmp_path):
+    """Test that `most_similar()` finds the most similar vectors, both
+    exactly and with a VectorIndex saved and memory-mapped back.
+    """
+
+    words = ["banana", "apple", "orange", "car", "truck", "bus"]
+
+    vectors = small_vectors(words)
+
+    queries = torch.stack([nlp.vocab.vectors[word] for word in ["banana", "car"]]).numpy()
+
+    keys, rows, scores = vectors.most_similar(queries, k=2, batch_size=4)
+
+    # Each query is its own nearest vector
+    assert rows[:, 0].tolist() == [0, 3]
+    assert keys[:, 0].tolist() == [nlp.vocab.store["banana"], nlp.vocab.store["car"]]
+    assert abs(scores[0, 0] - 1) < 1e-5
+
+    similarities = [
+        torch.cosine_similarity(nlp.vocab.vectors["banana"], nlp.vocab.vectors[word], dim=0)
+        for word in words
+    ]
+
+    assert rows[0, 1] == int(torch.stack(similarities[1:]).argmax()) + 1
+
+    index = VectorIndex.build(vectors, n_lists=2)
+    index.to_disk(tmp_path)
+    index = VectorIndex.from_disk(tmp_path)
+
+    # Searching all the lists of the index gives the exact results
+    _, index_rows, index_scores = vectors.most_similar(queries, k=2, index=index, n_probe=2)
+
+    assert index_rows.tolist() == rows.tolist()
+    assert abs(index_scores - scores).max() < 1e-5
+
+
+def test_background_vector_loading():
+    """Test that the vectors loaded in the background by `syfertext.load()`
+    are ready after `warmup()`, and that their loading is measured.
+    """
+
+    nlp = syfertext.load("en_core_web_lg", owner=me, background=True)
+
+    assert nlp.vocab.vectors.load_metrics()["background"]
+
+    assert nlp.warmup()
+    assert nlp.vocab.vectors.loaded
+
+    metrics = nlp.vocab.vectors.load_metrics()
+
+    assert metrics["progress"] == 1.0
+    assert metrics["load_seconds"] > 0
+
+    # The vectors are not loaded again
+    assert nlp.warmup(timeout=0)
+    assert nlp("banana")[0].has_vector